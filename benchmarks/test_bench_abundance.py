@@ -0,0 +1,162 @@
+"""Benchmarks for transformations of compositions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+
+from mckit_nuclides.abundance import (
+    convert_to_atomic_fraction,
+    expand_df_natural_presence,
+    expand_natural_presence,
+    expand_natural_presence_arrays,
+    mix,
+    normalize_column,
+)
+from mckit_nuclides.nuclides import NUCLIDES_TABLE_PL
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+N_MATERIALS = 1000
+N_COMPONENTS = 10
+NATURAL_SHARE = 0.5
+MAX_ATOMIC_NUMBER = 83
+N_MIXTURES = 1000
+N_MIXED = 3
+
+
+@pytest.fixture(scope="module")
+def materials() -> pl.DataFrame:
+    """Many materials stacked in one table, a share of components are natural elements."""
+    rng = np.random.default_rng(2024)
+    size = N_MATERIALS * N_COMPONENTS
+    components = (
+        NUCLIDES_TABLE_PL.filter(pl.col("atomic_number").le(MAX_ATOMIC_NUMBER))
+        .unique(["atomic_number", "mass_number"], keep="none")
+        .select("atomic_number", "mass_number")
+        .sample(size, with_replacement=True, seed=2024)
+    )
+    return components.select(
+        material=pl.Series(np.repeat(np.arange(N_MATERIALS), N_COMPONENTS)),
+        atomic_number=pl.col("atomic_number"),
+        mass_number=pl.when(pl.Series(rng.random(size) < NATURAL_SHARE))
+        .then(0)
+        .otherwise(pl.col("mass_number")),
+        fraction=pl.Series(rng.random(size)),
+    )
+
+
+@pytest.mark.benchmark(group="expand_df_natural_presence")
+def test_expand_grouped(benchmark: BenchmarkFixture, materials: pl.DataFrame) -> None:
+    """Expand all the materials in one call."""
+    actual = benchmark(expand_df_natural_presence, materials, by="material")
+    assert actual["material"].n_unique() == N_MATERIALS
+
+
+@pytest.mark.benchmark(group="expand_df_natural_presence")
+def test_expand_in_loop_over_materials(
+    benchmark: BenchmarkFixture, materials: pl.DataFrame
+) -> None:
+    """Expand the materials one by one, as it was done before `by` parameter was introduced."""
+
+    def expand_each() -> pl.DataFrame:
+        return pl.concat(
+            expand_df_natural_presence(composition.drop("material")).with_columns(
+                material=pl.lit(material)
+            )
+            for (material,), composition in materials.partition_by("material", as_dict=True).items()
+        )
+
+    actual = benchmark(expand_each)
+    assert actual["material"].n_unique() == N_MATERIALS
+
+
+@pytest.mark.benchmark(group="expand_natural_presence")
+def test_expand_generator(benchmark: BenchmarkFixture, materials: pl.DataFrame) -> None:
+    """Expand all the components with the generator."""
+    zaf = materials.select("atomic_number", "mass_number", "fraction").rows()
+
+    def expand_all() -> list[tuple[int, int, float]]:
+        return list(expand_natural_presence(zaf))
+
+    assert len(benchmark(expand_all)) > len(zaf)
+
+
+@pytest.mark.benchmark(group="expand_natural_presence")
+def test_expand_arrays(benchmark: BenchmarkFixture, materials: pl.DataFrame) -> None:
+    """Expand all the components presented with arrays."""
+    z, a, f = (materials[c].to_numpy() for c in ("atomic_number", "mass_number", "fraction"))
+    actual_z, _, _ = benchmark(expand_natural_presence_arrays, z, a, f)
+    assert actual_z.size > z.size
+
+
+@pytest.mark.benchmark(group="convert_to_atomic_fraction")
+def test_convert_to_atomic_fraction(benchmark: BenchmarkFixture, materials: pl.DataFrame) -> None:
+    """Convert mass fractions of all the materials in one call."""
+    actual = benchmark(convert_to_atomic_fraction, materials, by="material")
+    assert actual.height == materials.height
+
+
+@pytest.mark.benchmark(group="convert_to_atomic_fraction")
+def test_convert_to_atomic_fraction_streaming(
+    benchmark: BenchmarkFixture, materials: pl.DataFrame
+) -> None:
+    """Convert mass fractions of all the materials with streaming engine."""
+
+    def convert() -> pl.DataFrame:
+        return convert_to_atomic_fraction(materials.lazy(), by="material").collect(
+            engine="streaming"
+        )
+
+    assert benchmark(convert).height == materials.height
+
+
+@pytest.fixture(scope="module")
+def weights() -> pl.DataFrame:
+    """Mixtures of a few random materials."""
+    rng = np.random.default_rng(2024)
+    size = N_MIXTURES * N_MIXED
+    return pl.DataFrame(
+        {
+            "mixture": np.repeat(np.arange(N_MIXTURES), N_MIXED),
+            "material": rng.integers(0, N_MATERIALS, size),
+            "weight": rng.random(size),
+        }
+    ).unique(["mixture", "material"], maintain_order=True)
+
+
+@pytest.mark.benchmark(group="mix")
+def test_mix(benchmark: BenchmarkFixture, materials: pl.DataFrame, weights: pl.DataFrame) -> None:
+    """Mix all the mixtures in one call."""
+    actual = benchmark(mix, materials, weights, "atomic", by="mixture")
+    assert actual["mixture"].n_unique() == N_MIXTURES
+
+
+@pytest.mark.benchmark(group="mix")
+def test_mix_in_loop_over_mixtures(
+    benchmark: BenchmarkFixture, materials: pl.DataFrame, weights: pl.DataFrame
+) -> None:
+    """Mix the mixtures one by one concatenating expanded components and normalizing."""
+    components = materials.partition_by("material", as_dict=True, include_key=False)
+
+    def mix_each() -> pl.DataFrame:
+        return pl.concat(
+            normalize_column(
+                expand_df_natural_presence(
+                    pl.concat(
+                        normalize_column(components[material,]).with_columns(
+                            pl.col("fraction") * weight
+                        )
+                        for material, weight in mixture.select("material", "weight").iter_rows()
+                    )
+                )
+            ).with_columns(mixture=pl.lit(key))
+            for (key,), mixture in weights.partition_by("mixture", as_dict=True).items()
+        )
+
+    actual = benchmark(mix_each)
+    assert actual["mixture"].n_unique() == N_MIXTURES
@@ -0,0 +1,49 @@
+"""Benchmarks for repeated transforms of the same compositions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+
+from mckit_nuclides.abundance import convert_to_atomic_fraction, expand_df_natural_presence
+from mckit_nuclides.caching import frame_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+N_CELLS = 1000
+"""Number of cells filled with a few materials."""
+
+MATERIALS = [
+    pl.DataFrame(
+        {"atomic_number": [26, 24, 28, 25], "mass_number": 0, "fraction": [0.7, 0.18, 0.1, 0.02]}
+    ),
+    pl.DataFrame({"atomic_number": [1, 8], "mass_number": 0, "fraction": [0.111, 0.889]}),
+    pl.DataFrame(
+        {"atomic_number": [1, 8, 14, 20], "mass_number": 0, "fraction": [0.01, 0.53, 0.34, 0.12]}
+    ),
+]
+
+
+def _transform(composition: pl.DataFrame) -> pl.DataFrame:
+    return expand_df_natural_presence(convert_to_atomic_fraction(composition))
+
+
+def _cells() -> list[pl.DataFrame]:
+    """Materials of cells created separately, as they are read from a model."""
+    return [MATERIALS[i % len(MATERIALS)].clone() for i in range(N_CELLS)]
+
+
+@pytest.mark.benchmark(group="repeated-transform")
+@pytest.mark.parametrize("cached", [False, True])
+def test_transform_cells(benchmark: BenchmarkFixture, *, cached: bool) -> None:
+    """Transform the materials of all the cells."""
+    cells = _cells()
+    transform: Callable[[pl.DataFrame], pl.DataFrame] = (
+        frame_cache()(_transform) if cached else _transform
+    )
+    assert len(benchmark(lambda: [transform(c) for c in cells])) == N_CELLS
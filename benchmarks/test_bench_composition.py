@@ -0,0 +1,50 @@
+"""Benchmarks for transformations of small compositions: DataFrames vs arrays."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from mckit_nuclides.abundance import expand_df_natural_presence
+from mckit_nuclides.composition import Composition
+from mckit_nuclides.conversion import convert_to_mass_fraction
+from mckit_nuclides.elements import from_molecular_formula
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+FORMULAS = ["H2O", "SiO2", "Fe2O3", "CaCO3", "Na2B4O7·10H2O", "Ca10(PO4)6(OH)2", "CuSO4·5H2O"]
+"""Typical materials of a few elements, 10-40 nuclides after expansion."""
+
+
+@pytest.mark.benchmark(group="small-composition")
+def test_expand_and_convert_frames(benchmark: BenchmarkFixture) -> None:
+    """Expand natural presence and convert to mass fractions with a DataFrame per material."""
+
+    def run() -> list[pl.DataFrame]:
+        return [
+            convert_to_mass_fraction(expand_df_natural_presence(from_molecular_formula(f)))
+            for f in FORMULAS
+        ]
+
+    assert len(benchmark(run)) == len(FORMULAS)
+
+
+@pytest.mark.benchmark(group="small-composition")
+def test_expand_and_convert_compositions(benchmark: BenchmarkFixture) -> None:
+    """Expand natural presence and convert to mass fractions with Composition."""
+
+    def run() -> list[Composition]:
+        return [Composition.from_formula(f).expand_natural().to_mass() for f in FORMULAS]
+
+    assert len(benchmark(run)) == len(FORMULAS)
+
+
+@pytest.mark.benchmark(group="small-composition-mix")
+def test_mix_compositions(benchmark: BenchmarkFixture) -> None:
+    """Mix small compositions."""
+    components = [(Composition.from_formula(f).expand_natural(), 1.0) for f in FORMULAS]
+    assert len(benchmark(Composition.mix, components)) > 0
@@ -0,0 +1,64 @@
+"""Benchmarks for conversions of compositions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+
+from mckit_nuclides.abundance import convert_to_atomic_fraction
+from mckit_nuclides.conversion import (
+    convert_to_mass_fraction,
+    convert_to_number_density,
+    with_molar_mass,
+)
+from mckit_nuclides.elements import from_molecular_formulas
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+N_MATERIALS = 10_000
+FORMULAS = ["H2O", "C2H5OH", "Ca(OH)2", "CuSO4·5H2O", "UO2.02", "D2O", "^10B4C", "Fe2O3"]
+
+
+@pytest.fixture(scope="module")
+def materials() -> pl.DataFrame:
+    """Many materials with atomic fractions and densities."""
+    rng = np.random.default_rng(2024)
+    formulas = rng.choice(FORMULAS, N_MATERIALS).tolist()
+    compositions = from_molecular_formulas(formulas, ids=range(N_MATERIALS), id_column="material")
+    densities = pl.DataFrame(
+        {"material": range(N_MATERIALS), "density": rng.uniform(1, 10, N_MATERIALS)}
+    )
+    return compositions.join(densities, on="material")
+
+
+@pytest.mark.benchmark(group="conversion")
+def test_round_trip_joining_once(benchmark: BenchmarkFixture, materials: pl.DataFrame) -> None:
+    """Convert to mass fractions, number densities and back with molar masses joined once."""
+
+    def convert() -> pl.DataFrame:
+        composition = with_molar_mass(materials)
+        mass_fractions = convert_to_mass_fraction(composition, by="material")
+        number_densities = convert_to_number_density(
+            mass_fractions, "density", mass_fraction=True, by="material"
+        )
+        return convert_to_atomic_fraction(number_densities, by="material")
+
+    assert benchmark(convert).height == materials.height
+
+
+@pytest.mark.benchmark(group="conversion")
+def test_round_trip(benchmark: BenchmarkFixture, materials: pl.DataFrame) -> None:
+    """Convert to mass fractions, number densities and back joining molar masses each time."""
+
+    def convert() -> pl.DataFrame:
+        mass_fractions = convert_to_mass_fraction(materials, by="material")
+        number_densities = convert_to_number_density(
+            mass_fractions, "density", mass_fraction=True, by="material"
+        )
+        return convert_to_atomic_fraction(number_densities, by="material")
+
+    assert benchmark(convert).height == materials.height
@@ -0,0 +1,80 @@
+"""Benchmarks for activities of large inventories."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+
+from mckit_nuclides.decay import LN2, compute_activity, decay, get_decay_constants
+from mckit_nuclides.nuclides import NUCLIDES_TABLE_PL, is_lowest_state
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+N_ROWS = 1_000_000
+"""Number of (cell, nuclide) rows in an inventory."""
+
+
+@pytest.fixture(scope="module")
+def inventory() -> pl.DataFrame:
+    """Random numbers of atoms of random nuclides in cells."""
+    rng = np.random.default_rng(2024)
+    return (
+        NUCLIDES_TABLE_PL.select("atomic_number", "mass_number")
+        .sample(N_ROWS, with_replacement=True, seed=2024)
+        .with_columns(
+            cell=pl.Series(rng.integers(0, 10_000, N_ROWS)),
+            atoms=pl.Series(rng.uniform(1e10, 1e20, N_ROWS)),
+        )
+    )
+
+
+@pytest.mark.benchmark(group="activity")
+def test_activity_by_join(benchmark: BenchmarkFixture, inventory: pl.DataFrame) -> None:
+    """Join half-lives of the lowest states, as compute_activity does, and compute activities."""
+    half_lives = NUCLIDES_TABLE_PL.filter(is_lowest_state()).select(
+        "atomic_number", "mass_number", "half_life"
+    )
+
+    def compute() -> pl.DataFrame:
+        return inventory.join(
+            half_lives, on=["atomic_number", "mass_number"], how="left", maintain_order="left"
+        ).with_columns(
+            activity=pl.when(pl.col("half_life") == 0.0)
+            .then(0.0)
+            .otherwise(LN2 / pl.col("half_life") * pl.col("atoms"))
+        )
+
+    assert benchmark(compute).height == N_ROWS
+
+
+@pytest.mark.benchmark(group="activity")
+def test_compute_activity(benchmark: BenchmarkFixture, inventory: pl.DataFrame) -> None:
+    """Compute activities with expressions."""
+    assert benchmark(compute_activity, inventory).height == N_ROWS
+
+
+@pytest.mark.benchmark(group="activity")
+def test_activity_with_numpy(benchmark: BenchmarkFixture, inventory: pl.DataFrame) -> None:
+    """Compute activities with NumPy arrays."""
+    z, a = inventory["atomic_number"].to_numpy(), inventory["mass_number"].to_numpy()
+    atoms = inventory["atoms"].to_numpy()
+
+    def compute() -> np.ndarray:
+        return get_decay_constants(z, a) * atoms
+
+    assert benchmark(compute).size == N_ROWS
+
+
+@pytest.mark.benchmark(group="decay")
+def test_decay_time_steps(benchmark: BenchmarkFixture, inventory: pl.DataFrame) -> None:
+    """Decay inventory for several time steps in one lazy query."""
+    steps = [1.0, 3600.0, 86400.0, 3.15576e7]
+
+    def compute() -> pl.DataFrame:
+        return decay(inventory.lazy(), steps).collect()
+
+    assert benchmark(compute).height == N_ROWS * len(steps)
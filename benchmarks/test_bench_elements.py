@@ -0,0 +1,95 @@
+"""Benchmarks for element properties and chemical formulas parsing."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from mckit_nuclides._formulas import parse_formula
+from mckit_nuclides.elements import (
+    from_molecular_formula,
+    from_molecular_formulas,
+    get_property,
+    get_property_many,
+)
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+N_KEYS = 10_000
+FORMULAS = [
+    "H2O",
+    "C2H5OH",
+    "Ca(OH)2",
+    "K4[Fe(CN)6]",
+    "CuSO4·5H2O",
+    "UO2.02",
+    "D2O",
+    "^6LiF",
+    "^10B4C",
+    "Ca10(PO4)6(OH)2",
+]
+N_FORMULAS = 10_000
+
+
+@pytest.fixture(scope="module")
+def atomic_numbers() -> npt.NDArray[np.int64]:
+    """Random atomic numbers of all the elements."""
+    return np.random.default_rng(2024).integers(1, 119, N_KEYS)
+
+
+@pytest.mark.benchmark(group="get_element_property")
+def test_get_property_in_loop(
+    benchmark: BenchmarkFixture, atomic_numbers: npt.NDArray[np.int64]
+) -> None:
+    """Get the property for elements one by one."""
+    keys = atomic_numbers.tolist()
+
+    def get_each() -> list[object]:
+        return [get_property(_z, "molar_mass") for _z in keys]
+
+    assert len(benchmark(get_each)) == N_KEYS
+
+
+@pytest.mark.benchmark(group="get_element_property")
+def test_get_property_many(
+    benchmark: BenchmarkFixture, atomic_numbers: npt.NDArray[np.int64]
+) -> None:
+    """Get the property for all the elements in one call."""
+    assert benchmark(get_property_many, atomic_numbers, "molar_mass").size == N_KEYS
+
+
+@pytest.mark.benchmark(group="parse_formula")
+def test_parse_formulas_uncached(benchmark: BenchmarkFixture) -> None:
+    """Parsing throughput without the cache: all the formulas are distinct."""
+    formulas = [
+        f"{formula}·{i}H2O"
+        for i in range(1, N_FORMULAS // len(FORMULAS) + 1)
+        for formula in FORMULAS
+    ]
+
+    def parse_all() -> None:
+        parse_formula.cache_clear()
+        for formula in formulas:
+            parse_formula(formula)
+
+    benchmark(parse_all)
+
+
+@pytest.mark.benchmark(group="parse_formula")
+def test_from_molecular_formula(benchmark: BenchmarkFixture) -> None:
+    """Convert a cached formula to a composition."""
+    actual = benchmark(from_molecular_formula, "Ca10(PO4)6(OH)2", mass_fraction=True)
+    assert actual["atomic_number"].to_list() == [1, 8, 15, 20]
+
+
+@pytest.mark.benchmark(group="parse_formula")
+def test_from_molecular_formulas(benchmark: BenchmarkFixture) -> None:
+    """Convert many formulas, repeated formulas are taken from the cache."""
+    formulas = FORMULAS * (N_FORMULAS // len(FORMULAS))
+    actual = benchmark(from_molecular_formulas, formulas, mass_fraction=True)
+    assert actual["formula"].n_unique() == len(FORMULAS)
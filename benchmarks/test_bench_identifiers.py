@@ -0,0 +1,65 @@
+"""Benchmarks for nuclide identifiers parsing."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+
+from mckit_nuclides import expressions  # noqa: F401 - registers the namespaces
+from mckit_nuclides.elements import z
+from mckit_nuclides.identifiers import format_zaids, parse_nuclide, parse_nuclides
+from mckit_nuclides.nuclides import NUCLIDES_TABLE_PL
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+N_IDENTIFIERS = 100_000
+
+
+@pytest.fixture(scope="module")
+def zaids() -> pl.Series:
+    """Random ZAIDs of known nuclides."""
+    return format_zaids(
+        NUCLIDES_TABLE_PL["atomic_number"], NUCLIDES_TABLE_PL["mass_number"], library="80c"
+    ).sample(N_IDENTIFIERS, with_replacement=True, seed=2024)
+
+
+@pytest.fixture(scope="module")
+def names() -> list[str]:
+    """Random nuclide names like U-235."""
+    return (
+        NUCLIDES_TABLE_PL.select(
+            name=pl.col("atomic_number").elements.symbol() + "-" + pl.col("mass_number").cast(str)
+        )["name"]
+        .sample(N_IDENTIFIERS, with_replacement=True, seed=2024)
+        .to_list()
+    )
+
+
+@pytest.mark.benchmark(group="parse_nuclides")
+def test_parse_names_by_hand(benchmark: BenchmarkFixture, names: list[str]) -> None:
+    """Split names and get atomic numbers one by one."""
+
+    def parse_each() -> list[tuple[int, int]]:
+        result = []
+        for name in names:
+            symbol, mass_number = name.split("-")
+            result.append((z(symbol), int(mass_number)))
+        return result
+
+    assert len(benchmark(parse_each)) == N_IDENTIFIERS
+
+
+@pytest.mark.benchmark(group="parse_nuclides")
+def test_parse_nuclide_in_loop(benchmark: BenchmarkFixture, zaids: pl.Series) -> None:
+    """Parse ZAIDs with cached scalar function."""
+    values = zaids.to_list()
+    assert len(benchmark(lambda: [parse_nuclide(v) for v in values])) == N_IDENTIFIERS
+
+
+@pytest.mark.benchmark(group="parse_nuclides")
+def test_parse_nuclides(benchmark: BenchmarkFixture, zaids: pl.Series) -> None:
+    """Parse ZAIDs at once."""
+    assert benchmark(parse_nuclides, zaids).height == N_IDENTIFIERS
@@ -0,0 +1,29 @@
+"""Benchmarks for overhead of instrumentation on fast lookups."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import contextlib
+
+import pytest
+
+from mckit_nuclides import instrumentation
+from mckit_nuclides.elements import get_property
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+ATOMIC_NUMBERS = range(1, 101)
+
+
+@pytest.mark.benchmark(group="instrumentation")
+@pytest.mark.parametrize("enabled", [False, True])
+def test_get_property(benchmark: BenchmarkFixture, *, enabled: bool) -> None:
+    """Look up element property with instrumentation enabled or not."""
+
+    def run() -> list[object]:
+        return [get_property(z, "molar_mass") for z in ATOMIC_NUMBERS]
+
+    with instrumentation.instrument() if enabled else contextlib.nullcontext():
+        assert len(benchmark(run)) == len(ATOMIC_NUMBERS)
@@ -0,0 +1,73 @@
+"""Benchmarks for nuclide properties."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from mckit_nuclides.nuclides import (
+    NUCLIDES_TABLE_PL,
+    get_nuclide_mass,
+    get_property,
+    get_property_many,
+)
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+N_KEYS = 10_000
+
+
+@pytest.fixture(scope="module")
+def nuclides() -> pl.DataFrame:
+    """Random sample of nuclides."""
+    return NUCLIDES_TABLE_PL.select("atomic_number", "mass_number", "state").sample(
+        N_KEYS, with_replacement=True, seed=2024
+    )
+
+
+@pytest.mark.benchmark(group="get_nuclide_property")
+def test_get_property_in_loop(benchmark: BenchmarkFixture, nuclides: pl.DataFrame) -> None:
+    """Get the property for nuclides one by one."""
+    keys = nuclides.rows()
+
+    def get_each() -> list[object]:
+        return [get_property(_z, a, "half_life", state=state) for _z, a, state in keys]
+
+    assert len(benchmark(get_each)) == N_KEYS
+
+
+@pytest.mark.benchmark(group="get_nuclide_property")
+def test_get_nuclide_mass_in_loop(benchmark: BenchmarkFixture, nuclides: pl.DataFrame) -> None:
+    """Get nuclide masses one by one."""
+    keys = nuclides.select("atomic_number", "mass_number").rows()
+
+    def get_each() -> list[float]:
+        return [get_nuclide_mass(_z, a) for _z, a in keys]
+
+    assert len(benchmark(get_each)) == N_KEYS
+
+
+@pytest.mark.benchmark(group="get_nuclide_property")
+def test_get_property_many(benchmark: BenchmarkFixture, nuclides: pl.DataFrame) -> None:
+    """Get the property for all the nuclides in one call."""
+    actual = benchmark(
+        get_property_many, nuclides["atomic_number"], nuclides["mass_number"], "molar_mass"
+    )
+    assert actual.size == N_KEYS
+
+
+@pytest.mark.benchmark(group="get_nuclide_property")
+def test_get_property_many_with_states(benchmark: BenchmarkFixture, nuclides: pl.DataFrame) -> None:
+    """Get the property for all the nuclides in specified states in one call."""
+    actual = benchmark(
+        get_property_many,
+        nuclides["atomic_number"],
+        nuclides["mass_number"],
+        "molar_mass",
+        states=nuclides["state"],
+    )
+    assert actual.size == N_KEYS
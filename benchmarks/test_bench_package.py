@@ -0,0 +1,86 @@
+"""Benchmarks for the package import and loading of the tables."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import importlib
+import sys
+import warnings
+
+import pytest
+
+from mckit_nuclides import abundance
+from mckit_nuclides._loading import (
+    CACHE_DIR_VARIABLE,
+    DATA_FORMAT_VARIABLE,
+    cache_directory,
+    read_table,
+)
+from mckit_nuclides.nuclides import NUCLIDES_IPC, NUCLIDES_PARQUET
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+    from types import ModuleType
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+PACKAGE = "mckit_nuclides"
+
+
+def _unload_package() -> None:
+    for name in [n for n in sys.modules if n == PACKAGE or n.startswith(f"{PACKAGE}.")]:
+        del sys.modules[name]
+
+
+def _import_package() -> ModuleType:
+    with warnings.catch_warnings():
+        # Polars warns on registering expression namespaces again
+        warnings.simplefilter("ignore")
+        return importlib.import_module(PACKAGE)
+
+
+@pytest.fixture
+def restore_modules() -> Generator[None]:
+    """Return the originally imported package modules to keep other benchmarks consistent."""
+    modules = {n: m for n, m in sys.modules.items() if n.startswith(PACKAGE)}
+    yield
+    _unload_package()
+    sys.modules.update(modules)
+
+
+@pytest.mark.benchmark(group="import")
+@pytest.mark.usefixtures("restore_modules")
+def test_import(benchmark: BenchmarkFixture) -> None:
+    """Import the package, NumPy and Polars are already imported."""
+    package = benchmark.pedantic(_import_package, setup=_unload_package, rounds=20)
+    assert package.__name__ == PACKAGE
+
+
+@pytest.mark.benchmark(group="read_table")
+@pytest.mark.parametrize("data_format", ["parquet", "ipc"])
+def test_read_nuclides_table(
+    benchmark: BenchmarkFixture, monkeypatch: pytest.MonkeyPatch, data_format: str
+) -> None:
+    """Read the largest table in the shipped formats."""
+    monkeypatch.setenv(DATA_FORMAT_VARIABLE, data_format)
+    assert benchmark(read_table, "nuclides", NUCLIDES_PARQUET, NUCLIDES_IPC).height > 0
+
+
+@pytest.mark.benchmark(group="derived")
+@pytest.mark.parametrize("cached", [False, True])
+def test_molar_mass_table(
+    benchmark: BenchmarkFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, *, cached: bool
+) -> None:
+    """Compute the molar masses table or load it from the persistent cache."""
+    if cached:
+        monkeypatch.setenv(CACHE_DIR_VARIABLE, str(tmp_path))
+    else:
+        monkeypatch.delenv(CACHE_DIR_VARIABLE, raising=False)
+    cache_directory.cache_clear()
+    compute = abundance._molar_mass_table.__wrapped__  # noqa: SLF001
+    try:
+        assert benchmark(compute).height > 0
+    finally:
+        cache_directory.cache_clear()
@@ -0,0 +1,42 @@
+"""Benchmarks for bulk resolution of material libraries: serial vs pools of workers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from mckit_nuclides.abundance import expand_df_natural_presence
+from mckit_nuclides.elements import from_molecular_formula
+from mckit_nuclides.resolver import resolve_materials
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+FORMULAS = ["H2O", "SiO2", "Fe2O3", "CaCO3", "Na2B4O7·10H2O", "Ca10(PO4)6(OH)2", "CuSO4·5H2O"]
+
+LIBRARY = [*FORMULAS * 100, *[{"Fe": 0.7, "Cr": 0.18, "Ni": 0.12}] * 100]
+"""Material library of 800 specifications."""
+
+
+@pytest.mark.benchmark(group="material-library")
+def test_resolve_frames_serially(benchmark: BenchmarkFixture) -> None:
+    """Resolve formulas to DataFrames one by one, the mappings are not supported here."""
+
+    def run() -> list[pl.DataFrame]:
+        return [expand_df_natural_presence(from_molecular_formula(f)) for f in FORMULAS * 100]
+
+    assert len(benchmark(run)) == len(FORMULAS) * 100
+
+
+@pytest.mark.benchmark(group="material-library")
+@pytest.mark.parametrize("workers, processes", [(1, False), (4, False), (4, True)])
+def test_resolve_materials(benchmark: BenchmarkFixture, workers: int, *, processes: bool) -> None:
+    """Resolve the library with a pool of workers."""
+
+    def run() -> int:
+        return sum(1 for _ in resolve_materials(LIBRARY, workers=workers, processes=processes))
+
+    assert benchmark.pedantic(run, rounds=3) == len(LIBRARY)
@@ -0,0 +1,50 @@
+"""Benchmarks for worker startup with tables loaded from files or attached from shared memory."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from mckit_nuclides import abundance, elements, nuclides
+from mckit_nuclides.shared import attach_tables, publish_tables
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from mckit_nuclides.shared import SharedTableSpec
+
+
+def _first_lookup() -> float:
+    """Access every table once, as a worker resolving its first material does."""
+    return (
+        elements.atomic_mass("Fe")
+        + nuclides.get_property("Fe", 56, "molar_mass")
+        + abundance.MOLAR_MASS_TABLE.height
+    )
+
+
+def _start_worker(specs: Mapping[str, SharedTableSpec] | None) -> float:
+    """Start a spawned worker, attach the tables, if specified, and run the first lookup."""
+    context = multiprocessing.get_context("spawn")
+    initializer, initargs = (None, ()) if specs is None else (attach_tables, (specs,))
+    with ProcessPoolExecutor(
+        1, mp_context=context, initializer=initializer, initargs=initargs
+    ) as pool:
+        return pool.submit(_first_lookup).result()
+
+
+@pytest.mark.benchmark(group="worker-startup")
+@pytest.mark.parametrize("attach", [False, True])
+def test_worker_startup(benchmark: BenchmarkFixture, *, attach: bool) -> None:
+    """Start a worker and make the first lookup: load the tables or attach the published ones."""
+    expected = _first_lookup()
+    with publish_tables() as published:
+        specs = published.specs if attach else None
+        assert benchmark.pedantic(_start_worker, args=(specs,), rounds=5) == expected
@@ -5,76 +5,211 @@ Provides information on chemical elements and nuclides as Polars tables.
 
 from __future__ import annotations
 
-from importlib import metadata as _meta
-from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any, Final
+
+from functools import cache
+from importlib import import_module
 
 from .abundance import (
-    MOLAR_MASS_TABLE,
     convert_to_atomic_fraction,
     expand_df_natural_presence,
     expand_natural_presence,
+    expand_natural_presence_arrays,
+    mix,
     normalize_column,
 )
 from .constants import (
     ATOMIC_MASS_CONSTANT,
     ATOMIC_MASS_CONSTANT_IN_MEV,
     AVOGADRO,
+    BARN,
     NEUTRON_HALF_LIFE,
     NEUTRON_MASS,
     NEUTRON_MASS_IN_MEV,
 )
+from .conversion import (
+    convert_from_number_density,
+    convert_to_mass_fraction,
+    convert_to_number_density,
+    mix_by_volume,
+    with_molar_mass,
+)
 from .elements import (
+    ELEMENTS_IPC,
     ELEMENTS_PARQUET,
-    ELEMENTS_TABLE_PL,
-    SYMBOL_TO_Z,
-    Z_TO_SYMBOL,
     atomic_mass,
     atomic_number,
     from_molecular_formula,
+    from_molecular_formulas,
+    scan_elements,
     symbol,
     z,
 )
 from .elements import get_property as get_element_property
-from .nuclides import NUCLIDES_PARQUET, NUCLIDES_TABLE_PL, get_nuclide_mass
+from .elements import get_property_many as get_element_property_many
+from .expressions import ElementsNamespace, NuclidesNamespace
+from .nuclides import NUCLIDES_IPC, NUCLIDES_PARQUET, get_nuclide_mass, scan_nuclides
 from .nuclides import get_property as get_nuclide_property
+from .nuclides import get_property_many as get_nuclide_property_many
+
+if TYPE_CHECKING:
+    from importlib.metadata import Distribution, PackageMetadata
+
+    import polars as pl
+
+    from .composition import Composition
+    from .decay import (
+        compute_activity,
+        decay,
+        decay_constant,
+        get_decay_constants,
+        with_decay_constant,
+    )
+    from .identifiers import (
+        NuclideId,
+        format_name,
+        format_names,
+        format_zaid,
+        format_zaids,
+        parse_nuclide,
+        parse_nuclides,
+        to_za,
+    )
+    from .resolver import resolve_material, resolve_materials
+
+    # The tables and package metadata are loaded on first access, see __getattr__ below
+    ELEMENTS_TABLE_PL: pl.DataFrame
+    MOLAR_MASS_TABLE: pl.DataFrame
+    NUCLIDES_TABLE_PL: pl.DataFrame
+    SYMBOL_TO_Z: dict[str, int]
+    Z_TO_SYMBOL: dict[int, str]
+    __version__: str
+    __distribution__: Distribution
+    __meta_data__: PackageMetadata
+    __author__: str
+    __author_email__: str
+    __license__: str
+    __summary__: str
+    __copyright__: str
+
+_LAZY_ATTRIBUTES: Final = {
+    "ELEMENTS_TABLE_PL": ".elements",
+    "MOLAR_MASS_TABLE": ".abundance",
+    "NUCLIDES_TABLE_PL": ".nuclides",
+    "SYMBOL_TO_Z": ".elements",
+    "Z_TO_SYMBOL": ".elements",
+    # not used on the package import, load on demand to keep import fast
+    "Composition": ".composition",
+    "compute_activity": ".decay",
+    "decay": ".decay",
+    "decay_constant": ".decay",
+    "get_decay_constants": ".decay",
+    "with_decay_constant": ".decay",
+    "NuclideId": ".identifiers",
+    "format_name": ".identifiers",
+    "format_names": ".identifiers",
+    "format_zaid": ".identifiers",
+    "format_zaids": ".identifiers",
+    "parse_nuclide": ".identifiers",
+    "parse_nuclides": ".identifiers",
+    "to_za": ".identifiers",
+    "resolve_material": ".resolver",
+    "resolve_materials": ".resolver",
+}
+
+
+@cache
+def _metadata() -> dict[str, Any]:
+    from importlib import metadata  # noqa: PLC0415 - it takes time, import only on demand
+
+    try:
+        _version = metadata.version(__name__)
+    except metadata.PackageNotFoundError:  # pragma: no cover
+        _version = "unknown"
+    distribution = metadata.distribution(__name__)
+    meta_data = distribution.metadata
+    return {
+        "__version__": _version,
+        "__distribution__": distribution,
+        "__meta_data__": meta_data,
+        "__author__": meta_data["Author"],
+        "__author_email__": meta_data["Author-email"],
+        "__license__": meta_data["License"],
+        "__summary__": meta_data["Summary"],
+        "__copyright__": f"Copyright 2021 {meta_data['Author']}",
+    }
+
 
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "unknown"
+def __getattr__(name: str) -> object:
+    """Load the tables and package metadata on first access to the package attributes."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is not None:
+        return getattr(import_module(module, __name__), name)
+    if name.startswith("__"):
+        meta = _metadata()
+        if name in meta:
+            return meta[name]
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
-__distribution__ = _meta.distribution(__name__)
-__meta_data__ = __distribution__.metadata
-__author__ = __meta_data__["Author"]
-__author_email__ = __meta_data__["Author-email"]
-__license__ = __meta_data__["License"]
-__summary__ = __meta_data__["Summary"]
-__copyright__ = f"Copyright 2021 {__author__}"
 
 __all__ = [
     "ATOMIC_MASS_CONSTANT",
     "ATOMIC_MASS_CONSTANT_IN_MEV",
     "AVOGADRO",
+    "BARN",
+    "ELEMENTS_IPC",
     "ELEMENTS_PARQUET",
     "ELEMENTS_TABLE_PL",
     "MOLAR_MASS_TABLE",
     "NEUTRON_HALF_LIFE",
     "NEUTRON_MASS",
     "NEUTRON_MASS_IN_MEV",
+    "NUCLIDES_IPC",
     "NUCLIDES_PARQUET",
     "NUCLIDES_TABLE_PL",
     "SYMBOL_TO_Z",
     "Z_TO_SYMBOL",
+    "Composition",
+    "ElementsNamespace",
+    "NuclideId",
+    "NuclidesNamespace",
     "atomic_mass",
     "atomic_number",
+    "compute_activity",
+    "convert_from_number_density",
     "convert_to_atomic_fraction",
+    "convert_to_mass_fraction",
+    "convert_to_number_density",
+    "decay",
+    "decay_constant",
     "expand_df_natural_presence",
     "expand_natural_presence",
+    "expand_natural_presence_arrays",
+    "format_name",
+    "format_names",
+    "format_zaid",
+    "format_zaids",
     "from_molecular_formula",
+    "from_molecular_formulas",
+    "get_decay_constants",
     "get_element_property",
+    "get_element_property_many",
     "get_nuclide_mass",
     "get_nuclide_property",
+    "get_nuclide_property_many",
+    "mix",
+    "mix_by_volume",
     "normalize_column",
+    "parse_nuclide",
+    "parse_nuclides",
+    "resolve_material",
+    "resolve_materials",
+    "scan_elements",
+    "scan_nuclides",
     "symbol",
+    "to_za",
+    "with_decay_constant",
+    "with_molar_mass",
     "z",
 ]
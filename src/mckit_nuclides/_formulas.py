@@ -0,0 +1,193 @@
+"""Parser of chemical formulas shared by :mod:`~mckit_nuclides.elements` and compositions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+import re
+
+from functools import cache, lru_cache
+
+import numpy as np
+
+from mckit_nuclides._hooks import instrumented_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+
+_FORMULA_CACHE_SIZE: Final = 16384
+"""Number of recently parsed chemical formulas to keep."""
+
+_COUNT: Final = r"\d+(?:\.\d+)?"
+_MASS_NUMBER: Final = r"[1-9]\d{0,2}"
+
+CHEMICAL_FORMULA_TOKEN: Final = re.compile(
+    rf"(?P<element>(?:\^(?P<mass_number>{_MASS_NUMBER}))?"
+    rf"(?P<symbol>[A-Z][a-z]?)(?P<atoms>{_COUNT})?)"
+    r"|(?P<open>[(\[])"
+    rf"|(?P<close>(?P<bracket>[)\]])(?P<multiplier>{_COUNT})?)"
+    rf"|(?P<hydrate>[·*]\s*(?P<coefficient>{_COUNT})?)"
+    rf"|(?P<count>{_COUNT})"
+    r"|(?P<space>\s+)"
+    r"|(?P<unexpected>.)"
+)
+"""Regex pattern to split a chemical formula to tokens.
+
+    The token kind is the name of the last matched group:
+
+    - element - capitalized chemical symbol with optional number of atoms: H2, Fe, UO2.02;
+      D and T stand for deuterium and tritium, other isotopes are prefixed with mass number: ^6Li
+    - open, close - parentheses or square brackets for groups with optional multiplier: Ca(OH)2
+    - hydrate - separator of adduct parts with optional multiplier: CuSO4·5H2O or CuSO4*5H2O
+    - count - multiplier for the first part of a formula: 2H2O·CO2
+
+    Examples:
+        >>> [m.lastgroup for m in CHEMICAL_FORMULA_TOKEN.finditer("Ca(OH)2")]
+        ['element', 'open', 'element', 'element', 'close']
+"""
+
+
+@instrumented_cache
+@lru_cache(maxsize=_FORMULA_CACHE_SIZE)
+def parse_formula(
+    formula: str,
+) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint16], npt.NDArray[np.float64]]:
+    """Parse chemical formula.
+
+    The formula is tokenized with :data:`CHEMICAL_FORMULA_TOKEN` in one pass,
+    the nested groups are processed with a stack.
+
+    Args:
+        formula: ... H20, C2H5OH, Ca(OH)2, CuSO4·5H2O, UO2.02, D2O, ^6LiF etc.
+
+    Raises
+    ------
+        KeyError: on unknown chemical symbol or isotope.
+        ValueError: if the formula is malformed.
+
+    Returns
+    -------
+        atomic numbers and mass numbers (0 for natural elements) in ascending order
+        and corresponding numbers of atoms per molecule,
+        the arrays are read only, because they are cached
+    """
+    # elements module depends on this one
+    from mckit_nuclides import elements  # noqa: PLC0415
+
+    symbols = _formula_symbols()
+    # (Z, A) and atoms for the open groups, the outermost one is for the whole formula
+    groups: list[list[tuple[tuple[int, int], float]]] = [[]]
+    closing: list[str] = []
+    coefficient = 1.0  # multiplier for the current adduct part
+    for m in CHEMICAL_FORMULA_TOKEN.finditer(formula):
+        kind = m.lastgroup
+        if kind == "element":
+            mass_number, _symbol, atoms = m.group("mass_number", "symbol", "atoms")
+            if mass_number is None:
+                nuclide = symbols[_symbol]
+            else:
+                nuclide = elements.SYMBOL_TO_Z[_symbol], int(mass_number)
+            groups[-1].append((nuclide, _count(formula, m, atoms) * coefficient))
+        elif kind == "open":
+            groups.append([])
+            closing.append(")" if m[0] == "(" else "]")
+        elif kind == "close":
+            if not closing or closing.pop() != m["bracket"]:
+                raise _formula_error(formula, m.start())
+            group = groups.pop()
+            multiplier = m["multiplier"]
+            if multiplier is not None:
+                factor = _count(formula, m, multiplier)
+                group = [(nuclide, atoms * factor) for nuclide, atoms in group]
+            groups[-1].extend(group)
+        elif kind == "hydrate" and not closing:
+            coefficient = _count(formula, m, m["coefficient"])
+        elif kind == "count" and not groups[0] and not closing:
+            coefficient = _count(formula, m, m["count"])
+        elif kind != "space":
+            raise _formula_error(formula, m.start())
+    if closing:
+        raise _formula_error(formula, len(formula))
+    atomic_numbers, mass_numbers, atoms_per_molecule = _collect_atoms(groups[0])
+    _check_isotopes(atomic_numbers, mass_numbers)
+    return atomic_numbers, mass_numbers, atoms_per_molecule
+
+
+def _count(formula: str, token: re.Match[str], count: str | None) -> float:
+    """Convert optional number of atoms or multiplier, zero would leave empty rows."""
+    if count is None:
+        return 1.0
+    value = float(count)
+    if value == 0.0:
+        raise _formula_error(formula, token.start())
+    return value
+
+
+def _collect_atoms(
+    terms: Iterable[tuple[tuple[int, int], float]],
+) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint16], npt.NDArray[np.float64]]:
+    """Sum atoms by (Z, A) and present them as read only arrays sorted by (Z, A)."""
+    collector: dict[tuple[int, int], float] = {}
+    for nuclide, atoms in terms:
+        collector[nuclide] = collector.get(nuclide, 0.0) + atoms
+    nuclides = sorted(collector)
+    atomic_numbers = np.array([_z for _z, _ in nuclides], dtype=np.uint8)
+    mass_numbers = np.array([a for _, a in nuclides], dtype=np.uint16)
+    atoms_per_molecule = np.array([collector[n] for n in nuclides], dtype=np.float64)
+    for array in (atomic_numbers, mass_numbers, atoms_per_molecule):
+        array.setflags(write=False)
+    return atomic_numbers, mass_numbers, atoms_per_molecule
+
+
+@instrumented_cache
+@cache
+def _formula_symbols() -> dict[str, tuple[int, int]]:
+    """Atomic and mass numbers by chemical symbols including D and T for hydrogen isotopes."""
+    # elements module depends on this one
+    from mckit_nuclides import elements  # noqa: PLC0415
+
+    return {s: (_z, 0) for s, _z in elements.SYMBOL_TO_Z.items()} | {"D": (1, 2), "T": (1, 3)}
+
+
+def _check_isotopes(
+    atomic_numbers: npt.NDArray[np.uint8], mass_numbers: npt.NDArray[np.uint16]
+) -> None:
+    """Check if the isotopes (mass_number > 0) are present in the nuclides table.
+
+    Raises
+    ------
+        KeyError: if an isotope is unknown.
+    """
+    isotopes = mass_numbers > 0
+    if isotopes.any():
+        # nuclides module depends on this one
+        from mckit_nuclides import nuclides  # noqa: PLC0415
+
+        nuclides.get_property_many(atomic_numbers[isotopes], mass_numbers[isotopes], "molar_mass")
+
+
+def _formula_error(formula: str, position: int) -> ValueError:
+    return ValueError(f"Cannot parse chemical formula {formula!r} at position {position}")
+
+
+def molar_masses(
+    atomic_numbers: npt.NDArray[np.uint8], mass_numbers: npt.NDArray[np.uint16]
+) -> npt.NDArray[np.float32]:
+    """Get standard atomic masses for elements and nuclide masses for isotopes (mass_number > 0).
+
+    Raises
+    ------
+        KeyError: if an element or isotope is unknown.
+    """
+    # the modules depend on this one
+    from mckit_nuclides import elements, nuclides  # noqa: PLC0415
+
+    masses = elements.get_property_many(atomic_numbers, "molar_mass")
+    isotopes = mass_numbers > 0
+    if isotopes.any():
+        masses[isotopes] = nuclides.get_property_many(
+            atomic_numbers[isotopes], mass_numbers[isotopes], "molar_mass"
+        )
+    return masses
@@ -0,0 +1,49 @@
+"""Helpers for compositions presented as DataFrames or LazyFrames shared by the transforms."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+TOTAL: Final = "__total__"
+"""Temporary column for sums of fractions over groups."""
+
+
+def as_list(by: str | Sequence[str] | None) -> list[str]:
+    """Present optional key columns as list."""
+    if by is None:
+        return []
+    if isinstance(by, str):
+        return [by]
+    return list(by)
+
+
+def like[Frame: (pl.DataFrame, pl.LazyFrame)](table: pl.DataFrame, frame: Frame) -> Frame:
+    """Present the table as LazyFrame, if the frame is lazy, to join them."""
+    return table.lazy() if isinstance(frame, pl.LazyFrame) else table
+
+
+def with_molar_mass[Frame: (pl.DataFrame, pl.LazyFrame)](
+    composition: Frame, molar_masses: pl.DataFrame
+) -> Frame:
+    """Join molar masses to a composition, unless column "molar_mass" is already present.
+
+    Args:
+        composition: frame with columns atomic_number and mass_number
+        molar_masses: table with columns atomic_number, mass_number and molar_mass
+
+    Returns
+    -------
+        The composition with column molar_mass, nuclides absent in the table are dropped.
+    """
+    if "molar_mass" in composition.collect_schema().names():
+        return composition
+    return composition.cast(dtypes={"atomic_number": pl.UInt8, "mass_number": pl.UInt16}).join(
+        like(molar_masses, composition),
+        on=["atomic_number", "mass_number"],
+        maintain_order="left",
+    )
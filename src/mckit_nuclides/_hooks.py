@@ -0,0 +1,105 @@
+"""Counters of calls and cache hits updated by the package functions.
+
+The modules of the package decorate their functions here on import,
+the statistics are reported and controlled with :mod:`~mckit_nuclides.instrumentation`,
+which is imported only on demand.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, Protocol
+
+import os
+import threading
+
+from functools import update_wrapper
+from time import perf_counter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from functools import _CacheInfo
+
+ENABLE_VARIABLE: Final = "MCKIT_NUCLIDES_INSTRUMENT"
+"""Environment variable to enable instrumentation from the start, if set and not "0"."""
+
+_PACKAGE_PREFIX: Final = "mckit_nuclides."
+
+
+class Cached(Protocol):
+    """Function decorated with :func:`functools.cache` or :func:`functools.lru_cache`."""
+
+    def cache_info(self) -> _CacheInfo: ...  # pragma: no cover
+
+
+enabled = os.environ.get(ENABLE_VARIABLE, "0") not in {"", "0"}
+"""The flag checked by the instrumented functions on each call."""
+
+LOCK: Final = threading.Lock()
+"""Guards the counters updated from all threads."""
+
+CALLS: Final[dict[str, list[float]]] = {}
+"""Number of calls and cumulative time by function name."""
+
+CACHES: Final[dict[str, Cached]] = {}
+"""The functions decorated with :func:`instrumented_cache` by name."""
+
+CACHE_STARTS: Final[dict[str, tuple[int, int]]] = {}
+"""The ``cache_info()`` hits and misses at the start of the current period."""
+
+
+def instrumented[**P, R](function: Callable[P, R]) -> Callable[P, R]:
+    """Count calls and time of a function, when instrumentation is enabled.
+
+    Args:
+        function: the function to instrument
+
+    Returns
+    -------
+        The wrapper of the function.
+    """
+    name = _name(function)
+
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not enabled:
+            return function(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            with LOCK:
+                counters = CALLS.setdefault(name, [0, 0.0])
+                counters[0] += 1
+                counters[1] += elapsed
+
+    return update_wrapper(wrapper, function)
+
+
+def instrumented_cache[C: Cached](function: C) -> C:
+    """Report hits and misses of a function decorated with :func:`functools.cache`.
+
+    The counters are taken from ``cache_info()``, so, the function is not wrapped.
+
+    Args:
+        function: the cached function
+
+    Returns
+    -------
+        The same function.
+    """
+    name = _name(function)
+    with LOCK:
+        CACHES[name] = function
+        CACHE_STARTS[name] = counters(function)
+    return function
+
+
+def counters(function: Cached) -> tuple[int, int]:
+    """Get the current hits and misses of a cached function."""
+    info = function.cache_info()
+    return info.hits, info.misses
+
+
+def _name(function: object) -> str:
+    module = getattr(function, "__module__", "").removeprefix(_PACKAGE_PREFIX)
+    return f"{module}.{getattr(function, '__qualname__', repr(function))}"
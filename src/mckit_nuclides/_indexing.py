@@ -0,0 +1,212 @@
+"""Dense NumPy indices to access table rows by integer keys in constant time."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal, SupportsIndex
+
+import operator
+
+import numpy as np
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import numpy.typing as npt
+
+NO_ROW = -1
+"""Marks absent or ambiguous keys in a dense index."""
+
+MissingPolicy = Literal["raise", "nan", "mask"]
+"""How batch lookups treat keys absent in a table.
+
+    - "raise" - raise KeyError on the first absent key
+    - "nan" - put NaN (None for non-numeric columns) in place of absent values
+    - "mask" - return NumPy masked array with absent values masked
+"""
+
+
+def make_dense_index(*keys: pl.Series) -> npt.NDArray[np.int32]:
+    """Create dense array mapping key tuples to row numbers.
+
+    The array has one dimension per key column, sized by the maximum key value.
+    Keys, which are absent or occur more than once, are mapped to :data:`NO_ROW`.
+
+    Args:
+        keys: non-negative integer key columns of equal length
+
+    Returns
+    -------
+        Array ``index``, such that ``index[k1, k2, ...]`` is the row of the key tuple.
+    """
+    arrays = tuple(k.to_numpy().astype(np.intp) for k in keys)
+    shape = tuple(int(a.max()) + 1 for a in arrays)
+    index = np.full(shape, NO_ROW, dtype=np.int32)
+    index[arrays] = np.arange(len(arrays[0]), dtype=np.int32)
+    counts = np.zeros(shape, dtype=np.int32)
+    np.add.at(counts, arrays, 1)
+    index[counts > 1] = NO_ROW
+    return index
+
+
+def lowest_last_key(index: npt.NDArray[np.int32]) -> npt.NDArray[np.int32]:
+    """Drop the last key from a dense index, keeping rows with the lowest present last key.
+
+    Args:
+        index: the dense index created with :func:`make_dense_index`
+
+    Returns
+    -------
+        Index with one dimension less.
+    """
+    lowest = (index != NO_ROW).argmax(axis=-1)
+    return np.take_along_axis(index, lowest[..., np.newaxis], axis=-1)[..., 0]
+
+
+def find_row(index: npt.NDArray[np.int32], *key: SupportsIndex | float) -> int:
+    """Get row number for a key tuple from a dense index.
+
+    Args:
+        index: the dense index created with :func:`make_dense_index`
+        key: key values, one per index dimension, integers or floats with integral values
+
+    Raises
+    ------
+        KeyError: if the key is not integral, out of the index range, absent or ambiguous.
+
+    Returns
+    -------
+        The row number.
+    """
+    try:
+        position = tuple(_as_index(k) for k in key)
+    except TypeError as ex:
+        raise KeyError(key) from ex
+    for k, n in zip(position, index.shape, strict=True):
+        if not 0 <= k < n:
+            raise KeyError(key)
+    row = int(index[position])
+    if row == NO_ROW:
+        raise KeyError(key)
+    return row
+
+
+def _as_index(key: SupportsIndex | float) -> int:
+    if isinstance(key, bool | np.bool_):
+        msg = f"Boolean key {key!r}"
+        raise TypeError(msg)
+    if isinstance(key, float | np.floating):
+        if not key.is_integer():
+            msg = f"Non-integral key {key!r}"
+            raise TypeError(msg)
+        return int(key)
+    return operator.index(key)
+
+
+def as_keys(
+    values: npt.ArrayLike | pl.Series, labels: Mapping[str, int] | None = None
+) -> npt.NDArray[np.intp]:
+    """Convert integer keys to a NumPy array suitable for :func:`find_rows`.
+
+    Nulls in a Polars Series and unknown labels are converted to :data:`NO_ROW`,
+    which is never found. Empty values of any type give empty keys.
+
+    Args:
+        values: NumPy array, Polars Series or sequence of integers or labels
+        labels: mapping from string labels to integer keys (chemical symbols to Z, for example)
+
+    Raises
+    ------
+        TypeError: if the values are neither integers, nor labels, which can be mapped.
+
+    Returns
+    -------
+        The keys as array.
+    """
+    if not isinstance(values, pl.Series):
+        array = np.asarray(values)
+        if array.dtype.kind not in "OU":
+            return _check_integer_keys(array)
+        values = pl.Series(array.ravel(), dtype=pl.String)
+        return as_keys(values, labels).reshape(array.shape)
+    if values.dtype == pl.String and labels is not None:
+        values = values.replace_strict(labels, default=None, return_dtype=pl.Int64)
+    if values.is_empty():
+        return np.empty(0, dtype=np.intp)
+    if not values.dtype.is_integer():
+        msg = f"Integer keys are expected, got {values.dtype}"
+        raise TypeError(msg)
+    return _check_integer_keys(values.cast(pl.Int64).fill_null(NO_ROW).to_numpy())
+
+
+def _check_integer_keys(keys: npt.NDArray[Any]) -> npt.NDArray[np.intp]:
+    if keys.dtype.kind not in "iu" and keys.size:
+        msg = f"Integer keys are expected, got {keys.dtype}"
+        raise TypeError(msg)
+    return keys.astype(np.intp, copy=False)
+
+
+def find_rows(index: npt.NDArray[np.int32], *keys: npt.NDArray[np.intp]) -> npt.NDArray[np.intp]:
+    """Get row numbers for arrays of keys from a dense index.
+
+    Args:
+        index: the dense index created with :func:`make_dense_index`
+        keys: key arrays, one per index dimension, broadcastable to each other
+
+    Returns
+    -------
+        Row numbers, :data:`NO_ROW` for keys out of range, absent or ambiguous.
+    """
+    keys = np.broadcast_arrays(*keys)
+    valid = np.ones(keys[0].shape, dtype=bool)
+    for k, n in zip(keys, index.shape, strict=True):
+        valid &= (k >= 0) & (k < n)
+    rows = np.full(keys[0].shape, NO_ROW, dtype=np.intp)
+    rows[valid] = index[tuple(k[valid] for k in keys)]
+    return rows
+
+
+def gather(
+    values: npt.NDArray[Any],
+    rows: npt.NDArray[np.intp],
+    missing: MissingPolicy,
+    *keys: npt.ArrayLike | pl.Series,
+) -> npt.NDArray[Any]:
+    """Take values of a table column by row numbers.
+
+    Args:
+        values: the table column
+        rows: row numbers found with :func:`find_rows`
+        missing: what to do on :data:`NO_ROW` rows, see :data:`MissingPolicy`
+        keys: the keys as given by caller, broadcastable to the rows, to report the missing ones
+
+    Raises
+    ------
+        KeyError: if there are missing rows and the policy is "raise".
+        ValueError: on unknown policy.
+
+    Returns
+    -------
+        The column values in the order of rows,
+        integer and boolean values are converted to float with "nan" policy.
+    """
+    if missing not in ("raise", "nan", "mask"):
+        msg = f"Unknown missing keys policy {missing!r}"
+        raise ValueError(msg)
+    absent = rows == NO_ROW
+    result = values[np.where(absent, 0, rows)]
+    if missing == "mask":
+        return np.ma.masked_array(result, mask=absent)
+    if missing == "nan" and result.dtype.kind in "biu":
+        result = result.astype(np.float64)
+    if absent.any():
+        if missing == "raise":
+            first = np.flatnonzero(absent)[0]
+            raise KeyError(tuple(_key_at(k, rows.shape, first) for k in keys))
+        result[absent] = None if result.dtype.kind == "O" else np.nan
+    return result
+
+
+def _key_at(key: npt.ArrayLike | pl.Series, shape: tuple[int, ...], position: int) -> object:
+    value = np.broadcast_to(np.asarray(key), shape).flat[position]
+    return value.item() if isinstance(value, np.generic) else value
@@ -0,0 +1,278 @@
+"""Loading of the data tables shipped with the package.
+
+The tables are shipped both as Parquet and uncompressed Arrow IPC files.
+Parquet is used by default. Set environment variable ``MCKIT_NUCLIDES_DATA_FORMAT=ipc``
+before the first access to the tables to read IPC files: they are not decompressed on loading
+and Polars memory-maps them, where supported, so, processes share the data via the page cache.
+
+The tables are sorted by their keys and the loaded frames are marked sorted,
+so, Polars can use fast paths for filters, joins and group-by on the keys.
+The lazy scans of the data files use row group statistics to read only the rows needed
+by filters on atomic numbers.
+
+Worker processes can also use the tables published in shared memory by a parent process,
+see :mod:`mckit_nuclides.shared`.
+
+The structures derived from the tables (the molar masses table, the indices of the tables
+and the symbol maps) are computed in every process. Short-lived processes can reuse them
+from disk: set environment variable ``MCKIT_NUCLIDES_CACHE_DIR`` to a writable directory
+before the first access to the tables. The structures are saved there on first computation
+and memory-mapped by the next processes.
+The cache is kept in subdirectory named by the package version and hash of the data files,
+so, a new version or changed data files use a new subdirectory.
+The stale subdirectories are not removed automatically, remove them, if they are not needed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, Literal, cast, get_args
+
+import contextlib
+import hashlib
+import json
+import os
+
+from functools import cache, partial
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    import numpy.typing as npt
+
+DataFormat = Literal["parquet", "ipc"]
+"""Formats of the data files."""
+
+DATA_FORMAT_VARIABLE: Final = "MCKIT_NUCLIDES_DATA_FORMAT"
+"""Environment variable to select the data format."""
+
+_SHARED_TABLES: Final[dict[str, pl.DataFrame]] = {}
+"""Tables attached from shared memory by name."""
+
+CACHE_DIR_VARIABLE: Final = "MCKIT_NUCLIDES_CACHE_DIR"
+"""Environment variable to enable the persistent cache of derived structures."""
+
+_DATA_SUFFIXES: Final = (".parquet", ".arrow")
+
+
+def data_format() -> DataFormat:
+    """Get data format from the environment.
+
+    Raises
+    ------
+        ValueError: if the format is unknown.
+
+    Returns
+    -------
+        The format specified with :data:`DATA_FORMAT_VARIABLE`, "parquet" by default.
+    """
+    value = os.environ.get(DATA_FORMAT_VARIABLE, "parquet").strip().lower()
+    if value not in get_args(DataFormat):
+        msg = f"Unknown data format {value!r} in {DATA_FORMAT_VARIABLE}, use 'parquet' or 'ipc'"
+        raise ValueError(msg)
+    return cast("DataFormat", value)
+
+
+def use_shared_table(name: str, table: pl.DataFrame) -> None:
+    """Use the table attached from shared memory instead of reading data files.
+
+    Args:
+        name: the table name
+        table: the attached table
+    """
+    _SHARED_TABLES[name] = table
+
+
+def shared_table(name: str) -> pl.DataFrame | None:
+    """Get the table attached from shared memory, if any.
+
+    Args:
+        name: the table name
+
+    Returns
+    -------
+        The table or None.
+    """
+    return _SHARED_TABLES.get(name)
+
+
+def read_table(
+    name: str, parquet_path: Path, ipc_path: Path, sorted_by: Sequence[str] = ()
+) -> pl.DataFrame:
+    """Read a data table in the format selected with :func:`data_format`.
+
+    The table attached from shared memory with the same name, if any, is used instead.
+
+    Args:
+        name: the table name
+        parquet_path: path to the Parquet file
+        ipc_path: path to the uncompressed Arrow IPC file with the same table
+        sorted_by: the keys, the table is sorted by, the first one is marked sorted
+
+    Returns
+    -------
+        The table.
+    """
+    table = shared_table(name)
+    if table is None:
+        table = pl.read_ipc(ipc_path) if data_format() == "ipc" else pl.read_parquet(parquet_path)
+    return table.set_sorted(sorted_by[0]) if sorted_by else table
+
+
+def scan_table(
+    name: str, parquet_path: Path, ipc_path: Path, sorted_by: Sequence[str] = ()
+) -> pl.LazyFrame:
+    """Scan a data table in the format selected with :func:`data_format`.
+
+    The table attached from shared memory with the same name, if any, is used instead.
+
+    Args:
+        name: the table name
+        parquet_path: path to the Parquet file
+        ipc_path: path to the uncompressed Arrow IPC file with the same table
+        sorted_by: the keys, the table is sorted by
+
+    Returns
+    -------
+        The lazy table.
+    """
+    shared = shared_table(name)
+    if shared is not None:
+        table = shared.lazy()
+    elif data_format() == "ipc":
+        table = pl.scan_ipc(ipc_path)
+    else:
+        table = pl.scan_parquet(parquet_path)
+    return table.set_sorted(list(sorted_by)) if sorted_by else table
+
+
+@cache
+def cache_directory() -> Path | None:
+    """Get the cache subdirectory for this package version and data files.
+
+    Returns
+    -------
+        The subdirectory, None if the cache is not enabled with :data:`CACHE_DIR_VARIABLE`.
+    """
+    root = os.environ.get(CACHE_DIR_VARIABLE, "").strip()
+    if not root:
+        return None
+    return Path(root).expanduser() / f"{_package_version()}-{_data_digest()}"
+
+
+def _package_version() -> str:
+    from importlib import metadata  # noqa: PLC0415 - it takes time, import only on demand
+
+    try:
+        return metadata.version("mckit_nuclides")
+    except metadata.PackageNotFoundError:  # pragma: no cover
+        return "unknown"
+
+
+def _data_digest() -> str:
+    data_dir = Path(__file__).parent / "data"
+    digest = hashlib.sha256()
+    for path in sorted(p for suffix in _DATA_SUFFIXES for p in data_dir.glob(f"*{suffix}")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def cached_arrays(
+    name: str, compute: Callable[[], tuple[npt.NDArray[np.generic], ...]]
+) -> tuple[npt.NDArray[np.generic], ...]:
+    """Load arrays from the cache or compute and save them.
+
+    Args:
+        name: the name of the structure
+        compute: computes the arrays
+
+    Returns
+    -------
+        The arrays, memory-mapped read only, if they are loaded from the cache.
+    """
+    directory = cache_directory()
+    if directory is None:
+        return compute()
+    index_path = directory / f"{name}.json"
+    if index_path.exists():
+        count = json.loads(index_path.read_text(encoding="utf-8"))["count"]
+        return tuple(
+            np.load(directory / f"{name}-{i}.npy", mmap_mode="r", allow_pickle=False)
+            for i in range(count)
+        )
+    arrays = compute()
+    for i, array in enumerate(arrays):
+        _save(directory / f"{name}-{i}.npy", partial(np.save, arr=array))
+    # the index is written last, it marks the arrays complete
+    _save(index_path, lambda path: path.write_text(json.dumps({"count": len(arrays)})))
+    return arrays
+
+
+def cached_frame(name: str, compute: Callable[[], pl.DataFrame]) -> pl.DataFrame:
+    """Load DataFrame from the cache or compute and save it.
+
+    Args:
+        name: the name of the structure
+        compute: computes the frame
+
+    Returns
+    -------
+        The frame, memory-mapped, if it's loaded from the cache.
+    """
+    directory = cache_directory()
+    if directory is None:
+        return compute()
+    path = directory / f"{name}.arrow"
+    if path.exists():
+        return pl.read_ipc(path)
+    frame = compute()
+    _save(path, lambda p: frame.write_ipc(p, compression="uncompressed"))
+    return frame
+
+
+def cached_json[T](name: str, compute: Callable[[], T]) -> T:
+    """Load JSON serializable value from the cache or compute and save it.
+
+    Args:
+        name: the name of the structure
+        compute: computes the value
+
+    Returns
+    -------
+        The value.
+    """
+    directory = cache_directory()
+    if directory is None:
+        return compute()
+    path = directory / f"{name}.json"
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))  # type: ignore[no-any-return]
+    value = compute()
+    _save(path, lambda p: p.write_text(json.dumps(value), encoding="utf-8"))
+    return value
+
+
+def _save(path: Path, write: Callable[[Path], object]) -> None:
+    """Write a file atomically: concurrent processes never see incomplete files.
+
+    The cache is an optimization: if it cannot be written, the structures are just computed
+    in the next processes.
+    """
+    # tempfile imports shutil and random, it adds several milliseconds to the package import
+    import tempfile  # noqa: PLC0415
+
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # keep the suffix: numpy.save() appends ".npy" to other names
+        fd, name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=path.suffix)
+        os.close(fd)
+        temporary = Path(name)
+        try:
+            write(temporary)
+            temporary.replace(path)
+        finally:
+            temporary.unlink(missing_ok=True)
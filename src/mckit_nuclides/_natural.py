@@ -0,0 +1,93 @@
+"""Arrays of naturally present isotopes shared by abundance and composition transforms."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from functools import cache
+
+import numpy as np
+import polars as pl
+
+from mckit_nuclides import nuclides
+from mckit_nuclides._hooks import instrumented_cache
+from mckit_nuclides._loading import cached_arrays
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    NaturalIsotopesIndex = tuple[
+        npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.float64]
+    ]
+
+
+@instrumented_cache
+@cache
+def natural_isotopes_index() -> NaturalIsotopesIndex:
+    """Mass numbers and isotopic compositions of naturally present nuclides.
+
+    Returns
+    -------
+        offsets, mass_numbers, isotopic_compositions - the values for Z are in the slice
+        ``offsets[Z]:offsets[Z + 1]``
+    """
+    arrays = cached_arrays("natural_isotopes_index", _compute_natural_isotopes_index)
+    return cast("NaturalIsotopesIndex", arrays)
+
+
+def _compute_natural_isotopes_index() -> NaturalIsotopesIndex:
+    natural = (
+        nuclides.NUCLIDES_TABLE_PL.filter(pl.col("isotopic_composition").gt(0.0))
+        .select("atomic_number", "mass_number", "isotopic_composition")
+        .sort("atomic_number", "mass_number")
+    )
+    atomic_numbers = natural["atomic_number"].to_numpy()
+    counts = np.bincount(atomic_numbers, minlength=int(atomic_numbers.max()) + 1)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    return (
+        offsets.astype(np.intp),
+        natural["mass_number"].to_numpy().astype(np.intp),
+        natural["isotopic_composition"].to_numpy().astype(np.float64),
+    )
+
+
+@instrumented_cache
+@cache
+def natural_mass_shares() -> npt.NDArray[np.float64]:
+    """Shares by mass of naturally present nuclides in their elements.
+
+    Returns
+    -------
+        The shares aligned with the arrays of :func:`natural_isotopes_index`.
+    """
+    offsets, mass_numbers, isotopic_compositions = natural_isotopes_index()
+    atomic_numbers = np.repeat(np.arange(offsets.size - 1), np.diff(offsets))
+    masses = isotopic_compositions * nuclides.get_property_many(
+        atomic_numbers, mass_numbers, "molar_mass"
+    )
+    totals = np.bincount(atomic_numbers, weights=masses)
+    return cast("npt.NDArray[np.float64]", masses / totals[atomic_numbers])
+
+
+def expand_natural_arrays(
+    z: npt.NDArray[np.intp],
+    a: npt.NDArray[np.intp],
+    f: npt.NDArray[np.float64],
+    shares: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+    """Expand natural presence with isotope shares aligned with :func:`natural_isotopes_index`."""
+    offsets, natural_mass_numbers, _ = natural_isotopes_index()
+    natural = a == 0
+    known = natural & (z >= 0) & (z < offsets.size - 1)
+    first = np.where(known, offsets[np.where(known, z, 0)], 0)
+    last = np.where(known, offsets[np.where(known, z, 0) + 1], 0)
+    counts = np.where(natural, last - first, 1)
+    source = np.repeat(np.arange(z.size), counts)
+    position = np.arange(source.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    expanded = natural[source]
+    isotope = np.where(expanded, first[source] + position, 0)
+    return (
+        z[source],
+        np.where(expanded, natural_mass_numbers[isotope], a[source]),
+        f[source] * np.where(expanded, shares[isotope], 1.0),
+    )
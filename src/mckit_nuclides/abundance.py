@@ -2,103 +2,329 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final, Literal
 
+import itertools
+
+from functools import cache
+
+import numpy as np
 import polars as pl
 
-from mckit_nuclides.elements import ELEMENTS_TABLE_PL
-from mckit_nuclides.nuclides import NUCLIDES_TABLE_PL
+from mckit_nuclides import elements, nuclides
+from mckit_nuclides._frames import TOTAL, as_list, like, with_molar_mass
+from mckit_nuclides._hooks import instrumented, instrumented_cache
+from mckit_nuclides._loading import cached_frame, shared_table
+from mckit_nuclides._natural import expand_natural_arrays, natural_isotopes_index
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Generator, Iterable, Sequence
+
+    import numpy.typing as npt
+
+    # The table is computed on first access, see __getattr__ below
+    MOLAR_MASS_TABLE: pl.DataFrame
+
+
+_WEIGHT: Final = "__weight__"
+"""Temporary column for weights of components in mixtures."""
+
+MixingBasis = Literal["mass", "atomic", "volume"]
+"""How weights of components and fractions in their compositions are given for :func:`mix`.
+
+    - "mass" - mass shares of components, mass fractions in compositions
+    - "atomic" - shares of components by atoms, atomic fractions in compositions
+    - "volume" - volume shares of components, mass fractions in compositions
+"""
+
 
-MOLAR_MASS_TABLE = (
-    ELEMENTS_TABLE_PL.select("atomic_number", "molar_mass")
-    .with_columns(pl.lit(0, dtype=pl.UInt16).alias("mass_number"))
-    .select("atomic_number", "mass_number", "molar_mass")
-    .vstack(NUCLIDES_TABLE_PL.select("atomic_number", "mass_number", "molar_mass"))
-    .sort("atomic_number", "mass_number")
-)
-"""The table contains molar masses for nuclides with specified and not specified mass numbers."""
+@instrumented_cache
+@cache
+def _molar_mass_table() -> pl.DataFrame:
+    """Collect molar masses for nuclides with specified and not specified mass numbers."""
+    shared = shared_table("molar_masses")
+    if shared is not None:
+        return shared
+    return cached_frame("molar_masses", _compute_molar_mass_table)
 
 
-def convert_to_atomic_fraction(
-    composition: pl.DataFrame, fraction_column: str = "fraction"
-) -> pl.DataFrame:
+def _compute_molar_mass_table() -> pl.DataFrame:
+    return (
+        elements.ELEMENTS_TABLE_PL.select("atomic_number", "molar_mass")
+        .with_columns(pl.lit(0, dtype=pl.UInt16).alias("mass_number"))
+        .select("atomic_number", "mass_number", "molar_mass")
+        .vstack(
+            nuclides.NUCLIDES_TABLE_PL.filter(nuclides.is_lowest_state()).select(
+                "atomic_number", "mass_number", "molar_mass"
+            )
+        )
+        .sort("atomic_number", "mass_number")
+    )
+
+
+def __getattr__(name: str) -> object:
+    """Compute the table on first access to the module attribute."""
+    if name == "MOLAR_MASS_TABLE":
+        return _molar_mass_table()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+@instrumented
+def convert_to_atomic_fraction[Frame: (pl.DataFrame, pl.LazyFrame)](
+    composition: Frame,
+    fraction_column: str = "fraction",
+    *,
+    by: str | Sequence[str] | None = None,
+) -> Frame:
     """Change fractions by mass to fractions by atoms.
 
     Args:
-        composition: DataFrame with columns atomic_number, mass_number
+        composition: DataFrame or LazyFrame with columns atomic_number, mass_number
         fraction_column: name of column presenting fraction
+        by: key columns to normalize fractions separately for each group, material id, for example
+
+    Examples
+    --------
+        The function accepts LazyFrame, so, large tables can be processed with streaming engine.
+
+        >>> def convert_parquet(source, target):
+        ...     composition = pl.scan_parquet(source)
+        ...     convert_to_atomic_fraction(composition, by="material").sink_parquet(target)
 
     Returns
     -------
-        DataFrame: df with modified column "fraction"
+        DataFrame: df with modified column "fraction", LazyFrame on LazyFrame input
     """
-    composition_columns = composition.columns
-    converted = (
-        composition.cast(dtypes={"atomic_number": pl.UInt8, "mass_number": pl.UInt16})
-        .join(MOLAR_MASS_TABLE, on=["atomic_number", "mass_number"])
-        .with_columns((pl.col(fraction_column) / pl.col("molar_mass")).alias(fraction_column))
+    composition_columns = composition.collect_schema().names()
+    converted = with_molar_mass(composition, _molar_mass_table()).with_columns(
+        (pl.col(fraction_column) / pl.col("molar_mass")).alias(fraction_column)
     )
-    return normalize_column(converted, fraction_column).select(composition_columns)
+    return normalize_column(converted, fraction_column, by=by).select(composition_columns)
 
 
-def normalize_column(table: pl.DataFrame, column: str = "fraction") -> pl.DataFrame:
+@instrumented
+def normalize_column[Frame: (pl.DataFrame, pl.LazyFrame)](
+    table: Frame,
+    column: str = "fraction",
+    *,
+    by: str | Sequence[str] | None = None,
+) -> Frame:
     """Normalize the values in a column to have sum() == 1.0 over the column.
 
     Args:
-        table: ... to normalize
+        table: ... to normalize, DataFrame or LazyFrame
         column: ... over this column
+        by: key columns to normalize separately in each group, material id, for example
 
     Returns
     -------
         Result of normalization
     """
-    total_fractions = table.select(column).sum().item()
-    return table.with_columns(pl.col(column) / total_fractions)
+    if by is None:
+        return table.with_columns(pl.col(column) / pl.col(column).sum())
+    # Aggregate and join instead of window expression: this is supported by streaming engine
+    totals = table.group_by(by).agg(pl.col(column).sum().alias(TOTAL))
+    return (
+        table.join(totals, on=by, how="left", maintain_order="left", nulls_equal=True)
+        .with_columns(pl.col(column) / pl.col(TOTAL))
+        .drop(TOTAL)
+    )
 
 
-def expand_df_natural_presence(
-    composition: pl.DataFrame,
+@instrumented
+def expand_df_natural_presence[Frame: (pl.DataFrame, pl.LazyFrame)](
+    composition: Frame,
     fraction_column: str = "fraction",
-) -> pl.DataFrame:
+    *,
+    by: str | Sequence[str] | None = None,
+) -> Frame:
     """Expand 'natural' presence in composition presented as a DataFrame.
 
     Args:
-        composition: table with columns atomic_number, mass_number (may be 0), fraction
+        composition: DataFrame or LazyFrame with columns atomic_number, mass_number (may be 0),
+            fraction
         fraction_column: exact 'fraction' column name
+        by: key columns to keep compositions separate, material id, for example
+
+    Examples
+    --------
+        >>> materials = pl.DataFrame(
+        ...     {
+        ...         "material": [1, 1, 2],
+        ...         "atomic_number": [1, 8, 1],
+        ...         "mass_number": [0, 16, 2],
+        ...         "fraction": [2.0, 1.0, 1.0],
+        ...     }
+        ... )
+        >>> print(expand_df_natural_presence(materials, by="material"))
+        shape: (4, 4)
+        ┌──────────┬───────────────┬─────────────┬──────────┐
+        │ material ┆ atomic_number ┆ mass_number ┆ fraction │
+        │ ---      ┆ ---           ┆ ---         ┆ ---      │
+        │ i64      ┆ u8            ┆ u16         ┆ f64      │
+        ╞══════════╪═══════════════╪═════════════╪══════════╡
+        │ 1        ┆ 1             ┆ 1           ┆ 1.99977  │
+        │ 1        ┆ 1             ┆ 2           ┆ 0.00023  │
+        │ 1        ┆ 8             ┆ 16          ┆ 1.0      │
+        │ 2        ┆ 1             ┆ 2           ┆ 1.0      │
+        └──────────┴───────────────┴─────────────┴──────────┘
 
     Returns
     -------
-        Expanded composition as a DataFrame.
+        Expanded composition as a DataFrame, LazyFrame on LazyFrame input.
     """
-    composition_columns = composition.columns
-    having_mass_numbers = composition.filter(pl.col("mass_number").ne(0))
-    not_having_mass_number = composition.filter(pl.col("mass_number").eq(0))
-    expanded = (
-        not_having_mass_number.join(
-            NUCLIDES_TABLE_PL.select("atomic_number", "mass_number", "isotopic_composition").filter(
-                pl.col("isotopic_composition").gt(0)
-            ),
-            on="atomic_number",
+    keys = [*as_list(by), "atomic_number", "mass_number"]
+    return (
+        _expand_natural_elements(composition, fraction_column, "isotopic_composition")
+        .group_by(keys)
+        .agg(pl.col(fraction_column).sum())
+        .sort(keys)
+    )
+
+
+@instrumented
+def mix[Frame: (pl.DataFrame, pl.LazyFrame)](  # noqa: PLR0913
+    compositions: Frame,
+    weights: Frame,
+    basis: MixingBasis = "mass",
+    *,
+    on: str | Sequence[str] = "material",
+    by: str | Sequence[str] | None = None,
+    fraction_column: str = "fraction",
+    weight_column: str = "weight",
+) -> Frame:
+    """Mix compositions with weights expanding natural presence of elements.
+
+    The compositions are normalized, weighted, expanded and summed up in one query,
+    so, many mixtures of many components can be computed at once.
+
+    Args:
+        compositions: DataFrame or LazyFrame with columns `on`, atomic_number,
+            mass_number (0 for natural presence) and fractions
+        weights: DataFrame or LazyFrame with columns `by`, `on` and weights;
+            with column density (g/cm^3) of components for "volume" basis
+        basis: what are the weights and fractions, see :data:`MixingBasis`
+        on: key columns to identify components
+        by: key columns to identify mixtures
+        fraction_column: name of column presenting fractions in compositions and the result
+        weight_column: name of column presenting weights
+
+    Examples
+    --------
+        >>> compositions = pl.DataFrame(
+        ...     {
+        ...         "material": [1, 1, 2],
+        ...         "atomic_number": [1, 8, 26],
+        ...         "mass_number": [1, 16, 56],
+        ...         "fraction": [0.1, 0.9, 1.0],
+        ...     }
+        ... )
+        >>> weights = pl.DataFrame(
+        ...     {"material": [1, 2], "weight": [0.5, 0.5], "density": [1.0, 7.8]}
+        ... )
+        >>> print(mix(compositions, weights, "volume"))
+        shape: (3, 4)
+        ┌───────────────┬─────────────┬──────────┬─────────┐
+        │ atomic_number ┆ mass_number ┆ fraction ┆ density │
+        │ ---           ┆ ---         ┆ ---      ┆ ---     │
+        │ u8            ┆ u16         ┆ f64      ┆ f64     │
+        ╞═══════════════╪═════════════╪══════════╪═════════╡
+        │ 1             ┆ 1           ┆ 0.011364 ┆ 4.4     │
+        │ 8             ┆ 16          ┆ 0.102273 ┆ 4.4     │
+        │ 26            ┆ 56          ┆ 0.886364 ┆ 4.4     │
+        └───────────────┴─────────────┴──────────┴─────────┘
+
+    Raises
+    ------
+        ValueError: on unknown basis.
+
+    Returns
+    -------
+        Fractions of nuclides in the mixtures by mass or by atoms according to the basis,
+        sorted by `by`, atomic and mass numbers. For "volume" basis the column density
+        presents densities of the mixtures, the volume not covered by the weights is void.
+    """
+    if basis not in ("mass", "atomic", "volume"):
+        msg = f"Unknown mixing basis {basis!r}"
+        raise ValueError(msg)
+    components = as_list(on)
+    mixtures: list[str] = as_list(by)
+    keys = [*mixtures, "atomic_number", "mass_number"]
+    weight = pl.col(weight_column)
+    if basis == "volume":
+        weight = weight * pl.col("density")
+    fraction = pl.col(fraction_column)
+    weighted = (
+        normalize_column(
+            compositions.select(*components, "atomic_number", "mass_number", fraction),
+            fraction_column,
+            by=components,
         )
+        .join(weights.select(*mixtures, *components, weight.alias(_WEIGHT)), on=components)
+        .with_columns(fraction * pl.col(_WEIGHT))
+    )
+    share = "isotopic_composition" if basis == "atomic" else "_mass_share"
+    mixed = normalize_column(
+        _expand_natural_elements(weighted, fraction_column, share)
+        .group_by(keys)
+        .agg(fraction.sum()),
+        fraction_column,
+        by=by,
+    ).sort(keys)
+    if basis != "volume":
+        return mixed
+    if not mixtures:
+        return mixed.join(weights.select(weight.sum().alias("density")), how="cross")
+    densities = weights.group_by(mixtures).agg(weight.sum().alias("density"))
+    return mixed.join(densities, on=mixtures, how="left", maintain_order="left", nulls_equal=True)
+
+
+def _expand_natural_elements[Frame: (pl.DataFrame, pl.LazyFrame)](
+    composition: Frame, fraction_column: str, share: str
+) -> Frame:
+    """Substitute natural elements (mass_number == 0) with their isotopes.
+
+    Args:
+        composition: the composition to expand
+        fraction_column: the column to multiply by isotopes shares
+        share: the column in :func:`_natural_nuclides` table with isotopes shares
+
+    Returns
+    -------
+        Rows for isotopes and the rows with specified mass numbers,
+        the rows for elements without natural isotopes are dropped.
+    """
+    return (
+        composition.cast(dtypes={"atomic_number": pl.UInt8, "mass_number": pl.UInt16})
+        .with_columns(_natural_z=pl.when(pl.col("mass_number").eq(0)).then(pl.col("atomic_number")))
+        .join(like(_natural_nuclides(), composition), on="_natural_z", how="left")
+        .filter(pl.col("mass_number").ne(0) | pl.col("_natural_a").is_not_null())
         .with_columns(
-            (pl.col(fraction_column) * pl.col("isotopic_composition")).alias(fraction_column),
-            mass_number=pl.col(
-                "mass_number_right"
-            ),  # replace 0 with mass_number from nuclides table
+            (pl.col(fraction_column) * pl.col(share).fill_null(1.0)).alias(fraction_column),
+            mass_number=pl.coalesce("_natural_a", "mass_number"),
         )
-        .select(composition_columns)
     )
-    return (
-        having_mass_numbers.vstack(expanded)
-        .group_by("atomic_number", "mass_number")
-        .agg(pl.col(fraction_column).sum())
-        .sort("atomic_number", "mass_number")
+
+
+@instrumented_cache
+@cache
+def _natural_nuclides() -> pl.DataFrame:
+    """Naturally present nuclides to join with compositions on '_natural_z'.
+
+    The shares of isotopes in their elements are given by atoms in column isotopic_composition
+    and by mass in column _mass_share.
+    """
+    mass = pl.col("isotopic_composition") * pl.col("molar_mass")
+    return nuclides.NUCLIDES_TABLE_PL.filter(pl.col("isotopic_composition").gt(0)).select(
+        _natural_z=pl.col("atomic_number"),
+        _natural_a=pl.col("mass_number"),
+        isotopic_composition=pl.col("isotopic_composition"),
+        _mass_share=mass / mass.sum().over("atomic_number"),
     )
 
 
+@instrumented
 def expand_natural_presence(
     zaf: Iterable[tuple[int, int, float]],
 ) -> Generator[tuple[int, int, float]]:
@@ -114,12 +340,56 @@ def expand_natural_presence(
     ------
         atomic number, mass_number, and corrected atomic fraction
     """
+    natural_isotopes = _natural_isotopes()
     for z, a, f in zaf:
         if a != 0:
             yield z, a, f
         else:
-            isotopic_compositions = NUCLIDES_TABLE_PL.filter(
-                pl.col("atomic_number").eq(z) & pl.col("isotopic_composition").gt(0.0)
-            ).select("mass_number", "isotopic_composition")
-            for _a, _ic in isotopic_compositions.iter_rows():
+            for _a, _ic in natural_isotopes.get(z, ()):
                 yield z, _a, f * _ic
+
+
+@instrumented
+def expand_natural_presence_arrays(
+    atomic_numbers: npt.ArrayLike,
+    mass_numbers: npt.ArrayLike,
+    fractions: npt.ArrayLike,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+    """Expand natural presence in composition presented with arrays.
+
+    This is vectorized variant of :func:`expand_natural_presence`, the order of output is the same.
+
+    Args:
+        atomic_numbers: Z
+        mass_numbers: A, 0 - for natural presence
+        fractions: atomic fractions
+
+    Examples
+    --------
+        >>> z, a, f = expand_natural_presence_arrays([1, 8], [0, 16], [2.0, 1.0])
+        >>> z.tolist(), a.tolist()
+        ([1, 1, 8], [1, 2, 16])
+
+    Returns
+    -------
+        Arrays of atomic numbers, mass numbers and corrected atomic fractions.
+    """
+    _, _, isotopic_compositions = natural_isotopes_index()
+    return expand_natural_arrays(
+        np.asarray(atomic_numbers, dtype=np.intp),
+        np.asarray(mass_numbers, dtype=np.intp),
+        np.asarray(fractions, dtype=np.float64),
+        isotopic_compositions,
+    )
+
+
+@instrumented_cache
+@cache
+def _natural_isotopes() -> dict[int, tuple[tuple[int, float], ...]]:
+    """Mass numbers and isotopic compositions of naturally present nuclides by Z."""
+    offsets, mass_numbers, fractions = natural_isotopes_index()
+    return {
+        z: tuple(zip(mass_numbers[start:end].tolist(), fractions[start:end].tolist(), strict=True))
+        for z, (start, end) in enumerate(itertools.pairwise(offsets.tolist()))
+        if start < end
+    }
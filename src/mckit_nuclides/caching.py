@@ -0,0 +1,197 @@
+"""Memoization of transforms of compositions presented as DataFrames.
+
+The same materials are often transformed many times: the same steel in thousands of cells.
+Wrap a transform with :func:`frame_cache` to reuse the results for equal input frames.
+The cache is keyed by hash of the frame content, so, equal frames created separately share
+the results. On a hash match the frames are compared to exclude collisions:
+this is much cheaper than the joins and group-bys of the transforms.
+
+Only DataFrames are cached, LazyFrames are passed to the transform as is.
+
+Examples
+--------
+    >>> import polars as pl
+    >>> from mckit_nuclides.abundance import expand_df_natural_presence
+    >>> expand = frame_cache(maxsize=1024)(expand_df_natural_presence)
+    >>> steel = pl.DataFrame(
+    ...     {"atomic_number": [26, 24], "mass_number": [0, 0], "fraction": [0.8, 0.2]}
+    ... )
+    >>> first = expand(steel)
+    >>> second = expand(steel.clone())
+    >>> first.equals(second)
+    True
+    >>> expand.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, NamedTuple, cast
+
+import hashlib
+import threading
+
+from collections import OrderedDict
+from functools import update_wrapper
+
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+DEFAULT_MAXSIZE: Final = 256
+"""Default number of cached results."""
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, as of :func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def frame_digest(frame: pl.DataFrame) -> bytes:
+    """Compute hash of a DataFrame content.
+
+    The hash depends on column names, types and values in the row order.
+    It's stable within a process, but not across Polars versions.
+
+    Args:
+        frame: the frame to hash
+
+    Returns
+    -------
+        The hash.
+    """
+    digest = hashlib.blake2b(repr(frame.schema).encode(), digest_size=16)
+    if frame.width:
+        digest.update(frame.hash_rows(seed=0).to_numpy().tobytes())
+    return digest.digest()
+
+
+class FrameCache:
+    """LRU cache of results of a transform by input DataFrames and other arguments.
+
+    The cache is thread safe.
+
+    Args:
+        maxsize: maximum number of cached results, the least recently used are evicted
+
+    Raises
+    ------
+        ValueError: if the size is not positive.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if maxsize < 1:
+            msg = f"Cache size should be positive, got {maxsize}"
+            raise ValueError(msg)
+        self.maxsize: Final = maxsize
+        self._entries: OrderedDict[Hashable, tuple[pl.DataFrame, object]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, frame: pl.DataFrame) -> object | None:
+        """Get the cached result for the key, if the cached input frame is equal to the frame.
+
+        Args:
+            key: the hash of the frame and the other arguments of the transform
+            frame: the input frame
+
+        Returns
+        -------
+            The cached result, None if it's absent.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0].equals(frame):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+            return None
+
+    def put(self, key: Hashable, frame: pl.DataFrame, result: object) -> None:
+        """Store the result of transform of the frame.
+
+        Args:
+            key: the hash of the frame and the other arguments of the transform
+            frame: the input frame
+            result: the result
+        """
+        with self._lock:
+            self._entries[key] = (frame, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """Get the cache statistics."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """Drop the cached results and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+
+def frame_cache[**P, R](
+    maxsize: int = DEFAULT_MAXSIZE,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Create decorator caching the results of a transform of DataFrame.
+
+    The transform takes the frame as the first argument,
+    the other arguments should be hashable or lists of hashable values (column names).
+    The cached DataFrame results are returned as clones, which are cheap in Polars,
+    so, modifying a result in place doesn't affect the cache.
+
+    Each function decorated with the same decorator has its own cache
+    with methods ``cache_info()`` and ``cache_clear()``
+    as the functions decorated with :func:`functools.lru_cache`.
+
+    Args:
+        maxsize: maximum number of cached results
+
+    Returns
+    -------
+        The decorator.
+    """
+
+    def decorator(transform: Callable[P, R]) -> Callable[P, R]:
+        cache = FrameCache(maxsize)
+
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            frame = args[0] if args else None
+            if not isinstance(frame, pl.DataFrame):
+                return transform(*args, **kwargs)
+            key = (
+                frame_digest(frame),
+                tuple(_freeze(a) for a in args[1:]),
+                tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())),
+            )
+            result = cache.get(key, frame)
+            if result is None:
+                result = transform(*args, **kwargs)
+                cache.put(key, frame.clone(), result)
+            return cast("R", result.clone() if isinstance(result, pl.DataFrame) else result)
+
+        wrapper.cache_info = cache.cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.cache_clear  # type: ignore[attr-defined]
+        return update_wrapper(wrapper, transform)
+
+    return decorator
+
+
+def _freeze(value: object) -> Hashable:
+    """Convert lists of column names to tuples to use them in cache keys."""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+__all__ = ["DEFAULT_MAXSIZE", "CacheInfo", "FrameCache", "frame_cache", "frame_digest"]
@@ -0,0 +1,380 @@
+"""Compositions of materials presented with NumPy arrays.
+
+A DataFrame per material is convenient, but for materials of a few nuclides
+the overhead of DataFrame construction dominates the arithmetic.
+:class:`Composition` keeps atomic numbers, mass numbers (0 for natural elements)
+and fractions in contiguous read-only NumPy arrays sorted by ZA codes.
+The conversion to and from the DataFrame layout of
+:func:`~mckit_nuclides.elements.from_molecular_formula` doesn't copy the arrays.
+
+Examples
+--------
+    >>> water = Composition.from_formula("H2O")
+    >>> water
+    Composition(1000: 0.666667, 8000: 0.333333)
+    >>> water.to_mass()
+    Composition(1000: 0.111907, 8000: 0.888093, mass_fraction=True)
+    >>> water.expand_natural().za
+    array([1001, 1002, 8016, 8017, 8018], dtype=int32)
+    >>> print(water.to_frame())
+    shape: (2, 3)
+    ┌───────────────┬─────────────┬──────────┐
+    │ atomic_number ┆ mass_number ┆ fraction │
+    │ ---           ┆ ---         ┆ ---      │
+    │ u8            ┆ u16         ┆ f64      │
+    ╞═══════════════╪═════════════╪══════════╡
+    │ 1             ┆ 0           ┆ 0.666667 │
+    │ 8             ┆ 0           ┆ 0.333333 │
+    └───────────────┴─────────────┴──────────┘
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, Self
+
+import numpy as np
+import polars as pl
+
+from mckit_nuclides._formulas import molar_masses, parse_formula
+from mckit_nuclides._natural import (
+    expand_natural_arrays,
+    natural_isotopes_index,
+    natural_mass_shares,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+
+_ZA_FACTOR: Final = 1000
+"""Multiplier for atomic number in ZA codes: ZA = Z * 1000 + A."""
+
+_MAX_ATOMIC_NUMBER: Final = int(np.iinfo(np.uint8).max)
+"""The largest atomic number, which can be stored in a composition."""
+
+
+class Composition:
+    """Fractions of nuclides and natural elements in a material.
+
+    The nuclides are sorted by ZA codes, the fractions of repeated nuclides are summed up.
+    The arrays are read only: the compositions are immutable and hashable.
+
+    Args:
+        atomic_numbers: Z
+        mass_numbers: A, 0 for natural elements
+        fractions: fractions by atoms or by mass, not necessarily normalized
+        mass_fraction: the fractions are by mass, otherwise by atoms
+
+    Raises
+    ------
+        ValueError: if the arrays are not one-dimensional of the same length,
+            or atomic or mass numbers are out of range of ZA codes.
+    """
+
+    __slots__ = ("_hash", "atomic_numbers", "fractions", "mass_fraction", "mass_numbers")
+
+    atomic_numbers: npt.NDArray[np.uint8]
+    mass_numbers: npt.NDArray[np.uint16]
+    fractions: npt.NDArray[np.float64]
+    mass_fraction: bool
+
+    def __init__(
+        self,
+        atomic_numbers: npt.ArrayLike,
+        mass_numbers: npt.ArrayLike,
+        fractions: npt.ArrayLike,
+        *,
+        mass_fraction: bool = False,
+    ) -> None:
+        z = np.asarray(atomic_numbers)
+        a = np.asarray(mass_numbers)
+        f = np.asarray(fractions, dtype=np.float64)
+        if z.ndim != 1 or z.shape != a.shape or z.shape != f.shape:
+            msg = (
+                "Expected one-dimensional arrays of the same length, "
+                f"got shapes {z.shape}, {a.shape}, {f.shape}"
+            )
+            raise ValueError(msg)
+        if ((z < 0) | (z > _MAX_ATOMIC_NUMBER)).any() or ((a < 0) | (a >= _ZA_FACTOR)).any():
+            msg = (
+                f"Expected atomic numbers in [0, {_MAX_ATOMIC_NUMBER}] "
+                f"and mass numbers in [0, {_ZA_FACTOR})"
+            )
+            raise ValueError(msg)
+        z = z.astype(np.uint8, copy=False)
+        a = a.astype(np.uint16, copy=False)
+        za = _za(z, a)
+        if za.size > 1 and not (za[1:] > za[:-1]).all():
+            za, inverse = np.unique(za, return_inverse=True)
+            z, a = np.divmod(za, _ZA_FACTOR)
+            f = np.bincount(inverse, weights=f, minlength=za.size)
+        self.atomic_numbers = _read_only(z, np.uint8)
+        self.mass_numbers = _read_only(a, np.uint16)
+        self.fractions = _read_only(f, np.float64)
+        self.mass_fraction = mass_fraction
+        self._hash: int | None = None
+
+    @classmethod
+    def from_frame(
+        cls, frame: pl.DataFrame, fraction_column: str = "fraction", *, mass_fraction: bool = False
+    ) -> Self:
+        """Create composition from DataFrame with columns atomic_number, mass_number and fractions.
+
+        The columns are not copied, if they have the types UInt8, UInt16 and Float64,
+        no nulls and the rows are sorted, as in the results of
+        :func:`~mckit_nuclides.elements.from_molecular_formula` and
+        :func:`~mckit_nuclides.abundance.expand_df_natural_presence`.
+
+        Args:
+            frame: the composition as DataFrame
+            fraction_column: name of column presenting fraction
+            mass_fraction: the fractions are by mass, otherwise by atoms
+
+        Returns
+        -------
+            The composition.
+        """
+        return cls(
+            frame["atomic_number"].to_numpy(),
+            frame["mass_number"].to_numpy(),
+            frame[fraction_column].to_numpy(),
+            mass_fraction=mass_fraction,
+        )
+
+    @classmethod
+    def from_formula(cls, formula: str, *, mass_fraction: bool = False) -> Composition:
+        """Create composition from chemical formula.
+
+        See :func:`~mckit_nuclides.elements.from_molecular_formula` on the formula syntax.
+
+        Args:
+            formula: ... H2O, C2H5OH, etc.
+            mass_fraction: define mass fractions instead of atomic (default)
+
+        Returns
+        -------
+            The normalized composition.
+        """
+        atomic_numbers, mass_numbers, atoms = parse_formula(formula)
+        composition = cls(atomic_numbers, mass_numbers, atoms).normalize()
+        return composition.to_mass() if mass_fraction else composition
+
+    def to_frame(self, fraction_column: str = "fraction") -> pl.DataFrame:
+        """Present the composition as DataFrame without copying the arrays.
+
+        Args:
+            fraction_column: name for the fractions column
+
+        Returns
+        -------
+            DataFrame with columns atomic_number, mass_number and fractions.
+        """
+        return pl.DataFrame(
+            [
+                pl.Series("atomic_number", self.atomic_numbers),
+                pl.Series("mass_number", self.mass_numbers),
+                pl.Series(fraction_column, self.fractions),
+            ]
+        )
+
+    @property
+    def za(self) -> npt.NDArray[np.int32]:
+        """ZA codes of the nuclides: Z * 1000 + A."""
+        return _za(self.atomic_numbers, self.mass_numbers)
+
+    def normalize(self) -> Composition:
+        """Scale the fractions to have sum 1.0.
+
+        Returns
+        -------
+            The normalized composition.
+        """
+        return self._with(
+            self.atomic_numbers, self.mass_numbers, self.fractions / self.fractions.sum()
+        )
+
+    def expand_natural(self) -> Composition:
+        """Substitute natural elements (mass number 0) with their isotopes.
+
+        The elements without natural isotopes are dropped.
+
+        Returns
+        -------
+            The composition of nuclides.
+        """
+        if self.mass_numbers.all():
+            return self
+        if self.mass_fraction:
+            shares = natural_mass_shares()
+        else:
+            _, _, shares = natural_isotopes_index()
+        z, a, f = expand_natural_arrays(
+            self.atomic_numbers.astype(np.intp),
+            self.mass_numbers.astype(np.intp),
+            self.fractions,
+            shares,
+        )
+        return Composition(z, a, f, mass_fraction=self.mass_fraction)
+
+    def to_atomic(self) -> Composition:
+        """Convert fractions by mass to normalized fractions by atoms.
+
+        Raises
+        ------
+            KeyError: if an element or nuclide is unknown.
+
+        Returns
+        -------
+            The composition with atomic fractions, itself if the fractions are atomic.
+        """
+        if not self.mass_fraction:
+            return self
+        fractions = self.fractions / self._molar_masses()
+        return self._with(
+            self.atomic_numbers, self.mass_numbers, fractions / fractions.sum(), mass_fraction=False
+        )
+
+    def to_mass(self) -> Composition:
+        """Convert fractions by atoms to normalized fractions by mass.
+
+        Raises
+        ------
+            KeyError: if an element or nuclide is unknown.
+
+        Returns
+        -------
+            The composition with mass fractions, itself if the fractions are by mass.
+        """
+        if self.mass_fraction:
+            return self
+        fractions = self.fractions * self._molar_masses()
+        return self._with(
+            self.atomic_numbers, self.mass_numbers, fractions / fractions.sum(), mass_fraction=True
+        )
+
+    @staticmethod
+    def mix(components: Iterable[tuple[Composition, float]]) -> Composition:
+        """Mix normalized compositions with weights.
+
+        The weights are by mass or by atoms, as the fractions in the compositions.
+
+        Args:
+            components: compositions and their weights
+
+        Examples
+        --------
+            >>> hydrogen = Composition([1], [1], [1.0])
+            >>> water = Composition([1, 8], [1, 16], [2.0, 1.0])
+            >>> Composition.mix([(hydrogen, 2.0), (water, 1.0)])
+            Composition(1001: 0.888889, 8016: 0.111111)
+
+        Raises
+        ------
+            ValueError: if there are no components or the fractions are of different kinds.
+
+        Returns
+        -------
+            The normalized mixture.
+        """
+        components = list(components)
+        if not components:
+            msg = "Nothing to mix"
+            raise ValueError(msg)
+        mass_fraction = components[0][0].mass_fraction
+        if any(c.mass_fraction != mass_fraction for c, _ in components):
+            msg = "Cannot mix compositions with mass and atomic fractions"
+            raise ValueError(msg)
+        mixture = Composition(
+            np.concatenate([c.atomic_numbers for c, _ in components]),
+            np.concatenate([c.mass_numbers for c, _ in components]),
+            np.concatenate([c.fractions * (w / c.fractions.sum()) for c, w in components]),
+            mass_fraction=mass_fraction,
+        )
+        return mixture.normalize()
+
+    def _with(
+        self,
+        atomic_numbers: npt.NDArray[np.uint8],
+        mass_numbers: npt.NDArray[np.uint16],
+        fractions: npt.NDArray[np.float64],
+        *,
+        mass_fraction: bool | None = None,
+    ) -> Composition:
+        """Create composition with the sorted unique nuclides bypassing the checks."""
+        result = Composition.__new__(Composition)
+        result.atomic_numbers = atomic_numbers
+        result.mass_numbers = mass_numbers
+        result.fractions = _read_only(fractions, np.float64)
+        result.mass_fraction = self.mass_fraction if mass_fraction is None else mass_fraction
+        result._hash = None  # noqa: SLF001
+        return result
+
+    def _molar_masses(self) -> npt.NDArray[np.float32]:
+        return molar_masses(self.atomic_numbers, self.mass_numbers)
+
+    def __reduce__(self) -> tuple[object, ...]:
+        """Pickle the arrays, the unpickled composition is read only as well."""
+        arrays = (self.atomic_numbers, self.mass_numbers, self.fractions)
+        return _restore, (*arrays, self.mass_fraction)
+
+    def __len__(self) -> int:
+        """Get the number of nuclides and natural elements."""
+        return self.atomic_numbers.size
+
+    def __eq__(self, other: object) -> bool:
+        """Check if the compositions have the same nuclides and fractions of the same kind."""
+        if not isinstance(other, Composition):
+            return NotImplemented
+        return (
+            self.mass_fraction == other.mass_fraction
+            and np.array_equal(self.atomic_numbers, other.atomic_numbers)
+            and np.array_equal(self.mass_numbers, other.mass_numbers)
+            and np.array_equal(self.fractions, other.fractions)
+        )
+
+    def __hash__(self) -> int:
+        """Hash the content, the hash is computed once."""
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self.mass_fraction,
+                    self.atomic_numbers.tobytes(),
+                    self.mass_numbers.tobytes(),
+                    self.fractions.tobytes(),
+                )
+            )
+        return self._hash
+
+    def __repr__(self) -> str:
+        """Present the composition as ZA codes and fractions."""
+        items = ", ".join(
+            f"{za}: {f:g}" for za, f in zip(self.za.tolist(), self.fractions.tolist(), strict=True)
+        )
+        kind = ", mass_fraction=True" if self.mass_fraction else ""
+        return f"{type(self).__name__}({items}{kind})"
+
+
+def _restore(
+    atomic_numbers: npt.NDArray[np.uint8],
+    mass_numbers: npt.NDArray[np.uint16],
+    fractions: npt.NDArray[np.float64],
+    mass_fraction: bool,  # noqa: FBT001
+) -> Composition:
+    return Composition(atomic_numbers, mass_numbers, fractions, mass_fraction=mass_fraction)
+
+
+def _za(
+    atomic_numbers: npt.NDArray[np.integer], mass_numbers: npt.NDArray[np.integer]
+) -> npt.NDArray[np.int32]:
+    return atomic_numbers.astype(np.int32) * _ZA_FACTOR + mass_numbers
+
+
+def _read_only[T: np.generic](array: npt.NDArray[np.generic], dtype: type[T]) -> npt.NDArray[T]:
+    """Present the values as read only array, the view doesn't change the source array flags."""
+    view = np.ascontiguousarray(array, dtype=dtype).view()
+    view.setflags(write=False)
+    return view
+
+
+__all__ = ["Composition"]
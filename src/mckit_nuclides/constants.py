@@ -22,3 +22,6 @@ NEUTRON_MASS_IN_MEV: Final = 939.565_421_94
 
 NEUTRON_HALF_LIFE: Final = 611.0
 """Neutron half-life time, seconds."""
+
+BARN: Final = 1e-24
+"""Barn in cm^2, number densities are presented in atoms per barn-cm."""
@@ -0,0 +1,243 @@
+"""Conversion of compositions between mass and atomic fractions and number densities.
+
+The conversions use molar masses from :data:`~mckit_nuclides.abundance.MOLAR_MASS_TABLE`.
+Join the molar masses once with :func:`with_molar_mass` to convert a batch of materials
+several times: the functions reuse column "molar_mass", if it is present.
+
+Number densities are presented in column "number_density" in atoms per barn-cm,
+densities - in g/cm^3.
+
+Examples
+--------
+    >>> import polars as pl
+    >>> from mckit_nuclides.elements import from_molecular_formula
+    >>> water = with_molar_mass(from_molecular_formula("H2O"))
+    >>> water = convert_to_number_density(water, 1.0)
+    >>> print(convert_to_mass_fraction(water).drop("molar_mass"))
+    shape: (2, 4)
+    ┌───────────────┬─────────────┬──────────┬────────────────┐
+    │ atomic_number ┆ mass_number ┆ fraction ┆ number_density │
+    │ ---           ┆ ---         ┆ ---      ┆ ---            │
+    │ u8            ┆ u16         ┆ f64      ┆ f64            │
+    ╞═══════════════╪═════════════╪══════════╪════════════════╡
+    │ 1             ┆ 0           ┆ 0.111907 ┆ 0.066857       │
+    │ 8             ┆ 0           ┆ 0.888093 ┆ 0.033428       │
+    └───────────────┴─────────────┴──────────┴────────────────┘
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+import polars as pl
+
+from mckit_nuclides import _frames, abundance
+from mckit_nuclides.abundance import normalize_column
+from mckit_nuclides.constants import AVOGADRO, BARN
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_MASS_SHARE: Final = "__mass_share__"
+"""Temporary column for normalized mass fractions."""
+
+_NUMBER_DENSITY_FACTOR: Final = AVOGADRO * BARN
+"""Converts density (g/cm^3) divided by molar mass to atoms per barn-cm."""
+
+
+def with_molar_mass[Frame: (pl.DataFrame, pl.LazyFrame)](composition: Frame) -> Frame:
+    """Add column "molar_mass" to a composition.
+
+    Nuclides absent in the molar masses table are dropped.
+
+    Args:
+        composition: DataFrame or LazyFrame with columns atomic_number, mass_number (0 for
+            natural elements)
+
+    Returns
+    -------
+        The composition with molar masses, the composition itself if the column is present.
+    """
+    return _frames.with_molar_mass(composition, abundance.MOLAR_MASS_TABLE)
+
+
+def convert_to_mass_fraction[Frame: (pl.DataFrame, pl.LazyFrame)](
+    composition: Frame,
+    fraction_column: str = "fraction",
+    *,
+    by: str | Sequence[str] | None = None,
+) -> Frame:
+    """Change fractions by atoms to fractions by mass.
+
+    This is the inverse of :func:`~mckit_nuclides.abundance.convert_to_atomic_fraction`.
+
+    Args:
+        composition: DataFrame or LazyFrame with columns atomic_number, mass_number
+        fraction_column: name of column presenting fraction
+        by: key columns to normalize fractions separately for each group, material id, for example
+
+    Returns
+    -------
+        The composition with modified fraction column.
+    """
+    columns = composition.collect_schema().names()
+    converted = with_molar_mass(composition).with_columns(
+        (pl.col(fraction_column) * pl.col("molar_mass")).alias(fraction_column)
+    )
+    return normalize_column(converted, fraction_column, by=by).select(columns)
+
+
+def convert_to_number_density[Frame: (pl.DataFrame, pl.LazyFrame)](
+    composition: Frame,
+    density: float | str,
+    fraction_column: str = "fraction",
+    *,
+    mass_fraction: bool = False,
+    by: str | Sequence[str] | None = None,
+) -> Frame:
+    """Compute number densities of nuclides in materials, atoms per barn-cm.
+
+    Args:
+        composition: DataFrame or LazyFrame with columns atomic_number, mass_number and fractions,
+            the fractions are normalized in each material
+        density: density, g/cm^3, either the same for all the materials or column name
+        fraction_column: name of column presenting fraction
+        mass_fraction: the fractions are by mass, otherwise by atoms
+        by: key columns to identify materials, material id, for example
+
+    Returns
+    -------
+        The composition with added column "number_density".
+    """
+    columns = composition.collect_schema().names()
+    with_masses = with_molar_mass(composition)
+    mass_share = pl.col(fraction_column)
+    if not mass_fraction:
+        mass_share = mass_share * pl.col("molar_mass")
+    shares = normalize_column(
+        with_masses.with_columns(mass_share.alias(_MASS_SHARE)), _MASS_SHARE, by=by
+    )
+    _density = pl.col(density) if isinstance(density, str) else pl.lit(density)
+    return shares.with_columns(
+        (_density * _NUMBER_DENSITY_FACTOR * pl.col(_MASS_SHARE) / pl.col("molar_mass")).alias(
+            "number_density"
+        )
+    ).select(*columns, "number_density")
+
+
+def convert_from_number_density[Frame: (pl.DataFrame, pl.LazyFrame)](
+    composition: Frame,
+    *,
+    by: str | Sequence[str] | None = None,
+    fraction_column: str = "fraction",
+    density_column: str = "density",
+) -> Frame:
+    """Compute atomic fractions and densities of materials from number densities.
+
+    This is the inverse of :func:`convert_to_number_density`.
+
+    Args:
+        composition: DataFrame or LazyFrame with columns atomic_number, mass_number and
+            number_density, atoms per barn-cm
+        by: key columns to identify materials, material id, for example
+        fraction_column: name for the column with atomic fractions
+        density_column: name for the column with densities of the materials, g/cm^3
+
+    Returns
+    -------
+        The composition with added fraction and density columns.
+    """
+    columns = [
+        c
+        for c in composition.collect_schema().names()
+        if c not in (fraction_column, density_column)
+    ]
+    keys = _frames.as_list(by)
+    with_masses = with_molar_mass(composition)
+    number_density = pl.col("number_density")
+    mass_density = number_density * pl.col("molar_mass") / _NUMBER_DENSITY_FACTOR
+    if keys:
+        totals = with_masses.group_by(keys).agg(
+            number_density.sum().alias(_frames.TOTAL), mass_density.sum().alias(density_column)
+        )
+        joined = with_masses.join(
+            totals, on=keys, how="left", maintain_order="left", nulls_equal=True
+        )
+    else:
+        joined = with_masses.with_columns(
+            number_density.sum().alias(_frames.TOTAL), mass_density.sum().alias(density_column)
+        )
+    return joined.with_columns(
+        (number_density / pl.col(_frames.TOTAL)).alias(fraction_column)
+    ).select(*columns, fraction_column, density_column)
+
+
+def mix_by_volume[Frame: (pl.DataFrame, pl.LazyFrame)](
+    number_densities: Frame,
+    volume_fractions: Frame,
+    on: str | Sequence[str] = "material",
+    *,
+    by: str | Sequence[str] | None = None,
+    volume_fraction_column: str = "volume_fraction",
+) -> Frame:
+    """Mix materials by volume fractions.
+
+    Number densities of the mixture are the sums of the number densities of the components
+    weighted with the volume fractions. The fractions are not normalized: the rest of volume
+    is void.
+
+    Args:
+        number_densities: DataFrame or LazyFrame with columns atomic_number, mass_number and
+            number_density of the materials, atoms per barn-cm
+        volume_fractions: DataFrame or LazyFrame with columns `by`, `on` and volume fractions
+        on: key columns to identify materials
+        by: key columns to identify mixtures
+        volume_fraction_column: name of column presenting volume fractions
+
+    Examples
+    --------
+        >>> materials = pl.DataFrame(
+        ...     {
+        ...         "material": [1, 1, 2],
+        ...         "atomic_number": [1, 8, 26],
+        ...         "mass_number": [0, 0, 0],
+        ...         "number_density": [0.0669, 0.0334, 0.0849],
+        ...     }
+        ... )
+        >>> volume_fractions = pl.DataFrame({"material": [1, 2], "volume_fraction": [0.4, 0.6]})
+        >>> print(mix_by_volume(materials, volume_fractions))
+        shape: (3, 3)
+        ┌───────────────┬─────────────┬────────────────┐
+        │ atomic_number ┆ mass_number ┆ number_density │
+        │ ---           ┆ ---         ┆ ---            │
+        │ i64           ┆ i64         ┆ f64            │
+        ╞═══════════════╪═════════════╪════════════════╡
+        │ 1             ┆ 0           ┆ 0.02676        │
+        │ 8             ┆ 0           ┆ 0.01336        │
+        │ 26            ┆ 0           ┆ 0.05094        │
+        └───────────────┴─────────────┴────────────────┘
+
+    Returns
+    -------
+        Number densities of the mixtures, sorted by `by`, atomic and mass numbers.
+    """
+    keys = [*_frames.as_list(by), "atomic_number", "mass_number"]
+    aggregations = [pl.col("number_density").sum()]
+    if "molar_mass" in number_densities.collect_schema().names():
+        aggregations.append(pl.col("molar_mass").first())
+    return (
+        number_densities.join(volume_fractions, on=on)
+        .with_columns(pl.col("number_density") * pl.col(volume_fraction_column))
+        .group_by(keys)
+        .agg(aggregations)
+        .sort(keys)
+    )
+
+
+__all__ = [
+    "convert_from_number_density",
+    "convert_to_mass_fraction",
+    "convert_to_number_density",
+    "mix_by_volume",
+    "with_molar_mass",
+]
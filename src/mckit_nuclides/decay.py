@@ -0,0 +1,223 @@
+"""Decay constants, activities and decay of nuclide inventories.
+
+The decay constants are computed from column ``half_life`` of
+:data:`~mckit_nuclides.nuclides.NUCLIDES_TABLE_PL`, seconds.
+Zero half-life means stable nuclide with zero decay constant,
+null half-life means unknown one: the decay constants and derived values are NaN or null.
+
+The inventories are DataFrames or LazyFrames with columns atomic_number, mass_number,
+optional state and atoms.
+If there's no state column, the nuclides are taken in the lowest state available,
+see :mod:`~mckit_nuclides.nuclides`.
+The nuclide properties are looked up with expressions without joins,
+so, the functions compose into lazy queries on large inventories.
+
+Only decay of the nuclides themselves is accounted: the daughter nuclides are not accumulated.
+
+Examples
+--------
+    >>> import polars as pl
+    >>> inventory = pl.DataFrame(
+    ...     {"atomic_number": [1, 1, 27], "mass_number": [1, 3, 60], "atoms": [1e20, 1e20, 1e20]}
+    ... )
+    >>> print(compute_activity(decay(inventory, 3.15576e7)))
+    shape: (3, 4)
+    ┌───────────────┬─────────────┬───────────┬───────────┐
+    │ atomic_number ┆ mass_number ┆ atoms     ┆ activity  │
+    │ ---           ┆ ---         ┆ ---       ┆ ---       │
+    │ i64           ┆ i64         ┆ f64       ┆ f64       │
+    ╞═══════════════╪═════════════╪═══════════╪═══════════╡
+    │ 1             ┆ 1           ┆ 1.0000e20 ┆ 0.0       │
+    │ 1             ┆ 3           ┆ 9.4533e19 ┆ 1.6840e11 │
+    │ 27            ┆ 60          ┆ 8.7678e19 ┆ 3.6536e11 │
+    └───────────────┴─────────────┴───────────┴───────────┘
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+import math
+
+import numpy as np
+import polars as pl
+
+from mckit_nuclides import nuclides
+from mckit_nuclides._frames import like
+from mckit_nuclides.expressions import NuclidesNamespace
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+    from mckit_nuclides._indexing import MissingPolicy
+
+LN2: Final = math.log(2.0)
+"""Decay constant multiplied by half-life."""
+
+
+def decay_constant(half_life: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Convert half-lives to decay constants.
+
+    Args:
+        half_life: half-lives, seconds, 0 for stable nuclides, NaN for unknown
+
+    Examples
+    --------
+        >>> decay_constant([0.0, math.log(2.0), np.nan])
+        array([ 0.,  1., nan])
+
+    Returns
+    -------
+        Decay constants, 1/s.
+    """
+    _half_life = np.asarray(half_life, dtype=np.float64)
+    return np.divide(LN2, _half_life, out=np.zeros_like(_half_life), where=_half_life != 0.0)
+
+
+def get_decay_constants(
+    z_or_symbols: npt.ArrayLike | pl.Series,
+    mass_numbers: npt.ArrayLike | pl.Series,
+    *,
+    states: npt.ArrayLike | pl.Series | None = None,
+    missing: MissingPolicy = "raise",
+) -> npt.NDArray[np.float64]:
+    """Get decay constants for many nuclides at once.
+
+    Args:
+        z_or_symbols: atomic numbers or chemical symbols as NumPy array, Polars Series or sequence
+        mass_numbers: mass numbers, broadcastable to `z_or_symbols`
+        states: isomer states, broadcastable to `z_or_symbols`, the lowest available by default
+        missing: how to treat unknown nuclides: "raise", "nan", "mask"
+
+    Examples
+    --------
+        >>> get_decay_constants(["H", "H"], [1, 3])
+        array([0.00000000e+00, 1.78138843e-09])
+
+    Raises
+    ------
+        KeyError: if there's unknown nuclide and the policy is "raise".
+
+    Returns
+    -------
+        Decay constants, 1/s, NaN for unknown half-lives.
+    """
+    half_lives = nuclides.get_property_many(
+        z_or_symbols, mass_numbers, "half_life", states=states, missing=missing
+    )
+    if isinstance(half_lives, np.ma.MaskedArray):
+        return np.ma.masked_array(decay_constant(half_lives.filled(np.nan)), mask=half_lives.mask)
+    return decay_constant(half_lives)
+
+
+def decay_constant_expr(
+    atomic_number: pl.Expr | str = "atomic_number",
+    mass_number: pl.Expr | str = "mass_number",
+    state: pl.Expr | str | None = None,
+) -> pl.Expr:
+    """Create expression computing decay constants of nuclides, 1/s.
+
+    Args:
+        atomic_number: expression or column name for atomic numbers
+        mass_number: expression or column name for mass numbers
+        state: expression or column name for isomer states, the lowest available by default
+
+    Returns
+    -------
+        Expression "decay_constant", null for unknown nuclides and half-lives.
+    """
+    _atomic_number = pl.col(atomic_number) if isinstance(atomic_number, str) else atomic_number
+    half_life = NuclidesNamespace(_atomic_number).half_life(mass_number, state)
+    # stable nuclides have infinite half-lives, this avoids one more reference to the lookup
+    return (LN2 / half_life.replace(0.0, math.inf)).alias("decay_constant")
+
+
+def with_decay_constant[Frame: (pl.DataFrame, pl.LazyFrame)](inventory: Frame) -> Frame:
+    """Add column "decay_constant" to an inventory.
+
+    Args:
+        inventory: DataFrame or LazyFrame with columns atomic_number, mass_number
+            and optional state
+
+    Returns
+    -------
+        The inventory with decay constants, 1/s, the inventory itself if the column is present.
+    """
+    columns = inventory.collect_schema().names()
+    if "decay_constant" in columns:
+        return inventory
+    state = "state" if "state" in columns else None
+    return inventory.with_columns(decay_constant_expr(state=state))
+
+
+def compute_activity[Frame: (pl.DataFrame, pl.LazyFrame)](
+    inventory: Frame, atoms_column: str = "atoms"
+) -> Frame:
+    """Compute activities of nuclides in an inventory, Bq.
+
+    Args:
+        inventory: DataFrame or LazyFrame with columns atomic_number, mass_number,
+            optional state and number of atoms
+        atoms_column: name of the column with number of atoms
+
+    Returns
+    -------
+        The inventory with added column "activity", null for unknown half-lives.
+    """
+    columns = inventory.collect_schema().names()
+    return (
+        with_decay_constant(inventory)
+        .with_columns((pl.col("decay_constant") * pl.col(atoms_column)).alias("activity"))
+        .select(*columns, "activity")
+    )
+
+
+def decay[Frame: (pl.DataFrame, pl.LazyFrame)](
+    inventory: Frame, time: float | Sequence[float] | str, atoms_column: str = "atoms"
+) -> Frame:
+    """Compute numbers of atoms remaining after decay.
+
+    Args:
+        inventory: DataFrame or LazyFrame with columns atomic_number, mass_number,
+            optional state and number of atoms
+        time: decay time, seconds: the same for all the rows (Python or NumPy number),
+            column name or sequence of times,
+            in the latter case the inventory is repeated for each time in added column "time"
+        atoms_column: name of the column with number of atoms
+
+    Examples
+    --------
+        >>> inventory = pl.DataFrame({"atomic_number": [1], "mass_number": [3], "atoms": [1e20]})
+        >>> decay(inventory, [0.0, 1e9])["atoms"].to_list()
+        [1e+20, 1.6840416752887566e+19]
+
+    Returns
+    -------
+        The inventory with decayed numbers of atoms, null for unknown half-lives.
+    """
+    columns: list[str] = inventory.collect_schema().names()
+    inventory = with_decay_constant(inventory)
+    if isinstance(time, str):
+        _time = pl.col(time)
+    elif isinstance(time, int | float | np.number):
+        _time = pl.lit(float(time))
+    else:
+        times = pl.DataFrame({"time": pl.Series(time, dtype=pl.Float64)})
+        inventory = inventory.join(like(times, inventory), how="cross")
+        columns = [*columns, "time"]
+        _time = pl.col("time")
+    remaining = pl.col(atoms_column) * (-pl.col("decay_constant") * _time).exp()
+    return inventory.with_columns(remaining.alias(atoms_column)).select(columns)
+
+
+__all__ = [
+    "LN2",
+    "compute_activity",
+    "decay",
+    "decay_constant",
+    "decay_constant_expr",
+    "get_decay_constants",
+    "with_decay_constant",
+]
@@ -2,45 +2,118 @@
 
 from __future__ import annotations
 
-from typing import Final, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 
-import re
-
-from collections import defaultdict
+from functools import cache
 from pathlib import Path
 
 import numpy as np
 import polars as pl
 
+from mckit_nuclides._formulas import CHEMICAL_FORMULA_TOKEN, molar_masses, parse_formula
+from mckit_nuclides._hooks import instrumented, instrumented_cache
+from mckit_nuclides._indexing import (
+    as_keys,
+    find_row,
+    find_rows,
+    gather,
+    make_dense_index,
+)
+from mckit_nuclides._loading import cached_arrays, cached_json, read_table, scan_table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    import numpy.typing as npt
+
+    from mckit_nuclides._indexing import MissingPolicy
+
 HERE = Path(__file__).parent
 
 
 TableValue = int | float | str | None
 
 ELEMENTS_PARQUET: Final[Path] = HERE / "data/elements.parquet"
-ELEMENTS_TABLE_PL: Final[pl.DataFrame] = pl.read_parquet(ELEMENTS_PARQUET)
+ELEMENTS_IPC: Final[Path] = HERE / "data/elements.arrow"
 
-# noinspection PyTypeChecker
-Z_TO_SYMBOL: Final[dict[int, str]] = dict(
-    ELEMENTS_TABLE_PL.select("atomic_number", "symbol").iter_rows()
-)
+_SORTED_BY: Final = ("atomic_number",)
+"""The table key, the rows are sorted by it."""
+
+if TYPE_CHECKING:
+    # The tables are loaded on first access, see __getattr__ below
+    ELEMENTS_TABLE_PL: pl.DataFrame
+    Z_TO_SYMBOL: dict[int, str]
+    SYMBOL_TO_Z: dict[str, int]
+
+
+@instrumented_cache
+@cache
+def _elements_table() -> pl.DataFrame:
+    return read_table("elements", ELEMENTS_PARQUET, ELEMENTS_IPC, _SORTED_BY)
+
+
+@instrumented_cache
+@cache
+def _z_to_symbol() -> dict[int, str]:
+    return {_z: _symbol for _symbol, _z in _symbol_to_z().items()}
+
+
+@instrumented_cache
+@cache
+def _symbol_to_z() -> dict[str, int]:
+    # noinspection PyTypeChecker
+    return cached_json(
+        "symbol_to_z",
+        lambda: dict(_elements_table().select("symbol", "atomic_number").iter_rows()),
+    )
+
+
+@instrumented_cache
+@cache
+def _z_to_row() -> npt.NDArray[np.int32]:
+    """Row numbers in ELEMENTS_TABLE_PL by atomic number."""
+    (index,) = cached_arrays(
+        "elements_index", lambda: (make_dense_index(_elements_table()["atomic_number"]),)
+    )
+    return cast("npt.NDArray[np.int32]", index)
 
-# noinspection PyTypeChecker
-SYMBOL_TO_Z: Final[dict[str, int]] = dict(
-    ELEMENTS_TABLE_PL.select("symbol", "atomic_number").iter_rows()
-)
 
-CHEMICAL_FORMULA_ELEMENT_SPEC: Final = re.compile(r"(?P<symbol>[A-Z][a-z]?)(?P<atoms>\d+)?")
-"""Regex pattern to recognize one element parts in a chemical formula.
+_LAZY_ATTRIBUTES: Final[dict[str, Callable[[], object]]] = {
+    "ELEMENTS_TABLE_PL": _elements_table,
+    "SYMBOL_TO_Z": _symbol_to_z,
+    "Z_TO_SYMBOL": _z_to_symbol,
+}
 
-    The pattern recognizes capitalized chemical symbols and an optional atom per molecule numbers.
 
-    Examples:
-        >>> CHEMICAL_FORMULA_ELEMENT_SPEC.findall("H2O")
-        ["H2", "O"]
-"""
+def __getattr__(name: str) -> object:
+    """Load the tables on first access to the module attributes."""
+    loader = _LAZY_ATTRIBUTES.get(name)
+    if loader is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return loader()
 
 
+@instrumented
+def scan_elements() -> pl.LazyFrame:
+    """Scan the elements table lazily.
+
+    The table is sorted and marked sorted by atomic number.
+    Filters on atomic number are pushed down to the data file reader.
+
+    Examples
+    --------
+        >>> scan_elements().filter(atomic_number=26).select("symbol").collect().item()
+        'Fe'
+
+    Returns
+    -------
+        LazyFrame with the same content as ELEMENTS_TABLE_PL.
+    """
+    return scan_table("elements", ELEMENTS_PARQUET, ELEMENTS_IPC, _SORTED_BY)
+
+
+@instrumented
 def atomic_number(_symbol: str) -> int:
     """Get atomic number (Z) for an element.
 
@@ -51,13 +124,14 @@ def atomic_number(_symbol: str) -> int:
     -------
         int: Z - the atomic number for the element.
     """
-    return SYMBOL_TO_Z[_symbol]
+    return _symbol_to_z()[_symbol]
 
 
 z = atomic_number
 """Synonym to atomic_number."""
 
 
+@instrumented
 def symbol(_atomic_number: int) -> str:
     """Get chemical symbol for a given Z (atomic number).
 
@@ -68,9 +142,10 @@ def symbol(_atomic_number: int) -> str:
     -------
         str: Chemical symbol
     """
-    return Z_TO_SYMBOL[_atomic_number]
+    return _z_to_symbol()[_atomic_number]
 
 
+@instrumented
 def get_property(z_or_symbol: int | str, column: str) -> TableValue:
     """Get column value for an element specified with atomic number or symbol.
 
@@ -86,18 +161,65 @@ def get_property(z_or_symbol: int | str, column: str) -> TableValue:
     -------
         The column value for the given element.
     """
-    _z = SYMBOL_TO_Z[z_or_symbol] if isinstance(z_or_symbol, str) else z_or_symbol
+    _z = _symbol_to_z()[z_or_symbol] if isinstance(z_or_symbol, str) else z_or_symbol
+    return _column_values(column)[find_row(_z_to_row(), _z)]
+
+
+@instrumented
+def get_property_many(
+    z_or_symbols: npt.ArrayLike | pl.Series,
+    column: str,
+    *,
+    missing: MissingPolicy = "raise",
+) -> npt.NDArray[Any]:
+    """Get column values for many elements at once.
+
+    Args:
+        z_or_symbols: atomic numbers or chemical symbols as NumPy array, Polars Series or sequence
+        column: column name in ELEMENTS_TABLE
+        missing: how to treat unknown elements: "raise", "nan", "mask"
+
+    Examples
+    --------
+        >>> get_property_many(np.array([1, 8, 92]), "symbol")
+        array(['H', 'O', 'U'], dtype=object)
+        >>> get_property_many(pl.Series(["H", "O"]), "period")
+        array([1, 2], dtype=uint8)
+        >>> get_property_many([1, 200], "molar_mass", missing="nan")
+        array([1.008, nan], dtype=float32)
+
+    Raises
+    ------
+        KeyError: if the column is unknown or there's unknown element and the policy is "raise".
+
+    Returns
+    -------
+        The column values for the given elements.
+    """
+    keys = as_keys(z_or_symbols, _symbol_to_z())
+    rows = find_rows(_z_to_row(), keys)
+    return gather(_column_array(column), rows, missing, z_or_symbols)
+
+
+@instrumented_cache
+@cache
+def _column_values(column: str) -> list[TableValue]:
     try:
-        return cast(
-            "TableValue",
-            ELEMENTS_TABLE_PL.filter(atomic_number=_z).select(column).item(),
-        )
+        return _elements_table().get_column(column).to_list()
     except pl.exceptions.ColumnNotFoundError as ex:
-        raise KeyError from ex
-    except ValueError as ex:
-        raise KeyError from ex
+        raise KeyError(column) from ex
 
 
+@instrumented_cache
+@cache
+def _column_array(column: str) -> npt.NDArray[Any]:
+    try:
+        return _elements_table().get_column(column).to_numpy()
+    except pl.exceptions.ColumnNotFoundError as ex:
+        raise KeyError(column) from ex
+
+
+@instrumented
 def atomic_mass(z_or_symbol: int | str) -> float:
     """Get standard atomic mass for and Element by atomic number.
 
@@ -111,6 +233,7 @@ def atomic_mass(z_or_symbol: int | str) -> float:
     return cast("float", get_property(z_or_symbol, "molar_mass"))
 
 
+@instrumented
 def name(z_or_symbol: int | str) -> str:
     """Get standard atomic mass for and Element by atomic number.
 
@@ -124,12 +247,22 @@ def name(z_or_symbol: int | str) -> str:
     return cast("str", get_property(z_or_symbol, "name"))
 
 
+@instrumented
 def from_molecular_formula(formula: str, *, mass_fraction: bool = False) -> pl.DataFrame:
     """Create dataframe for material from chemical formula.
 
-    Minimalistic parser for chemical formula to define compositions on the fly.
+    Parser for chemical formula to define compositions on the fly.
 
     Symbols of elements are to be in capitalized form: Ge, Si...
+    The formula may contain:
+
+    - groups in parentheses or square brackets: Ca(OH)2, K4[Fe(CN)6]
+    - adduct parts separated with "·" or "*": CuSO4·5H2O
+    - decimal numbers of atoms: UO2.02
+    - isotopes: D and T for hydrogen isotopes or mass number with caret prefix: ^6LiF, ^10B4C;
+      note that "Li6" means six atoms of lithium
+
+    Zero numbers of atoms and multipliers are not allowed.
 
     Args:
         formula: ... H20, C2H5OH, etc.
@@ -138,69 +271,147 @@ def from_molecular_formula(formula: str, *, mass_fraction: bool = False) -> pl.D
     Examples
     --------
         >>> print(from_molecular_formula("H2O"))
-        shape: (2, 2)
-        ┌───────────────┬──────────┐
-        │ atomic_number ┆ fraction │
-        │ ---           ┆ ---      │
-        │ u8            ┆ f64      │
-        ╞═══════════════╪══════════╡
-        │ 1             ┆ 0.666667 │
-        │ 8             ┆ 0.333333 │
-        └───────────────┴──────────┘
+        shape: (2, 3)
+        ┌───────────────┬─────────────┬──────────┐
+        │ atomic_number ┆ mass_number ┆ fraction │
+        │ ---           ┆ ---         ┆ ---      │
+        │ u8            ┆ u16         ┆ f64      │
+        ╞═══════════════╪═════════════╪══════════╡
+        │ 1             ┆ 0           ┆ 0.666667 │
+        │ 8             ┆ 0           ┆ 0.333333 │
+        └───────────────┴─────────────┴──────────┘
         >>> print(from_molecular_formula("C2H5OH"))
-        shape: (3, 2)
-        ┌───────────────┬──────────┐
-        │ atomic_number ┆ fraction │
-        │ ---           ┆ ---      │
-        │ u8            ┆ f64      │
-        ╞═══════════════╪══════════╡
-        │ 1             ┆ 0.666667 │
-        │ 6             ┆ 0.222222 │
-        │ 8             ┆ 0.111111 │
-        └───────────────┴──────────┘
+        shape: (3, 3)
+        ┌───────────────┬─────────────┬──────────┐
+        │ atomic_number ┆ mass_number ┆ fraction │
+        │ ---           ┆ ---         ┆ ---      │
+        │ u8            ┆ u16         ┆ f64      │
+        ╞═══════════════╪═════════════╪══════════╡
+        │ 1             ┆ 0           ┆ 0.666667 │
+        │ 6             ┆ 0           ┆ 0.222222 │
+        │ 8             ┆ 0           ┆ 0.111111 │
+        └───────────────┴─────────────┴──────────┘
         >>> print(from_molecular_formula("H2O", mass_fraction=True))
-        shape: (2, 2)
-        ┌───────────────┬──────────┐
-        │ atomic_number ┆ fraction │
-        │ ---           ┆ ---      │
-        │ u8            ┆ f64      │
-        ╞═══════════════╪══════════╡
-        │ 1             ┆ 0.111907 │
-        │ 8             ┆ 0.888093 │
-        └───────────────┴──────────┘
+        shape: (2, 3)
+        ┌───────────────┬─────────────┬──────────┐
+        │ atomic_number ┆ mass_number ┆ fraction │
+        │ ---           ┆ ---         ┆ ---      │
+        │ u8            ┆ u16         ┆ f64      │
+        ╞═══════════════╪═════════════╪══════════╡
+        │ 1             ┆ 0           ┆ 0.111907 │
+        │ 8             ┆ 0           ┆ 0.888093 │
+        └───────────────┴─────────────┴──────────┘
+        >>> print(from_molecular_formula("D2O·^6LiF"))
+        shape: (4, 3)
+        ┌───────────────┬─────────────┬──────────┐
+        │ atomic_number ┆ mass_number ┆ fraction │
+        │ ---           ┆ ---         ┆ ---      │
+        │ u8            ┆ u16         ┆ f64      │
+        ╞═══════════════╪═════════════╪══════════╡
+        │ 1             ┆ 2           ┆ 0.4      │
+        │ 3             ┆ 6           ┆ 0.2      │
+        │ 8             ┆ 0           ┆ 0.2      │
+        │ 9             ┆ 0           ┆ 0.2      │
+        └───────────────┴─────────────┴──────────┘
+
+    Raises
+    ------
+        KeyError: on unknown chemical symbol or isotope.
+        ValueError: if the formula is malformed.
 
     Returns
     -------
-        composition
+        composition, mass number is 0 for elements with natural isotopic composition
     """
-    collector: dict[str, int] = defaultdict(int)
-    for m in CHEMICAL_FORMULA_ELEMENT_SPEC.finditer(formula):
-        ss = m["symbol"]
-        atoms = m["atoms"]
-        atoms = 1 if atoms is None else int(atoms)
-        collector[ss] += atoms
-    symbols = sorted(collector.keys())
-    atomic_numbers = [atomic_number(s) for s in symbols]
+    atomic_numbers, mass_numbers, atoms = parse_formula(formula)
     if mass_fraction:
-        fractions = np.fromiter((collector[s] * atomic_mass(s) for s in symbols), dtype=float)
-        total_mass = fractions.sum()
-        fractions /= total_mass
+        fractions = atoms * molar_masses(atomic_numbers, mass_numbers)
     else:
-        total_atoms = sum(collector.values())
-        fractions = np.fromiter((collector[s] / total_atoms for s in symbols), dtype=float)
-    return (
-        pl.DataFrame(
-            {
-                "atomic_number": atomic_numbers,
-                "fraction": fractions,
-            }
+        fractions = atoms.copy()
+    fractions /= fractions.sum()
+    return pl.DataFrame(
+        {
+            "atomic_number": pl.Series(atomic_numbers, dtype=pl.UInt8),
+            "mass_number": pl.Series(mass_numbers, dtype=pl.UInt16),
+            "fraction": fractions,
+        }
+    )
+
+
+@instrumented
+def from_molecular_formulas(
+    formulas: Iterable[str],
+    *,
+    mass_fraction: bool = False,
+    ids: Iterable[object] | None = None,
+    id_column: str = "formula",
+) -> pl.DataFrame:
+    """Create one long dataframe for many materials from chemical formulas.
+
+    See :func:`from_molecular_formula` on the formulas syntax.
+
+    Args:
+        formulas: ... H20, C2H5OH, etc.
+        mass_fraction: define mass fractions instead of atomic (default)
+        ids: material ids to use in id column, the formulas are used by default
+        id_column: name for the column identifying materials
+
+    Examples
+    --------
+        >>> print(from_molecular_formulas(["H2O", "CO2"], ids=[1, 2], id_column="material"))
+        shape: (4, 4)
+        ┌──────────┬───────────────┬─────────────┬──────────┐
+        │ material ┆ atomic_number ┆ mass_number ┆ fraction │
+        │ ---      ┆ ---           ┆ ---         ┆ ---      │
+        │ i64      ┆ u8            ┆ u16         ┆ f64      │
+        ╞══════════╪═══════════════╪═════════════╪══════════╡
+        │ 1        ┆ 1             ┆ 0           ┆ 0.666667 │
+        │ 1        ┆ 8             ┆ 0           ┆ 0.333333 │
+        │ 2        ┆ 6             ┆ 0           ┆ 0.333333 │
+        │ 2        ┆ 8             ┆ 0           ┆ 0.666667 │
+        └──────────┴───────────────┴─────────────┴──────────┘
+
+    Raises
+    ------
+        KeyError: on unknown chemical symbol or isotope.
+        ValueError: if a formula is malformed or the numbers of ids and formulas differ.
+
+    Returns
+    -------
+        compositions in the order of formulas, nuclides are sorted within each formula
+    """
+    formulas = list(formulas)
+    material_ids: list[object] = list(formulas if ids is None else ids)
+    if len(material_ids) != len(formulas):
+        msg = f"Expected {len(formulas)} ids, as formulas, got {len(material_ids)}"
+        raise ValueError(msg)
+    parsed = [parse_formula(f) for f in formulas]
+    counts = np.fromiter((_z.size for _z, _, _ in parsed), dtype=np.intp, count=len(parsed))
+    segments = np.repeat(np.arange(len(parsed)), counts)
+    if parsed:
+        atomic_numbers, mass_numbers, fractions = (
+            np.concatenate(a) for a in zip(*parsed, strict=True)
         )
-        .cast(dtypes={"atomic_number": pl.UInt8})
-        .sort("atomic_number")
+    else:
+        atomic_numbers = np.empty(0, dtype=np.uint8)
+        mass_numbers = np.empty(0, dtype=np.uint16)
+        fractions = np.empty(0)
+    if mass_fraction:
+        fractions = fractions * molar_masses(atomic_numbers, mass_numbers)
+    totals = np.bincount(segments, weights=fractions, minlength=len(parsed))
+    return pl.DataFrame(
+        [
+            pl.Series(id_column, material_ids).gather(segments),
+            pl.Series("atomic_number", atomic_numbers, dtype=pl.UInt8),
+            pl.Series("mass_number", mass_numbers, dtype=pl.UInt16),
+            pl.Series("fraction", fractions / totals[segments]),
+        ]
     )
 
 
 __all__ = [
+    "CHEMICAL_FORMULA_TOKEN",
+    "ELEMENTS_IPC",
     "ELEMENTS_PARQUET",
     "ELEMENTS_TABLE_PL",
     "SYMBOL_TO_Z",
@@ -208,7 +419,10 @@ __all__ = [
     "atomic_mass",
     "atomic_number",
     "from_molecular_formula",
+    "from_molecular_formulas",
     "get_property",
+    "get_property_many",
+    "scan_elements",
     "symbol",
     "z",
 ]
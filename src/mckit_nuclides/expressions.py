@@ -0,0 +1,216 @@
+"""Polars expression namespaces to get element and nuclide properties in queries.
+
+On import the module registers namespaces `elements` and `nuclides` for Polars expressions.
+The lookups are presented with `replace_strict` expressions, so, they compose
+into lazy query plans without joins and can be run with streaming engine.
+
+Examples
+--------
+    >>> import polars as pl
+    >>> from mckit_nuclides import expressions
+    >>> composition = pl.LazyFrame({"z": [1, 8], "a": [2, 16]})
+    >>> print(
+    ...     composition.select(
+    ...         pl.col("z").elements.symbol(),
+    ...         pl.col("z").nuclides.molar_mass(pl.col("a")),
+    ...     ).collect()
+    ... )
+    shape: (2, 2)
+    ┌────────┬────────────┐
+    │ symbol ┆ molar_mass │
+    │ ---    ┆ ---        │
+    │ str    ┆ f32        │
+    ╞════════╪════════════╡
+    │ H      ┆ 2.014102   │
+    │ O      ┆ 15.994915  │
+    └────────┴────────────┘
+"""
+
+from __future__ import annotations
+
+from functools import cache
+
+import polars as pl
+
+from mckit_nuclides import elements, nuclides
+
+_ZA_FACTOR = 1000
+"""Multiplier for atomic number in the nuclide keys: key = Z * 1000 + A."""
+
+_STATE_FACTOR = 10
+"""Multiplier for the nuclide keys with isomer states: key = (Z * 1000 + A) * 10 + state."""
+
+
+def _as_expression(value: pl.Expr | str | int) -> pl.Expr:
+    """Treat strings as column names and other values as literals, like Polars does."""
+    if isinstance(value, pl.Expr):
+        return value
+    if isinstance(value, str):
+        return pl.col(value)
+    return pl.lit(value)
+
+
+def _nuclide_key(
+    atomic_number: pl.Expr, mass_number: pl.Expr, state: pl.Expr | None = None
+) -> pl.Expr:
+    """Pack the nuclide identifiers to a key, null if mass number or state don't fit in it."""
+    mass_number = mass_number.cast(pl.Int64)
+    key = (
+        pl.when(mass_number.is_between(0, _ZA_FACTOR, closed="left"))
+        .then(atomic_number.cast(pl.Int64) * _ZA_FACTOR + mass_number)
+        .otherwise(None)
+    )
+    if state is None:
+        return key
+    state = state.cast(pl.Int64)
+    return (
+        pl.when(state.is_between(0, _STATE_FACTOR, closed="left"))
+        .then(key * _STATE_FACTOR + state)
+        .otherwise(None)
+    )
+
+
+@cache
+def _element_values(column: str) -> pl.Series:
+    try:
+        return elements.ELEMENTS_TABLE_PL.get_column(column)
+    except pl.exceptions.ColumnNotFoundError as ex:
+        raise KeyError(column) from ex
+
+
+@cache
+def _unique_nuclides(*, with_state: bool) -> pl.DataFrame:
+    """Nuclides, which can be found by (Z, A, state) or by (Z, A) in the lowest state."""
+    table = nuclides.NUCLIDES_TABLE_PL
+    if with_state:
+        return table.unique(["atomic_number", "mass_number", "state"], keep="none")
+    return table.filter(nuclides.is_lowest_state())
+
+
+@cache
+def _nuclide_keys(*, with_state: bool) -> pl.Series:
+    state = pl.col("state") if with_state else None
+    key = _nuclide_key(pl.col("atomic_number"), pl.col("mass_number"), state)
+    return _unique_nuclides(with_state=with_state).select(key=key)["key"]
+
+
+@cache
+def _nuclide_values(column: str, *, with_state: bool) -> pl.Series:
+    try:
+        return _unique_nuclides(with_state=with_state).get_column(column)
+    except pl.exceptions.ColumnNotFoundError as ex:
+        raise KeyError(column) from ex
+
+
+@pl.api.register_expr_namespace("elements")
+class ElementsNamespace:
+    """Element properties for expressions.
+
+    The expression should present atomic numbers except for :meth:`atomic_number`,
+    which is applied to chemical symbols.
+    Unknown elements are mapped to nulls.
+    """
+
+    def __init__(self, expr: pl.Expr) -> None:
+        self._expr = expr
+
+    def get_property(self, column: str) -> pl.Expr:
+        """Get column value from ELEMENTS_TABLE_PL.
+
+        Args:
+            column: column name in ELEMENTS_TABLE
+
+        Raises
+        ------
+            KeyError: if the column is unknown.
+
+        Returns
+        -------
+            Expression for the column values.
+        """
+        return self._expr.replace_strict(
+            _element_values("atomic_number"), _element_values(column), default=None
+        ).alias(column)
+
+    def atomic_number(self) -> pl.Expr:
+        """Get atomic numbers by chemical symbols."""
+        return self._expr.replace_strict(
+            _element_values("symbol"), _element_values("atomic_number"), default=None
+        ).alias("atomic_number")
+
+    def symbol(self) -> pl.Expr:
+        """Get chemical symbols."""
+        return self.get_property("symbol")
+
+    def name(self) -> pl.Expr:
+        """Get names of elements."""
+        return self.get_property("name")
+
+    def molar_mass(self) -> pl.Expr:
+        """Get standard atomic masses."""
+        return self.get_property("molar_mass")
+
+
+@pl.api.register_expr_namespace("nuclides")
+class NuclidesNamespace:
+    """Nuclide properties for expressions presenting atomic numbers.
+
+    The nuclides are specified by mass numbers and optional isomer states,
+    the lowest state available is used for not specified state.
+    Unknown nuclides are mapped to nulls.
+    """
+
+    def __init__(self, expr: pl.Expr) -> None:
+        self._expr = expr
+
+    def get_property(
+        self,
+        mass_number: pl.Expr | str | int,
+        column: str,
+        *,
+        state: pl.Expr | str | int | None = None,
+    ) -> pl.Expr:
+        """Get column value from NUCLIDES_TABLE_PL.
+
+        Args:
+            mass_number: expression, column name or value for mass numbers
+            column: column name in NUCLIDES_TABLE
+            state: expression, column name or value for isomer states, the lowest by default
+
+        Raises
+        ------
+            KeyError: if the column is unknown.
+
+        Returns
+        -------
+            Expression for the column values.
+        """
+        with_state = state is not None
+        key = _nuclide_key(
+            self._expr,
+            _as_expression(mass_number),
+            None if state is None else _as_expression(state),
+        )
+        return key.replace_strict(
+            _nuclide_keys(with_state=with_state),
+            _nuclide_values(column, with_state=with_state),
+            default=None,
+        ).alias(column)
+
+    def molar_mass(
+        self, mass_number: pl.Expr | str | int, state: pl.Expr | str | int | None = None
+    ) -> pl.Expr:
+        """Get nuclide masses, a.u."""
+        return self.get_property(mass_number, "molar_mass", state=state)
+
+    def isotopic_composition(
+        self, mass_number: pl.Expr | str | int, state: pl.Expr | str | int | None = None
+    ) -> pl.Expr:
+        """Get natural presence fractions of nuclides in their elements."""
+        return self.get_property(mass_number, "isotopic_composition", state=state)
+
+    def half_life(
+        self, mass_number: pl.Expr | str | int, state: pl.Expr | str | int | None = None
+    ) -> pl.Expr:
+        """Get half-lives of nuclides, seconds."""
+        return self.get_property(mass_number, "half_life", state=state)
@@ -0,0 +1,390 @@
+"""Parse and format nuclide identifiers: MCNP ZAIDs, ZA codes and names like U-235.
+
+The supported forms:
+
+- ZAID - ZA code with optional library suffix: 92235.80c, 1001.00c, 6000.50c, 92235
+- ZA code - integer ``Z * 1000 + A``: 92235; natural elements have A = 0: 6000
+- name - chemical symbol and mass number with optional separator and isomer state: U-235, U235,
+  U235m, Am242m1; the symbols are case insensitive, ``m`` without number means the first state
+
+The isomer states are presented in ZA codes with MCNP convention ``A + 300 + 100 * state``,
+for example, Am242m1 is 95642.
+The mass number is restored as the largest one, which is not above ``3 * Z + 10``.
+
+The nuclides are presented with atomic number, mass number and state,
+the dtypes of the columns in :func:`parse_nuclides` output match ``NUCLIDES_TABLE_PL``.
+
+Examples
+--------
+    >>> parse_nuclide("95642.80c")
+    NuclideId(atomic_number=95, mass_number=242, state=1)
+    >>> format_zaid(*parse_nuclide("U-235"), library="80c")
+    '92235.80c'
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+import re
+
+from functools import lru_cache
+
+import numpy as np
+import polars as pl
+
+from mckit_nuclides import elements
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+_CACHE_SIZE: Final = 16384
+"""Number of recently parsed identifiers to keep."""
+
+_ZA_FACTOR: Final = 1000
+"""Multiplier for atomic number in ZA codes: ZA = Z * 1000 + A."""
+
+_METASTABLE_OFFSET: Final = 300
+"""ZA codes present isomers with mass number A + 300 + 100 * state."""
+
+_STATE_FACTOR: Final = 100
+
+_SCHEMA: Final = pl.Schema({"atomic_number": pl.UInt8, "mass_number": pl.UInt16, "state": pl.UInt8})
+"""The dtypes of the key columns in NUCLIDES_TABLE_PL."""
+
+NUCLIDE_IDENTIFIER: Final = re.compile(
+    r"(?i)^\s*(?:"
+    r"(?P<za>\d{1,7})(?:\.(?P<library>\w+))?"
+    r"|(?P<symbol>[a-z]{1,2})-?(?P<mass_number>\d{1,3})(?:m(?P<state>\d?))?"
+    r")\s*$"
+)
+"""Regex pattern for ZAIDs, ZA codes and nuclide names.
+
+Examples:
+    >>> NUCLIDE_IDENTIFIER.match("Am242m1").group("symbol", "mass_number", "state")
+    ('Am', '242', '1')
+"""
+
+
+class NuclideId(NamedTuple):
+    """Nuclide specification compatible with NUCLIDES_TABLE_PL key columns."""
+
+    atomic_number: int
+    mass_number: int
+    """A, 0 for natural element."""
+    state: int = 0
+    """Isomer state, 0 for ground state."""
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_nuclide(identifier: str | int) -> NuclideId:
+    """Parse ZAID, ZA code or nuclide name.
+
+    Args:
+        identifier: ZAID or name as string, or ZA code as integer
+
+    Examples
+    --------
+        >>> parse_nuclide("U235m")
+        NuclideId(atomic_number=92, mass_number=235, state=1)
+        >>> parse_nuclide(1001)
+        NuclideId(atomic_number=1, mass_number=1, state=0)
+
+    Raises
+    ------
+        ValueError: if the identifier cannot be parsed, refers to unknown element
+            or to isomer without mass number.
+
+    Returns
+    -------
+        Atomic number, mass number and isomer state.
+    """
+    if isinstance(identifier, str):
+        match = NUCLIDE_IDENTIFIER.match(identifier)
+        if match is None:
+            raise _identifier_error(identifier)
+        if match["za"] is None:
+            atomic_number = elements.SYMBOL_TO_Z.get(match["symbol"].capitalize())
+            if atomic_number is None:
+                raise _identifier_error(identifier)
+            state = match["state"]
+            return NuclideId(
+                atomic_number,
+                int(match["mass_number"]),
+                0 if state is None else int(state or 1),
+            )
+        za = int(match["za"])
+    else:
+        za = identifier
+    atomic_number, mass_number, state = (int(v) for v in _decode_za(np.asarray(za)))
+    if atomic_number not in elements.Z_TO_SYMBOL or (state and mass_number < 1):
+        raise _identifier_error(identifier)
+    return NuclideId(atomic_number, mass_number, state)
+
+
+def parse_nuclides(identifiers: npt.ArrayLike | pl.Series, *, strict: bool = True) -> pl.DataFrame:
+    """Parse many ZAIDs, ZA codes or nuclide names at once.
+
+    Each distinct identifier is parsed only once.
+
+    Args:
+        identifiers: strings or integer ZA codes as NumPy array, Polars Series or sequence
+        strict: raise on identifiers, which cannot be parsed, otherwise map them to nulls
+
+    Examples
+    --------
+        >>> print(parse_nuclides(["1001.80c", "H-2", "Am242m1", "8000"]))
+        shape: (4, 3)
+        ┌───────────────┬─────────────┬───────┐
+        │ atomic_number ┆ mass_number ┆ state │
+        │ ---           ┆ ---         ┆ ---   │
+        │ u8            ┆ u16         ┆ u8    │
+        ╞═══════════════╪═════════════╪═══════╡
+        │ 1             ┆ 1           ┆ 0     │
+        │ 1             ┆ 2           ┆ 0     │
+        │ 95            ┆ 242         ┆ 1     │
+        │ 8             ┆ 0           ┆ 0     │
+        └───────────────┴─────────────┴───────┘
+
+    Raises
+    ------
+        ValueError: if an identifier cannot be parsed and `strict` is set.
+        TypeError: if the identifiers are neither strings nor integers.
+
+    Returns
+    -------
+        Frame with atomic_number, mass_number and state columns in the order of identifiers.
+        Null identifiers are mapped to nulls.
+    """
+    series = _as_series(identifiers)
+    distinct = series.unique(maintain_order=True).drop_nulls()
+    if distinct.dtype == pl.String:
+        parsed = _parse_strings(distinct)
+    elif distinct.dtype.is_integer():
+        parsed = _parse_za(distinct.cast(pl.Int64))
+    else:
+        msg = f"Strings or integer ZA codes are expected, got {series.dtype}"
+        raise TypeError(msg)
+    if strict:
+        failed = distinct.filter(parsed["atomic_number"].is_null())
+        if failed.len():
+            raise _identifier_error(failed[0])
+    rows = series.replace_strict(
+        distinct, pl.int_range(distinct.len(), dtype=pl.UInt32, eager=True), default=None
+    )
+    return parsed.select(pl.all().gather(rows))
+
+
+def to_za(atomic_number: int, mass_number: int, state: int = 0) -> int:
+    """Get ZA code for a nuclide.
+
+    Args:
+        atomic_number: Z
+        mass_number: A, 0 for natural element
+        state: isomer state
+
+    Examples
+    --------
+        >>> to_za(95, 242, 1)
+        95642
+
+    Returns
+    -------
+        Z * 1000 + A, the isomers are encoded with MCNP convention.
+    """
+    if state:
+        mass_number += _METASTABLE_OFFSET + _STATE_FACTOR * state
+    return atomic_number * _ZA_FACTOR + mass_number
+
+
+def format_zaid(
+    atomic_number: int, mass_number: int, state: int = 0, library: str | None = None
+) -> str:
+    """Format MCNP ZAID for a nuclide.
+
+    Args:
+        atomic_number: Z
+        mass_number: A, 0 for natural element
+        state: isomer state
+        library: data library suffix like 80c, omitted by default
+
+    Examples
+    --------
+        >>> format_zaid(1, 1, library="80c")
+        '1001.80c'
+
+    Returns
+    -------
+        ZAID.
+    """
+    za = str(to_za(atomic_number, mass_number, state))
+    return za if library is None else f"{za}.{library}"
+
+
+def format_name(atomic_number: int, mass_number: int, state: int = 0, separator: str = "-") -> str:
+    """Format nuclide name like U-235 or Am-242m1.
+
+    Args:
+        atomic_number: Z
+        mass_number: A
+        state: isomer state
+        separator: between chemical symbol and mass number
+
+    Raises
+    ------
+        KeyError: if the atomic number is unknown.
+
+    Returns
+    -------
+        The nuclide name.
+    """
+    name = f"{elements.Z_TO_SYMBOL[atomic_number]}{separator}{mass_number}"
+    return f"{name}m{state}" if state else name
+
+
+def format_zaids(
+    atomic_numbers: npt.ArrayLike | pl.Series,
+    mass_numbers: npt.ArrayLike | pl.Series,
+    states: npt.ArrayLike | pl.Series | None = None,
+    library: str | None = None,
+) -> pl.Series:
+    """Format ZAIDs for many nuclides at once.
+
+    Args:
+        atomic_numbers: Z values
+        mass_numbers: A values
+        states: isomer states, ground states by default
+        library: data library suffix like 80c, omitted by default
+
+    Examples
+    --------
+        >>> format_zaids([1, 95], [2, 242], [0, 1], library="80c").to_list()
+        ['1002.80c', '95642.80c']
+
+    Returns
+    -------
+        Series "zaid" of strings.
+    """
+    za = _encode_za(*_as_key_columns(atomic_numbers, mass_numbers, states)).cast(pl.String)
+    if library is not None:
+        za = za + f".{library}"
+    return za.alias("zaid")
+
+
+def format_names(
+    atomic_numbers: npt.ArrayLike | pl.Series,
+    mass_numbers: npt.ArrayLike | pl.Series,
+    states: npt.ArrayLike | pl.Series | None = None,
+    separator: str = "-",
+) -> pl.Series:
+    """Format names for many nuclides at once.
+
+    Args:
+        atomic_numbers: Z values
+        mass_numbers: A values
+        states: isomer states, ground states by default
+        separator: between chemical symbol and mass number
+
+    Examples
+    --------
+        >>> format_names([1, 95], [2, 242], [0, 1]).to_list()
+        ['H-2', 'Am-242m1']
+
+    Returns
+    -------
+        Series "name" of strings, unknown atomic numbers are mapped to nulls.
+    """
+    z, a, state = _as_key_columns(atomic_numbers, mass_numbers, states)
+    return pl.select(
+        name=pl.concat_str(
+            pl.lit(z).replace_strict(elements.Z_TO_SYMBOL, default=None, return_dtype=pl.String),
+            pl.lit(separator),
+            pl.lit(a),
+            pl.when(pl.lit(state) > 0).then(pl.format("m{}", pl.lit(state))).otherwise(pl.lit("")),
+        )
+    ).to_series()
+
+
+def _identifier_error(identifier: object) -> ValueError:
+    return ValueError(f"Cannot parse nuclide identifier {identifier!r}")
+
+
+def _as_series(values: npt.ArrayLike | pl.Series) -> pl.Series:
+    if isinstance(values, pl.Series):
+        return values
+    array = np.asarray(values)
+    if array.dtype.kind == "O":
+        return pl.Series(array.ravel().tolist())
+    if array.size == 0:
+        return pl.Series(dtype=pl.String)
+    return pl.Series(array.ravel())
+
+
+def _as_key_columns(
+    atomic_numbers: npt.ArrayLike | pl.Series,
+    mass_numbers: npt.ArrayLike | pl.Series,
+    states: npt.ArrayLike | pl.Series | None,
+) -> tuple[pl.Series, pl.Series, pl.Series]:
+    z = _as_series(atomic_numbers).cast(pl.Int64)
+    a = _as_series(mass_numbers).cast(pl.Int64)
+    state = pl.zeros(z.len(), pl.Int64, eager=True) if states is None else _as_series(states)
+    return z, a, state.cast(pl.Int64)
+
+
+def _decode_za(
+    za: npt.NDArray[np.int64],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Split ZA codes to atomic numbers, mass numbers and isomer states.
+
+    Invalid isomer codes, like 1301, give mass numbers below 1, the callers reject them.
+    """
+    atomic_number, rest = np.divmod(za, _ZA_FACTOR)
+    excess = rest - _METASTABLE_OFFSET
+    # the lowest state giving mass number not above 3 * Z + 10
+    state = np.maximum(1, -((3 * atomic_number + 10 - excess) // _STATE_FACTOR))
+    state = np.where(excess > 0, state, 0)
+    mass_number = np.where(excess > 0, excess - _STATE_FACTOR * state, rest)
+    return atomic_number, mass_number, state
+
+
+def _encode_za(atomic_number: pl.Series, mass_number: pl.Series, state: pl.Series) -> pl.Series:
+    offset = (state > 0).cast(pl.Int64) * _METASTABLE_OFFSET + state * _STATE_FACTOR
+    return atomic_number * _ZA_FACTOR + mass_number + offset
+
+
+def _parse_za(za: pl.Series) -> pl.DataFrame:
+    atomic_number, mass_number, state = _decode_za(za.fill_null(-1).to_numpy())
+    known = np.isin(atomic_number, np.fromiter(elements.Z_TO_SYMBOL, dtype=np.int64))
+    known &= (state == 0) | (mass_number > 0)
+    frame = pl.DataFrame(
+        {"atomic_number": atomic_number, "mass_number": mass_number, "state": state}
+    )
+    return frame.select(pl.when(pl.Series(known)).then(pl.all())).cast(_SCHEMA)
+
+
+def _parse_strings(identifiers: pl.Series) -> pl.DataFrame:
+    parts = identifiers.str.extract_groups(NUCLIDE_IDENTIFIER.pattern).struct.unnest()
+    named = parts.select(
+        atomic_number=pl.col("symbol")
+        .str.to_titlecase()
+        .replace_strict(elements.SYMBOL_TO_Z, default=None, return_dtype=pl.UInt8),
+        mass_number=pl.col("mass_number").cast(pl.UInt16),
+        state=pl.col("state").replace("", "1").cast(pl.UInt8).fill_null(0),
+    ).select(pl.when(pl.col("atomic_number").is_not_null()).then(pl.all()))
+    # each identifier is either ZA code or name, the other form is null
+    return _parse_za(parts["za"].cast(pl.Int64)).select(
+        pl.col(c).fill_null(named[c]) for c in _SCHEMA
+    )
+
+
+__all__ = [
+    "NUCLIDE_IDENTIFIER",
+    "NuclideId",
+    "format_name",
+    "format_names",
+    "format_zaid",
+    "format_zaids",
+    "parse_nuclide",
+    "parse_nuclides",
+    "to_za",
+]
@@ -0,0 +1,191 @@
+"""Opt-in counters of calls, latency and cache hits of the table lookups and transforms.
+
+The public functions of modules :mod:`~mckit_nuclides.elements`,
+:mod:`~mckit_nuclides.nuclides` and :mod:`~mckit_nuclides.abundance` count their calls
+and cumulative time, when instrumentation is enabled with the environment variable
+``MCKIT_NUCLIDES_INSTRUMENT=1`` or within the context manager :func:`instrument`.
+The time of a function includes the time of the instrumented functions it calls,
+for generators only creation is timed.
+The internal caches of these modules report their hits and misses in the same period.
+When disabled, the overhead is a check of a flag per call.
+The package modules don't import this one, it's loaded only on demand.
+
+Examples
+--------
+    >>> from mckit_nuclides.elements import atomic_mass
+    >>> with instrument():
+    ...     masses = [atomic_mass(z) for z in (1, 8, 1)]
+    >>> stats = snapshot()["elements.atomic_mass"]
+    >>> stats.calls, stats.seconds > 0
+    (3, True)
+    >>> to_frame().columns
+    ['function', 'calls', 'seconds', 'hits', 'misses', 'hit_rate']
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from contextlib import contextmanager
+
+import polars as pl
+
+from mckit_nuclides import _hooks
+from mckit_nuclides._hooks import ENABLE_VARIABLE, counters, instrumented, instrumented_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Stats(NamedTuple):
+    """Statistics of a function or cache."""
+
+    calls: int
+    """Number of calls, for caches - hits and misses."""
+    seconds: float | None = None
+    """Cumulative time of the calls, None for caches."""
+    hits: int | None = None
+    """Number of cache hits, None for functions."""
+    misses: int | None = None
+    """Number of cache misses, None for functions."""
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Share of cache hits, None if there were no calls or it's not a cache."""
+        if self.hits is None or not self.calls:
+            return None
+        return self.hits / self.calls
+
+
+_CACHE_TOTALS: Final[dict[str, tuple[int, int]]] = {}
+"""Cache hits and misses accumulated in the previous periods of instrumentation."""
+
+
+def is_enabled() -> bool:
+    """Check if instrumentation is enabled."""
+    return _hooks.enabled
+
+
+def enable() -> None:
+    """Start counting."""
+    with _hooks.LOCK:
+        if not _hooks.enabled:
+            _start_caches()
+            _hooks.enabled = True
+
+
+def disable() -> None:
+    """Stop counting, the counters are kept."""
+    with _hooks.LOCK:
+        if _hooks.enabled:
+            for name in _hooks.CACHES:
+                _CACHE_TOTALS[name] = _cache_counters(name)
+            _hooks.enabled = False
+
+
+def reset() -> None:
+    """Reset the counters."""
+    with _hooks.LOCK:
+        _hooks.CALLS.clear()
+        _CACHE_TOTALS.clear()
+        _start_caches()
+
+
+@contextmanager
+def instrument(*, reset_counters: bool = True) -> Iterator[None]:
+    """Enable instrumentation within the context.
+
+    Args:
+        reset_counters: reset the counters on entering the context
+
+    Yields
+    ------
+        None
+    """
+    was_enabled = _hooks.enabled
+    if reset_counters:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def snapshot() -> dict[str, Stats]:
+    """Get the current statistics.
+
+    Only the functions called while instrumentation was enabled are reported.
+    The caches are reported always.
+
+    Returns
+    -------
+        Statistics by function names qualified with module name, like "elements.get_property".
+    """
+    with _hooks.LOCK:
+        result = {
+            name: Stats(int(calls), seconds) for name, (calls, seconds) in _hooks.CALLS.items()
+        }
+        for name in _hooks.CACHES:
+            hits, misses = _cache_counters(name)
+            result[name] = Stats(hits + misses, None, hits, misses)
+    return dict(sorted(result.items()))
+
+
+def to_frame() -> pl.DataFrame:
+    """Get the current statistics as DataFrame.
+
+    Returns
+    -------
+        The table with columns function, calls, seconds, hits, misses, hit_rate.
+    """
+    stats = snapshot()
+    return pl.DataFrame(
+        {
+            "function": list(stats),
+            "calls": [s.calls for s in stats.values()],
+            "seconds": [s.seconds for s in stats.values()],
+            "hits": [s.hits for s in stats.values()],
+            "misses": [s.misses for s in stats.values()],
+            "hit_rate": [s.hit_rate for s in stats.values()],
+        },
+        schema={
+            "function": pl.String,
+            "calls": pl.Int64,
+            "seconds": pl.Float64,
+            "hits": pl.Int64,
+            "misses": pl.Int64,
+            "hit_rate": pl.Float64,
+        },
+    )
+
+
+def _cache_counters(name: str) -> tuple[int, int]:
+    hits, misses = _CACHE_TOTALS.get(name, (0, 0))
+    if _hooks.enabled:
+        info = _hooks.CACHES[name].cache_info()
+        start_hits, start_misses = _hooks.CACHE_STARTS[name]
+        hits += info.hits - start_hits
+        misses += info.misses - start_misses
+    return hits, misses
+
+
+def _start_caches() -> None:
+    for name, function in _hooks.CACHES.items():
+        _hooks.CACHE_STARTS[name] = counters(function)
+
+
+__all__ = [
+    "ENABLE_VARIABLE",
+    "Stats",
+    "disable",
+    "enable",
+    "instrument",
+    "instrumented",
+    "instrumented_cache",
+    "is_enabled",
+    "reset",
+    "snapshot",
+    "to_frame",
+]
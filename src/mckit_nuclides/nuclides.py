@@ -1,32 +1,129 @@
-"""Information on nuclides: masses, natural presence and more."""
+"""Information on nuclides: masses, natural presence and more.
+
+The table presents ground states of the nuclides with known masses and their isomer states
+with known half-lives. The isomers have the masses of the ground states.
+Natural presence is specified for the state present in nature: the ground state for all the nuclides
+except Ta-180, which is observable in the first isomer state.
+
+The nuclides are identified by atomic number, mass number and isomer state.
+If the state is not specified, the lowest one available in the table is used.
+"""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Final, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 
+from functools import cache
 from pathlib import Path
 
 import polars as pl
 
+from mckit_nuclides import elements
+from mckit_nuclides._hooks import instrumented, instrumented_cache
+from mckit_nuclides._indexing import (
+    as_keys,
+    find_row,
+    find_rows,
+    gather,
+    lowest_last_key,
+    make_dense_index,
+)
+from mckit_nuclides._loading import cached_arrays, read_table, scan_table
 from mckit_nuclides.elements import z
 
 if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from mckit_nuclides._indexing import MissingPolicy
     from mckit_nuclides.elements import TableValue
 
 
 HERE = Path(__file__).parent
 
 NUCLIDES_PARQUET: Final[Path] = HERE / "data/nuclides.parquet"
-NUCLIDES_TABLE_PL: Final = pl.read_parquet(NUCLIDES_PARQUET)
+NUCLIDES_IPC: Final[Path] = HERE / "data/nuclides.arrow"
 
+_SORTED_BY: Final = ("atomic_number", "mass_number", "state")
+"""The table keys, the rows are sorted by them."""
+
+if TYPE_CHECKING:
+    # The table is loaded on first access, see __getattr__ below
+    NUCLIDES_TABLE_PL: pl.DataFrame
+
+
+@instrumented_cache
+@cache
+def _nuclides_table() -> pl.DataFrame:
+    return read_table("nuclides", NUCLIDES_PARQUET, NUCLIDES_IPC, _SORTED_BY)
+
+
+@instrumented_cache
+@cache
+def _zas_to_row() -> npt.NDArray[np.int32]:
+    """Row numbers in NUCLIDES_TABLE_PL by atomic number, mass number and isomer state."""
+
+    def compute() -> tuple[npt.NDArray[np.int32]]:
+        table = _nuclides_table()
+        return (make_dense_index(table["atomic_number"], table["mass_number"], table["state"]),)
+
+    (index,) = cached_arrays("nuclides_index", compute)
+    return cast("npt.NDArray[np.int32]", index)
+
+
+@instrumented_cache
+@cache
+def _za_to_row() -> npt.NDArray[np.int32]:
+    """Row numbers in NUCLIDES_TABLE_PL of the lowest states by atomic and mass numbers."""
+    return lowest_last_key(_zas_to_row())
+
+
+def __getattr__(name: str) -> object:
+    """Load the table on first access to the module attribute."""
+    if name == "NUCLIDES_TABLE_PL":
+        return _nuclides_table()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+@instrumented
+def scan_nuclides() -> pl.LazyFrame:
+    """Scan the nuclides table lazily.
+
+    The table is sorted and marked sorted by atomic number, mass number and state.
+    Filters on atomic number are pushed down to the data file reader,
+    which skips row groups by their statistics.
+
+    Examples
+    --------
+        >>> scan_nuclides().filter(atomic_number=26).select(pl.len()).collect().item()
+        32
+
+    Returns
+    -------
+        LazyFrame with the same content as NUCLIDES_TABLE_PL.
+    """
+    return scan_table("nuclides", NUCLIDES_PARQUET, NUCLIDES_IPC, _SORTED_BY)
 
-def get_property(z_or_symbol: int | str, mass_number: int, column: str) -> TableValue:
-    """Retrieve mass of a nuclide by atomic and mass numbers, a.u.
+
+@instrumented
+def get_property(
+    z_or_symbol: int | str, mass_number: int, column: str, *, state: int | None = None
+) -> TableValue:
+    """Retrieve a property of a nuclide by atomic and mass numbers and isomer state.
 
     Args:
         z_or_symbol: Z or symbol of a nuclide
         mass_number: A
         column: name of column to extract value from
+        state: isomer state, the lowest available by default
+
+    Examples
+    --------
+        >>> get_property("Am", 242, "half_life")
+        57636.0
+        >>> get_property("Ta", 180, "half_life", state=1)
+        5.68037e+22
 
     Raises
     ------
@@ -37,30 +134,106 @@ def get_property(z_or_symbol: int | str, mass_number: int, column: str) -> Table
         Value of a column for the given nuclide.
     """
     _z = z(z_or_symbol) if isinstance(z_or_symbol, str) else z_or_symbol
+    if state is None:
+        row = find_row(_za_to_row(), _z, mass_number)
+    else:
+        row = find_row(_zas_to_row(), _z, mass_number, state)
+    return _column_values(column)[row]
+
+
+@instrumented
+def get_property_many(
+    z_or_symbols: npt.ArrayLike | pl.Series,
+    mass_numbers: npt.ArrayLike | pl.Series,
+    column: str,
+    *,
+    states: npt.ArrayLike | pl.Series | None = None,
+    missing: MissingPolicy = "raise",
+) -> npt.NDArray[Any]:
+    """Get column values for many nuclides at once.
+
+    Args:
+        z_or_symbols: atomic numbers or chemical symbols as NumPy array, Polars Series or sequence
+        mass_numbers: mass numbers, broadcastable to `z_or_symbols`
+        column: name of column to extract values from
+        states: isomer states, broadcastable to `z_or_symbols`, the lowest available by default
+        missing: how to treat unknown nuclides: "raise", "nan", "mask"
+
+    Examples
+    --------
+        >>> import numpy as np
+        >>> get_property_many(np.array([1, 1, 8]), np.array([1, 2, 16]), "isotopic_composition")
+        array([9.99885e-01, 1.15000e-04, 9.97570e-01], dtype=float32)
+        >>> masses = get_property_many(["U", "U"], [235, 250], "molar_mass", missing="mask")
+        >>> masses.mask
+        array([False,  True])
+
+    Raises
+    ------
+        KeyError: if the column is unknown or there's unknown nuclide and the policy is "raise".
+
+    Returns
+    -------
+        The column values for the given nuclides.
+    """
+    given = [z_or_symbols, mass_numbers]
+    keys = [as_keys(z_or_symbols, elements.SYMBOL_TO_Z), as_keys(mass_numbers)]
+    if states is None:
+        index = _za_to_row()
+    else:
+        index = _zas_to_row()
+        given.append(states)
+        keys.append(as_keys(states))
+    return gather(_column_array(column), find_rows(index, *keys), missing, *given)
+
+
+@instrumented_cache
+@cache
+def _column_values(column: str) -> list[TableValue]:
     try:
-        return cast(
-            "TableValue",
-            NUCLIDES_TABLE_PL.filter(
-                pl.col("atomic_number").eq(_z) & pl.col("mass_number").eq(mass_number)
-            )
-            .select(column)
-            .item(),
-        )
-    except pl.exceptions.ColumnNotFoundError as ex:  # pragma: no cover
-        raise KeyError from ex
-    except ValueError as ex:  # pragma: no cover
-        raise KeyError from ex
-
-
-def get_nuclide_mass(z_or_symbol: int | str, mass_number: int) -> float:
+        return _nuclides_table().get_column(column).to_list()
+    except pl.exceptions.ColumnNotFoundError as ex:
+        raise KeyError(column) from ex
+
+
+@instrumented_cache
+@cache
+def _column_array(column: str) -> npt.NDArray[Any]:
+    try:
+        return _nuclides_table().get_column(column).to_numpy()
+    except pl.exceptions.ColumnNotFoundError as ex:
+        raise KeyError(column) from ex
+
+
+@instrumented
+def get_nuclide_mass(z_or_symbol: int | str, mass_number: int, state: int | None = None) -> float:
     """Retrieve mass of a nuclide by atomic and mass numbers, a.u.
 
     Args:
         z_or_symbol: Z or symbol of a nuclide
         mass_number: A
+        state: isomer state, the lowest available by default
 
     Returns
     -------
         Mass of the Nuclide (a.u).
     """
-    return cast("float", get_property(z_or_symbol, mass_number, "molar_mass"))
+    return cast("float", get_property(z_or_symbol, mass_number, "molar_mass", state=state))
+
+
+@instrumented
+def is_lowest_state() -> pl.Expr:
+    """Select nuclides in the lowest isomer state available for their atomic and mass numbers.
+
+    Examples
+    --------
+        >>> from mckit_nuclides.nuclides import NUCLIDES_TABLE_PL
+        >>> am242 = NUCLIDES_TABLE_PL.filter(atomic_number=95, mass_number=242)
+        >>> am242["state"].to_list(), am242.filter(is_lowest_state())["state"].to_list()
+        ([0, 1, 2], [0])
+
+    Returns
+    -------
+        Boolean expression on a table with atomic_number, mass_number and state columns.
+    """
+    return pl.col("state") == pl.col("state").min().over("atomic_number", "mass_number")
@@ -0,0 +1,182 @@
+"""Bulk resolution of material specifications to compositions of nuclides.
+
+Material libraries specify tens of thousands of materials in various forms:
+chemical formulas, fractions by nuclide identifiers or by natural elements.
+:func:`resolve_materials` resolves them on a pool of workers to normalized
+:class:`~mckit_nuclides.composition.Composition` objects with natural elements
+expanded to isotopes. The results are streamed in the order of specifications,
+only a few chunks of specifications are in flight at a time, so, the memory use
+doesn't depend on the library size.
+
+The resolution of small materials is mostly Python code holding the GIL,
+so, threads overlap only the NumPy parts, use processes for real parallelism.
+
+Examples
+--------
+    >>> specs = ["H2O", {"Fe": 0.7, "Cr": 0.2, "Ni": 0.1}, [(1, 2, 2.0), (8, 16, 1.0)]]
+    >>> for composition in resolve_materials(specs, workers=2):
+    ...     print(len(composition), composition.za[:3])
+    5 [1001 1002 8016]
+    13 [24050 24052 24053]
+    2 [1002 8016]
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+import os
+
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import batched
+
+from mckit_nuclides import elements
+from mckit_nuclides.composition import Composition
+from mckit_nuclides.identifiers import parse_nuclide
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
+type MaterialSpec = str | Composition | Mapping[str | int, float] | Iterable[tuple[int, int, float]]
+"""Chemical formula, composition, fractions by identifiers or (Z, A, fraction) triples."""
+
+DEFAULT_CHUNK_SIZE: Final = 64
+"""Number of specifications resolved by a worker at once."""
+
+_PENDING_CHUNKS_PER_WORKER: Final = 2
+"""Chunks submitted ahead of the one being consumed: keeps the workers busy and memory bounded."""
+
+
+def resolve_material(spec: MaterialSpec, *, mass_fraction: bool = False) -> Composition:
+    """Resolve material specification to normalized composition of nuclides.
+
+    The specification is one of:
+
+    - chemical formula, see :func:`~mckit_nuclides.elements.from_molecular_formula`
+    - :class:`~mckit_nuclides.composition.Composition`, its own basis is used
+    - mapping of chemical symbols (natural elements), nuclide names, ZAIDs or ZA codes
+      to fractions, for example ``{"Fe": 0.7, "B-10": 0.2, 6000: 0.1}``
+    - iterable of (Z, A, fraction) triples, A is 0 for natural elements
+
+    Args:
+        spec: the material specification
+        mass_fraction: the fractions in the formula, mapping or triples are by mass,
+            otherwise by atoms
+
+    Returns
+    -------
+        Normalized composition with natural elements expanded to isotopes.
+
+    Raises
+    ------
+        KeyError: on unknown chemical symbol in formula.
+        ValueError: if the formula is malformed, the mapping or triples are empty,
+            an identifier cannot be parsed or refers to isomer state.
+    """
+    if isinstance(spec, Composition):
+        composition = spec
+    elif isinstance(spec, str):
+        composition = Composition.from_formula(spec, mass_fraction=mass_fraction)
+    elif isinstance(spec, Mapping):
+        if not spec:
+            msg = "Expected fractions of nuclides or elements, got empty mapping"
+            raise ValueError(msg)
+        atomic_numbers, mass_numbers = zip(*(_parse_identifier(k) for k in spec), strict=True)
+        composition = Composition(
+            atomic_numbers, mass_numbers, list(spec.values()), mass_fraction=mass_fraction
+        )
+    else:
+        triples = list(spec)
+        if not triples:
+            msg = "Expected (Z, A, fraction) triples, got empty sequence"
+            raise ValueError(msg)
+        atomic_numbers, mass_numbers, fractions = zip(*triples, strict=True)
+        composition = Composition(
+            atomic_numbers, mass_numbers, fractions, mass_fraction=mass_fraction
+        )
+    return composition.expand_natural().normalize()
+
+
+def resolve_materials(
+    specs: Iterable[MaterialSpec],
+    *,
+    mass_fraction: bool = False,
+    workers: int | None = None,
+    processes: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Composition]:
+    """Resolve material specifications concurrently, yielding the results in order.
+
+    The specifications are consumed lazily: no more than ``2 * workers`` chunks
+    are resolved ahead of the consumer. If a specification fails,
+    the exception is raised on its turn in the results and the remaining work is cancelled.
+    With one worker the specifications are resolved in the calling thread.
+
+    Args:
+        specs: material specifications, see :func:`resolve_material`,
+            should be picklable for processes
+        mass_fraction: the fractions in specifications are by mass, otherwise by atoms
+        workers: number of workers, default: number of CPUs
+        processes: use pool of processes, otherwise threads
+        chunk_size: number of specifications sent to a worker at once
+
+    Returns
+    -------
+        Iterator over normalized compositions in the order of specifications.
+
+    Raises
+    ------
+        ValueError: if the number of workers or chunk size is not positive.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunk_size < 1:
+        msg = f"Expected positive workers and chunk size, got {workers} and {chunk_size}"
+        raise ValueError(msg)
+    chunks = batched(specs, chunk_size)
+    if workers == 1:
+        return (c for chunk in chunks for c in _resolve_chunk(chunk, mass_fraction=mass_fraction))
+    executor_type = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    return _stream(executor_type, chunks, workers, mass_fraction)
+
+
+def _stream(
+    executor_type: type[ThreadPoolExecutor | ProcessPoolExecutor],
+    chunks: Iterator[tuple[MaterialSpec, ...]],
+    workers: int,
+    mass_fraction: bool,  # noqa: FBT001
+) -> Iterator[Composition]:
+    # the pool is created on the first request of result, not to leak it if none is requested
+    executor = executor_type(max_workers=workers)
+    pending: deque[Future[list[Composition]]] = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(_resolve_chunk, chunk, mass_fraction=mass_fraction))
+            if len(pending) > _PENDING_CHUNKS_PER_WORKER * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _resolve_chunk(chunk: tuple[MaterialSpec, ...], *, mass_fraction: bool) -> list[Composition]:
+    return [resolve_material(spec, mass_fraction=mass_fraction) for spec in chunk]
+
+
+def _parse_identifier(identifier: str | int) -> tuple[int, int]:
+    if isinstance(identifier, str):
+        atomic_number = elements.SYMBOL_TO_Z.get(identifier)
+        if atomic_number is not None:
+            return atomic_number, 0
+    nuclide = parse_nuclide(identifier)
+    if nuclide.state:
+        msg = f"Isomer states are not supported in compositions: {identifier!r}"
+        raise ValueError(msg)
+    return nuclide.atomic_number, nuclide.mass_number
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "MaterialSpec", "resolve_material", "resolve_materials"]
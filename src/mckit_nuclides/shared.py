@@ -0,0 +1,232 @@
+"""Publish the package tables in shared memory for worker processes.
+
+Each worker process reads the tables on first access and keeps its own copy.
+Publish the tables once in the parent process and attach them in the workers instead.
+Numeric columns without nulls are attached zero-copy, the other columns
+(strings and columns with nulls, small in the package tables) are copied from shared memory.
+
+Call :func:`attach_tables` before the first access to the tables in a worker,
+the most convenient way is to use it as a pool initializer:
+
+.. code-block:: python
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from mckit_nuclides.shared import attach_tables, publish_tables
+
+    with (
+        publish_tables() as shared,
+        ProcessPoolExecutor(initializer=attach_tables, initargs=(shared.specs,)) as pool,
+    ):
+        results = list(pool.map(process_composition, compositions))
+
+The parent process owns the shared memory: keep the tables published, while the workers run.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, NamedTuple, Self, cast
+
+import io
+import sys
+
+from multiprocessing import shared_memory
+
+import numpy as np
+import polars as pl
+
+from mckit_nuclides import abundance, elements, nuclides
+from mckit_nuclides._loading import use_shared_table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from types import TracebackType
+
+_ALIGNMENT: Final = 64
+"""Alignment of columns in shared memory blocks, bytes."""
+
+_TABLES: Final[dict[str, Callable[[], pl.DataFrame]]] = {
+    "elements": lambda: elements.ELEMENTS_TABLE_PL,
+    "nuclides": lambda: nuclides.NUCLIDES_TABLE_PL,
+    "molar_masses": lambda: abundance.MOLAR_MASS_TABLE,
+}
+"""The tables, which can be published, by name."""
+
+_ATTACHED_BLOCKS: Final[list[shared_memory.SharedMemory]] = []
+"""Shared memory blocks used by attached tables, they are kept open for the process lifetime."""
+
+_PUBLISHED_BLOCKS: Final[set[str]] = set()
+"""Names of the shared memory blocks created in this process and not released yet."""
+
+
+class SharedColumn(NamedTuple):
+    """Location of a column values in a shared memory block."""
+
+    name: str
+    dtype: str
+    """NumPy dtype of the values."""
+    offset: int
+    length: int
+
+
+class SharedTableSpec(NamedTuple):
+    """Description of a table published in a shared memory block, pass it to workers."""
+
+    block: str
+    """Name of the shared memory block."""
+    columns: tuple[str, ...]
+    """All the columns in the table order."""
+    arrays: tuple[SharedColumn, ...]
+    """Columns shared zero-copy."""
+    ipc_offset: int
+    """Start of Arrow IPC data with the other columns."""
+    ipc_size: int
+
+
+class SharedTables:
+    """Tables published in shared memory, the owner of the memory blocks.
+
+    Args:
+        blocks: the shared memory blocks
+        specs: the descriptions of the tables by name
+    """
+
+    def __init__(
+        self, blocks: list[shared_memory.SharedMemory], specs: dict[str, SharedTableSpec]
+    ) -> None:
+        self._blocks = blocks
+        self.specs: Final = specs
+
+    def close(self) -> None:
+        """Release the shared memory."""
+        while self._blocks:
+            block = self._blocks.pop()
+            _PUBLISHED_BLOCKS.discard(block.name)
+            block.close()
+            block.unlink()
+
+    def __enter__(self) -> Self:
+        """Use as context manager to release the memory on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Release the memory."""
+        self.close()
+
+
+def publish_tables(names: Iterable[str] = tuple(_TABLES)) -> SharedTables:
+    """Copy the tables to shared memory.
+
+    Args:
+        names: the tables to publish: "elements", "nuclides", "molar_masses" (all by default)
+
+    Raises
+    ------
+        KeyError: on unknown table name.
+
+    Returns
+    -------
+        The published tables, close them, when the workers are done.
+    """
+    tables = {name: _TABLES[name]() for name in names}
+    shared = SharedTables([], {})
+    try:
+        for name, table in tables.items():
+            block, spec = _publish(table)
+            shared._blocks.append(block)  # noqa: SLF001
+            shared.specs[name] = spec
+    except BaseException:
+        shared.close()
+        raise
+    return shared
+
+
+def attach_tables(specs: Mapping[str, SharedTableSpec]) -> None:
+    """Use the tables published in shared memory in this process.
+
+    Args:
+        specs: the descriptions of the published tables, see :attr:`SharedTables.specs`
+    """
+    for name, spec in specs.items():
+        block = _open_block(spec.block)
+        _ATTACHED_BLOCKS.append(block)
+        use_shared_table(name, _attach(block, spec))
+
+
+def _is_shareable(column: pl.Series) -> bool:
+    """Check if the column can be presented with NumPy array zero-copy."""
+    return (column.dtype.is_integer() or column.dtype.is_float()) and column.null_count() == 0
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _publish(table: pl.DataFrame) -> tuple[shared_memory.SharedMemory, SharedTableSpec]:
+    arrays = {c.name: c.to_numpy() for c in table.get_columns() if _is_shareable(c)}
+    rest = table.drop(arrays)
+    ipc = rest.write_ipc(None).getvalue() if rest.width else b""
+    columns = []
+    offset = 0
+    for name, array in arrays.items():
+        columns.append(SharedColumn(name, array.dtype.str, offset, array.size))
+        offset = _aligned(offset + array.nbytes)
+    block = shared_memory.SharedMemory(create=True, size=max(offset + len(ipc), 1))
+    _PUBLISHED_BLOCKS.add(block.name)
+    buffer = _buffer(block)
+    for column, array in zip(columns, arrays.values(), strict=True):
+        target = np.ndarray(array.shape, array.dtype, buffer=buffer, offset=column.offset)
+        target[:] = array
+        del target  # release the buffer to allow closing the block
+    buffer[offset : offset + len(ipc)] = ipc
+    del buffer
+    spec = SharedTableSpec(block.name, tuple(table.columns), tuple(columns), offset, len(ipc))
+    return block, spec
+
+
+def _attach(block: shared_memory.SharedMemory, spec: SharedTableSpec) -> pl.DataFrame:
+    buffer = _buffer(block)
+    series = {
+        c.name: pl.Series(
+            c.name, np.ndarray((c.length,), np.dtype(c.dtype), buffer=buffer, offset=c.offset)
+        )
+        for c in spec.arrays
+    }
+    if spec.ipc_size:
+        ipc = bytes(buffer[spec.ipc_offset : spec.ipc_offset + spec.ipc_size])
+        series.update((c.name, c) for c in pl.read_ipc(io.BytesIO(ipc)).get_columns())
+    return pl.DataFrame([series[name] for name in spec.columns])
+
+
+def _buffer(block: shared_memory.SharedMemory) -> memoryview:
+    """Get memory of a block, it's present, while the block is open."""
+    return cast("memoryview", block.buf)
+
+
+def _open_block(name: str) -> shared_memory.SharedMemory:
+    """Open existing shared memory block, which is owned and unlinked by another process."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    from multiprocessing import parent_process, resource_tracker  # noqa: PLC0415
+
+    block = shared_memory.SharedMemory(name=name)
+    # Before Python 3.13 the block is registered to be unlinked on exit of this process.
+    # The processes started with multiprocessing share the resource tracker of the parent,
+    # where the block is registered by the owner once and is unregistered on unlink.
+    if name not in _PUBLISHED_BLOCKS and parent_process() is None:
+        resource_tracker.unregister(block._name, "shared_memory")  # noqa: SLF001
+    return block
+
+
+__all__ = [
+    "SharedColumn",
+    "SharedTableSpec",
+    "SharedTables",
+    "attach_tables",
+    "publish_tables",
+]
@@ -1,25 +1,32 @@
 from __future__ import annotations
 
+import numpy as np
 import polars as pl
 import pytest
 
 from numpy.testing import assert_array_almost_equal
+from polars.testing import assert_frame_equal
 
 from mckit_nuclides.abundance import (
     convert_to_atomic_fraction,
     expand_df_natural_presence,
     expand_natural_presence,
+    expand_natural_presence_arrays,
+    mix,
+    normalize_column,
+)
+from mckit_nuclides.conversion import (
+    convert_from_number_density,
+    convert_to_mass_fraction,
+    convert_to_number_density,
+    mix_by_volume,
 )
 from mckit_nuclides.elements import from_molecular_formula
 
 
 @pytest.fixture
 def water() -> pl.DataFrame:
-    return (
-        from_molecular_formula("H2O", mass_fraction=True)
-        .with_columns(mass_number=pl.lit(0))
-        .select("atomic_number", "mass_number", "fraction")
-    )
+    return from_molecular_formula("H2O", mass_fraction=True)
 
 
 def test_convert_to_atomic_fraction_h2o(water: pl.DataFrame) -> None:
@@ -38,6 +45,31 @@ def test_expand_natural_presence() -> None:
     assert_array_almost_equal(expected, actual)
 
 
+@pytest.mark.parametrize(
+    "composition",
+    [
+        [(1, 0, 2.0), (8, 16, 1.0)],
+        [(43, 0, 1.0), (200, 0, 1.0), (92, 0, 0.5), (92, 235, 0.1)],  # Tc has no natural isotopes
+        [],
+    ],
+)
+def test_expand_natural_presence_arrays(composition: list[tuple[int, int, float]]) -> None:
+    expected = list(expand_natural_presence(composition))
+    z, a, f = np.array(composition, dtype=object).reshape(-1, 3).T
+    actual = expand_natural_presence_arrays(z.astype(int), a.astype(int), f.astype(float))
+    assert list(zip(*(x.tolist() for x in actual), strict=True)) == expected
+
+
+def test_expand_natural_presence_arrays_for_all_elements() -> None:
+    rng = np.random.default_rng(2024)
+    z = rng.integers(1, 119, 1000)
+    a = np.where(rng.random(1000) < 0.5, 0, 2 * z)
+    f = rng.random(1000)
+    expected = list(expand_natural_presence(zip(z.tolist(), a.tolist(), f.tolist(), strict=True)))
+    actual = expand_natural_presence_arrays(z, a, f)
+    assert list(zip(*(x.tolist() for x in actual), strict=True)) == expected
+
+
 def test_expand_df_natural_presence(water: pl.DataFrame) -> None:
     new_water = convert_to_atomic_fraction(water)
     expanded = expand_df_natural_presence(new_water)
@@ -65,5 +97,176 @@ def test_expand_df_natural_presence(water: pl.DataFrame) -> None:
     )
 
 
+@pytest.fixture
+def materials(water: pl.DataFrame) -> pl.DataFrame:
+    steel = pl.DataFrame(
+        {
+            "atomic_number": [26, 24, 28],
+            "mass_number": [0, 0, 58],
+            "fraction": [0.7, 0.2, 0.1],
+        }
+    )
+    return pl.concat(
+        [
+            water.with_columns(material=pl.lit(1)),
+            steel.with_columns(material=pl.lit(2)),
+        ],
+        how="diagonal_relaxed",
+    ).select("material", "atomic_number", "mass_number", "fraction")
+
+
+def test_convert_to_atomic_fraction_lazy(water: pl.DataFrame) -> None:
+    expected = convert_to_atomic_fraction(water)
+    actual = convert_to_atomic_fraction(water.lazy())
+    assert isinstance(actual, pl.LazyFrame)
+    assert_frame_equal(actual.collect(engine="streaming"), expected)
+
+
+def test_convert_to_atomic_fraction_by_material(materials: pl.DataFrame) -> None:
+    actual = convert_to_atomic_fraction(materials, by="material")
+    assert actual.columns == materials.columns
+    for (material,), group in actual.group_by("material"):
+        assert group["fraction"].sum() == pytest.approx(1.0)
+        expected = convert_to_atomic_fraction(materials.filter(material=material))
+        assert_frame_equal(group.sort("atomic_number"), expected.sort("atomic_number"))
+
+
+def test_normalize_column_by_groups() -> None:
+    table = pl.DataFrame({"m": [1, 1, None, 2, None], "fraction": [1.0, 3.0, 2.0, 5.0, 2.0]})
+    actual = normalize_column(table, by="m")
+    assert actual["m"].to_list() == table["m"].to_list(), "The order of rows should be kept"
+    assert actual["fraction"].to_list() == [0.25, 0.75, 0.5, 1.0, 0.5]
+    assert normalize_column(table)["fraction"].sum() == pytest.approx(1.0)
+
+
+def test_expand_df_natural_presence_lazy(water: pl.DataFrame) -> None:
+    expected = expand_df_natural_presence(water)
+    actual = expand_df_natural_presence(water.lazy())
+    assert isinstance(actual, pl.LazyFrame)
+    assert_frame_equal(actual.collect(engine="streaming"), expected)
+
+
+def test_expand_df_natural_presence_by_material(materials: pl.DataFrame) -> None:
+    actual = expand_df_natural_presence(materials, by="material")
+    assert actual.columns == ["material", "atomic_number", "mass_number", "fraction"]
+    for (material,), group in actual.group_by("material", maintain_order=True):
+        expected = expand_df_natural_presence(materials.filter(material=material).drop("material"))
+        assert_frame_equal(group.drop("material"), expected)
+    lazy = expand_df_natural_presence(materials.lazy(), by=["material"])
+    assert_frame_equal(lazy.collect(engine="streaming"), actual)
+
+
+def test_expand_df_natural_presence_drops_elements_without_natural_isotopes() -> None:
+    composition = pl.DataFrame(
+        {"atomic_number": [43, 1], "mass_number": [0, 0], "fraction": [1.0, 1.0]}
+    )
+    actual = expand_df_natural_presence(composition)
+    assert actual["atomic_number"].to_list() == [1, 1]
+
+
+def test_convert_parquet_with_streaming(tmp_path, materials: pl.DataFrame) -> None:
+    source, target = tmp_path / "mass.parquet", tmp_path / "atomic.parquet"
+    materials.write_parquet(source)
+    convert_to_atomic_fraction(pl.scan_parquet(source), by="material").sink_parquet(target)
+    assert_frame_equal(
+        pl.read_parquet(target), convert_to_atomic_fraction(materials, by="material")
+    )
+
+
+@pytest.fixture
+def weights() -> pl.DataFrame:
+    """Two mixtures of water and steel, the second one is steel only."""
+    return pl.DataFrame(
+        {
+            "mixture": [1, 1, 2],
+            "material": [1, 2, 2],
+            "weight": [0.3, 0.7, 1.0],
+            "density": [1.0, 7.9, 7.9],
+        }
+    )
+
+
+def test_mix_by_mass(materials: pl.DataFrame, weights: pl.DataFrame) -> None:
+    actual = mix(materials, weights, by="mixture")
+    assert actual.columns == ["mixture", "atomic_number", "mass_number", "fraction"]
+    mixed = actual.filter(mixture=1).group_by("atomic_number").agg(pl.col("fraction").sum())
+    expected = {1: 0.3 * 0.111907, 8: 0.3 * 0.888093, 24: 0.7 * 0.2, 26: 0.7 * 0.7, 28: 0.7 * 0.1}
+    assert dict(mixed.iter_rows()) == pytest.approx(expected, rel=1e-5)
+    steel = actual.filter(mixture=2).drop("mixture")
+    expected_steel = convert_to_mass_fraction(
+        expand_df_natural_presence(
+            convert_to_atomic_fraction(materials.filter(material=2).drop("material"))
+        )
+    )
+    # Standard atomic masses of elements differ a bit from the masses of their natural isotopes
+    assert_frame_equal(steel, expected_steel, rel_tol=1e-3)
+
+
+def test_mix_by_atoms(materials: pl.DataFrame, weights: pl.DataFrame) -> None:
+    actual = mix(materials, weights, "atomic", by="mixture")
+    weighted = normalize_column(materials, by="material").join(weights, on="material")
+    expected = normalize_column(
+        expand_df_natural_presence(
+            weighted.with_columns(pl.col("fraction") * pl.col("weight")), by="mixture"
+        ),
+        by="mixture",
+    )
+    assert_frame_equal(actual, expected)
+
+
+def test_mix_with_column_names(materials: pl.DataFrame, weights: pl.DataFrame) -> None:
+    expected = mix(materials, weights, by="mixture").rename({"fraction": "share"})
+    actual = mix(
+        materials.rename({"fraction": "share"}),
+        weights.rename({"weight": "mass"}),
+        by="mixture",
+        fraction_column="share",
+        weight_column="mass",
+    )
+    assert_frame_equal(actual, expected)
+
+
+def test_mix_by_volume_is_consistent_with_number_densities(weights: pl.DataFrame) -> None:
+    materials = pl.DataFrame(
+        {
+            "material": [1, 1, 2, 2],
+            "atomic_number": [1, 8, 26, 28],
+            "mass_number": [1, 16, 56, 58],
+            "fraction": [0.1, 0.9, 0.8, 0.2],
+        }
+    )
+    actual = mix(materials, weights, "volume", by="mixture")
+    number_densities = convert_to_number_density(
+        materials.join(weights.select("material", "density").unique(), on="material"),
+        "density",
+        mass_fraction=True,
+        by="material",
+    ).drop("fraction", "density")
+    expected = convert_from_number_density(
+        mix_by_volume(
+            number_densities, weights.rename({"weight": "volume_fraction"}), by="mixture"
+        ),
+        by="mixture",
+    )
+    assert_frame_equal(
+        convert_to_atomic_fraction(actual, by="mixture"),
+        expected.drop("number_density"),
+        check_dtypes=False,
+    )
+
+
+def test_mix_lazy_without_mixture_keys(materials: pl.DataFrame, weights: pl.DataFrame) -> None:
+    weights = weights.filter(mixture=1).drop("mixture")
+    expected = mix(materials, weights, "volume")
+    assert expected["density"].to_list() == pytest.approx([0.3 * 1.0 + 0.7 * 7.9] * expected.height)
+    actual = mix(materials.lazy(), weights.lazy(), "volume")
+    assert_frame_equal(actual.collect(engine="streaming"), expected)
+
+
+def test_mix_with_unknown_basis(materials: pl.DataFrame, weights: pl.DataFrame) -> None:
+    with pytest.raises(ValueError, match="Unknown mixing basis"):
+        mix(materials, weights, "moles")  # type: ignore[arg-type]
+
+
 if __name__ == "__main__":
     pytest.main()
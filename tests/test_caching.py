@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from polars.testing import assert_frame_equal
+
+from mckit_nuclides.abundance import convert_to_atomic_fraction, expand_df_natural_presence
+from mckit_nuclides.caching import CacheInfo, FrameCache, frame_cache, frame_digest
+
+
+@pytest.fixture
+def steel() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "material": [1, 1, 1],
+            "atomic_number": [26, 24, 28],
+            "mass_number": [0, 0, 0],
+            "fraction": [0.7, 0.18, 0.12],
+        }
+    )
+
+
+def test_frame_digest(steel: pl.DataFrame) -> None:
+    assert frame_digest(steel) == frame_digest(steel.clone())
+    assert frame_digest(steel) != frame_digest(steel.reverse())
+    assert frame_digest(steel) != frame_digest(steel.rename({"fraction": "share"}))
+    assert frame_digest(steel) != frame_digest(steel.cast({"material": pl.Int32}))
+    assert frame_digest(pl.DataFrame()) == frame_digest(pl.DataFrame())
+
+
+def test_cached_transform(steel: pl.DataFrame) -> None:
+    expand = frame_cache()(expand_df_natural_presence)
+    expected = expand_df_natural_presence(steel, by="material")
+    assert_frame_equal(expand(steel, by="material"), expected)
+    assert_frame_equal(expand(steel.clone(), by="material"), expected)
+    assert expand.cache_info() == CacheInfo(hits=1, misses=1, maxsize=256, currsize=1)  # type: ignore[attr-defined]
+    assert_frame_equal(expand(steel), expand_df_natural_presence(steel))
+    assert expand.cache_info().misses == 2  # type: ignore[attr-defined]
+    assert expand.__name__ == "expand_df_natural_presence"
+    expand.cache_clear()  # type: ignore[attr-defined]
+    assert expand.cache_info() == CacheInfo(hits=0, misses=0, maxsize=256, currsize=0)  # type: ignore[attr-defined]
+
+
+def test_cached_transform_with_list_argument(steel: pl.DataFrame) -> None:
+    expand = frame_cache()(expand_df_natural_presence)
+    expected = expand_df_natural_presence(steel, by=["material"])
+    assert_frame_equal(expand(steel, by=["material"]), expected)
+    assert_frame_equal(expand(steel, by=["material"]), expected)
+    assert expand.cache_info().hits == 1  # type: ignore[attr-defined]
+
+
+def test_transforms_have_own_caches(steel: pl.DataFrame) -> None:
+    cached = frame_cache(maxsize=8)
+    expand = cached(expand_df_natural_presence)
+    convert = cached(convert_to_atomic_fraction)
+    assert_frame_equal(expand(steel), expand_df_natural_presence(steel))
+    assert_frame_equal(convert(steel), convert_to_atomic_fraction(steel))
+    assert expand.cache_info() == CacheInfo(hits=0, misses=1, maxsize=8, currsize=1)  # type: ignore[attr-defined]
+    assert convert.cache_info() == CacheInfo(hits=0, misses=1, maxsize=8, currsize=1)  # type: ignore[attr-defined]
+
+
+def test_cached_result_is_not_changed_by_callers(steel: pl.DataFrame) -> None:
+    convert = frame_cache()(convert_to_atomic_fraction)
+    expected = convert_to_atomic_fraction(steel)
+    result = convert(steel)
+    result[0, "fraction"] = 0.0
+    steel[0, "fraction"] = 0.0
+    assert_frame_equal(convert(steel), convert_to_atomic_fraction(steel))
+    steel[0, "fraction"] = 0.7
+    assert_frame_equal(convert(steel), expected)
+    assert convert.cache_info().hits == 1  # type: ignore[attr-defined]
+
+
+def test_lazy_frames_are_not_cached(steel: pl.DataFrame) -> None:
+    expand = frame_cache()(expand_df_natural_presence)
+    assert_frame_equal(expand(steel.lazy()).collect(), expand_df_natural_presence(steel))
+    assert expand.cache_info().currsize == 0  # type: ignore[attr-defined]
+
+
+def test_least_recently_used_are_evicted() -> None:
+    double = frame_cache(maxsize=2)(lambda frame: frame.with_columns(pl.col("x") * 2))
+    frames = [pl.DataFrame({"x": [i]}) for i in range(3)]
+    double(frames[0])
+    double(frames[1])
+    double(frames[0])
+    double(frames[2])
+    assert double.cache_info() == CacheInfo(hits=1, misses=3, maxsize=2, currsize=2)  # type: ignore[attr-defined]
+    double(frames[0])
+    double(frames[1])
+    assert double.cache_info().hits == 2  # type: ignore[attr-defined]
+
+
+def test_hash_collision_is_detected() -> None:
+    cache = FrameCache(maxsize=1)
+    cache.put("key", pl.DataFrame({"x": [1]}), "one")
+    assert cache.get("key", pl.DataFrame({"x": [2]})) is None
+    assert cache.get("key", pl.DataFrame({"x": [1]})) == "one"
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=1, currsize=1)
+
+
+def test_bad_cache_size() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        FrameCache(0)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from polars.testing import assert_frame_equal
+
+from mckit_nuclides.abundance import expand_df_natural_presence, mix
+from mckit_nuclides.composition import Composition
+from mckit_nuclides.conversion import convert_to_mass_fraction
+from mckit_nuclides.elements import from_molecular_formula
+
+
+def test_nuclides_are_sorted_and_summed_up() -> None:
+    actual = Composition([8, 1, 1, 8], [0, 1, 1, 16], [1.0, 2.0, 3.0, 4.0])
+    assert_array_equal(actual.za, [1001, 8000, 8016])
+    assert_array_equal(actual.fractions, [5.0, 1.0, 4.0])
+    assert actual.atomic_numbers.dtype == np.uint8
+    assert actual.mass_numbers.dtype == np.uint16
+    assert len(actual) == 3
+
+
+def test_arrays_are_read_only() -> None:
+    fractions = np.array([1.0, 2.0])
+    composition = Composition([1, 8], [1, 16], fractions)
+    with pytest.raises(ValueError, match="read-only"):
+        composition.fractions[0] = 0.0
+    assert fractions.flags.writeable, "the source array flags should not be changed"
+
+
+def test_arrays_of_different_lengths() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        Composition([1, 8], [1], [1.0, 2.0])
+
+
+@pytest.mark.parametrize(
+    "atomic_numbers, mass_numbers",
+    [
+        ([1, 2], [1004, 4]),
+        ([1], [-1]),
+        ([-1], [1]),
+        ([256], [1]),
+        (np.array([2], dtype=np.int64), np.array([1000], dtype=np.uint16)),
+    ],
+)
+def test_numbers_out_of_za_range(atomic_numbers: list[int], mass_numbers: list[int]) -> None:
+    with pytest.raises(ValueError, match="mass numbers in"):
+        Composition(atomic_numbers, mass_numbers, [1.0] * len(mass_numbers))
+
+
+@pytest.mark.parametrize("formula", ["H2O", "C2H5OH", "D2O·^6LiF", "CuSO4·5H2O"])
+@pytest.mark.parametrize("mass_fraction", [False, True])
+def test_from_formula(formula: str, *, mass_fraction: bool) -> None:
+    expected = from_molecular_formula(formula, mass_fraction=mass_fraction)
+    actual = Composition.from_formula(formula, mass_fraction=mass_fraction)
+    assert actual.mass_fraction == mass_fraction
+    assert_frame_equal(actual.to_frame(), expected)
+
+
+def test_conversion_to_and_from_frame_is_zero_copy() -> None:
+    frame = from_molecular_formula("H2O")
+    composition = Composition.from_frame(frame)
+    assert np.shares_memory(composition.fractions, frame["fraction"].to_numpy())
+    converted = composition.to_frame("share")
+    assert converted.columns == ["atomic_number", "mass_number", "share"]
+    assert np.shares_memory(converted["share"].to_numpy(), composition.fractions)
+
+
+def test_normalize() -> None:
+    actual = Composition([1, 8], [0, 0], [2.0, 1.0], mass_fraction=True).normalize()
+    assert_array_almost_equal(actual.fractions, [2.0 / 3.0, 1.0 / 3.0])
+    assert actual.mass_fraction
+
+
+def test_expand_natural_as_frame_function() -> None:
+    frame = pl.DataFrame(
+        {
+            "atomic_number": pl.Series([1, 8, 26, 43], dtype=pl.UInt8),
+            "mass_number": pl.Series([0, 16, 0, 0], dtype=pl.UInt16),
+            "fraction": [2.0, 1.0, 0.5, 0.1],
+        }
+    )
+    expected = expand_df_natural_presence(frame)
+    actual = Composition.from_frame(frame).expand_natural()
+    assert_frame_equal(actual.to_frame(), expected)
+
+
+def test_expand_natural_mass_fractions_as_mix() -> None:
+    steel = pl.DataFrame(
+        {
+            "material": [1, 1, 1],
+            "atomic_number": [26, 24, 28],
+            "mass_number": [0, 0, 0],
+            "fraction": [0.7, 0.18, 0.12],
+        }
+    )
+    expected = mix(steel, pl.DataFrame({"material": [1], "weight": [1.0]}), "mass")
+    actual = Composition.from_frame(steel, mass_fraction=True).expand_natural().normalize()
+    assert_frame_equal(actual.to_frame(), expected, check_dtypes=False)
+
+
+def test_expand_nuclides_only_returns_self() -> None:
+    composition = Composition([1, 8], [1, 16], [2.0, 1.0])
+    assert composition.expand_natural() is composition
+
+
+def test_convert_basis() -> None:
+    water = Composition.from_formula("H2O")
+    mass = water.to_mass()
+    expected = convert_to_mass_fraction(from_molecular_formula("H2O"))
+    assert mass.mass_fraction
+    assert_array_almost_equal(mass.fractions, expected["fraction"].to_numpy())
+    assert mass.to_mass() is mass
+    assert water.to_atomic() is water
+    assert_array_almost_equal(mass.to_atomic().fractions, water.fractions)
+
+
+def test_convert_unknown_nuclide() -> None:
+    with pytest.raises(KeyError):
+        Composition([1], [200], [1.0]).to_mass()
+
+
+def test_mix() -> None:
+    hydrogen = Composition([1], [1], [1.0])
+    water = Composition([1, 8], [1, 16], [2.0, 1.0])
+    actual = Composition.mix([(hydrogen, 2.0), (water, 1.0)])
+    assert_array_equal(actual.za, [1001, 8016])
+    assert_array_almost_equal(actual.fractions, [8.0 / 9.0, 1.0 / 9.0])
+
+
+@pytest.mark.parametrize(
+    "components, match",
+    [
+        ([], "Nothing"),
+        (
+            [
+                (Composition([1], [1], [1.0]), 1.0),
+                (Composition([1], [1], [1.0], mass_fraction=True), 1.0),
+            ],
+            "mass and atomic",
+        ),
+    ],
+)
+def test_mix_bad_components(components: list[tuple[Composition, float]], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        Composition.mix(components)
+
+
+def test_equality_and_hash() -> None:
+    water = Composition.from_formula("H2O")
+    same = Composition.from_frame(from_molecular_formula("H2O"))
+    assert water == same
+    assert hash(water) == hash(same)
+    assert len({water, same}) == 1
+    assert water != water.to_mass()
+    assert water != Composition.from_formula("D2O")
+    assert water != "H2O"
+
+
+def test_repr() -> None:
+    assert repr(Composition([1], [0], [1.0], mass_fraction=True)) == (
+        "Composition(1000: 1, mass_fraction=True)"
+    )
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from numpy.testing import assert_array_almost_equal
+from polars.testing import assert_frame_equal
+
+from mckit_nuclides.abundance import convert_to_atomic_fraction
+from mckit_nuclides.constants import AVOGADRO, BARN
+from mckit_nuclides.conversion import (
+    convert_from_number_density,
+    convert_to_mass_fraction,
+    convert_to_number_density,
+    mix_by_volume,
+    with_molar_mass,
+)
+from mckit_nuclides.elements import atomic_mass, from_molecular_formulas
+
+
+@pytest.fixture
+def materials() -> pl.DataFrame:
+    """Atomic fractions of water and boron carbide with enriched boron."""
+    return from_molecular_formulas(
+        ["H2O", "^10B3^11BC"], ids=[1, 2], id_column="material"
+    ).with_columns(density=pl.Series([1.0, 1.0, 2.52, 2.52, 2.52]))
+
+
+def test_with_molar_mass(materials: pl.DataFrame) -> None:
+    actual = with_molar_mass(materials)
+    assert actual["molar_mass"][0] == pytest.approx(atomic_mass("H"))
+    assert with_molar_mass(actual) is actual
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_convert_to_mass_fraction_round_trip(materials: pl.DataFrame, lazy: bool) -> None:  # noqa: FBT001
+    composition = materials.lazy() if lazy else materials
+    mass_fractions = convert_to_mass_fraction(composition, by="material")
+    actual = convert_to_atomic_fraction(mass_fractions, by="material")
+    if lazy:
+        actual = actual.collect()
+    assert_frame_equal(actual, materials)
+
+
+def test_convert_to_mass_fraction_water(materials: pl.DataFrame) -> None:
+    actual = convert_to_mass_fraction(materials, by="material").filter(material=1)
+    h2, o = 2 * atomic_mass("H"), atomic_mass("O")
+    assert_array_almost_equal(actual["fraction"].to_numpy(), [h2 / (h2 + o), o / (h2 + o)])
+
+
+def test_convert_to_number_density_water(materials: pl.DataFrame) -> None:
+    actual = convert_to_number_density(materials.filter(material=1), 1.0)
+    molecules = AVOGADRO * BARN / (2 * atomic_mass("H") + atomic_mass("O"))
+    assert_array_almost_equal(actual["number_density"].to_numpy(), [2 * molecules, molecules])
+
+
+def test_convert_to_number_density_from_mass_fractions(materials: pl.DataFrame) -> None:
+    expected = convert_to_number_density(materials, "density", by="material")
+    mass_fractions = convert_to_mass_fraction(materials, by="material")
+    actual = convert_to_number_density(mass_fractions, "density", mass_fraction=True, by="material")
+    assert_array_almost_equal(actual["number_density"], expected["number_density"])
+
+
+def test_convert_from_number_density_round_trip(materials: pl.DataFrame) -> None:
+    number_densities = convert_to_number_density(
+        with_molar_mass(materials), "density", by="material"
+    ).drop("fraction", "density")
+    actual = convert_from_number_density(number_densities, by="material")
+    assert_array_almost_equal(actual["fraction"], materials["fraction"])
+    assert_array_almost_equal(actual["density"], materials["density"], decimal=6)
+    assert actual.columns == [*number_densities.columns, "fraction", "density"]
+
+
+def test_convert_from_number_density_of_one_material(materials: pl.DataFrame) -> None:
+    water = materials.filter(material=1).drop("material")
+    number_densities = convert_to_number_density(water, "density").drop("fraction", "density")
+    actual = convert_from_number_density(number_densities.lazy()).collect()
+    assert_array_almost_equal(actual["fraction"], water["fraction"])
+    assert actual["density"].to_list() == pytest.approx([1.0, 1.0])
+
+
+def test_mix_by_volume(materials: pl.DataFrame) -> None:
+    number_densities = convert_to_number_density(
+        with_molar_mass(materials), "density", by="material"
+    )
+    volume_fractions = pl.DataFrame(
+        {
+            "mixture": [1, 1, 2],
+            "material": [1, 2, 2],
+            "volume_fraction": [0.5, 0.5, 1.0],
+        }
+    )
+    mixtures = mix_by_volume(
+        number_densities.select(
+            "material", "atomic_number", "mass_number", "number_density", "molar_mass"
+        ),
+        volume_fractions,
+        by="mixture",
+    )
+    actual = convert_from_number_density(mixtures, by="mixture").group_by("mixture").first()
+    assert dict(actual.select("mixture", "density").iter_rows()) == pytest.approx(
+        {1: 0.5 * 1.0 + 0.5 * 2.52, 2: 2.52}
+    )
+    boron_carbide = mixtures.filter(mixture=2)["number_density"]
+    assert_array_almost_equal(boron_carbide, number_densities.filter(material=2)["number_density"])
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import polars as pl
+import pytest
+
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from polars.testing import assert_frame_equal
+
+from mckit_nuclides.decay import (
+    compute_activity,
+    decay,
+    decay_constant,
+    get_decay_constants,
+    with_decay_constant,
+)
+from mckit_nuclides.nuclides import get_property
+
+TRITIUM_HALF_LIFE = get_property(1, 3, "half_life")
+
+
+@pytest.fixture
+def inventory() -> pl.DataFrame:
+    """Stable H-1, tritium, Am-242m1 and Li-3 with unknown half-life."""
+    return pl.DataFrame(
+        {
+            "atomic_number": pl.Series([1, 1, 95, 3], dtype=pl.UInt8),
+            "mass_number": pl.Series([1, 3, 242, 3], dtype=pl.UInt16),
+            "state": pl.Series([0, 0, 1, 0], dtype=pl.UInt8),
+            "atoms": [1.0e20, 2.0e20, 3.0e20, 4.0e20],
+        }
+    )
+
+
+def test_decay_constant() -> None:
+    actual = decay_constant(np.array([0.0, 2.0, np.nan, np.inf]))
+    assert_array_equal(actual, [0.0, math.log(2.0) / 2.0, np.nan, 0.0])
+    assert decay_constant(1.0) == pytest.approx(math.log(2.0))
+
+
+def test_get_decay_constants() -> None:
+    actual = get_decay_constants(np.array([1, 1, 3, 200]), [1, 3, 3, 1], missing="nan")
+    assert_array_equal(actual, [0.0, math.log(2.0) / TRITIUM_HALF_LIFE, np.nan, np.nan])
+    with pytest.raises(KeyError):
+        get_decay_constants([200], [1])
+
+
+def test_get_decay_constants_masked() -> None:
+    actual = get_decay_constants([1, 200], [3, 1], missing="mask")
+    assert_array_equal(actual.mask, [False, True])
+    assert actual[0] == pytest.approx(math.log(2.0) / TRITIUM_HALF_LIFE)
+
+
+def test_get_decay_constants_with_states() -> None:
+    actual = get_decay_constants([95, 95, 95], [242, 242, 242], states=[1, 2, 3], missing="nan")
+    half_lives = [get_property(95, 242, "half_life", state=s) for s in (1, 2)]
+    assert_array_almost_equal(actual[:2], np.log(2.0) / np.array(half_lives))
+    assert np.isnan(actual[2])
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_compute_activity(inventory: pl.DataFrame, lazy: bool) -> None:  # noqa: FBT001
+    _inventory = inventory.lazy() if lazy else inventory
+    actual = compute_activity(_inventory)
+    if lazy:
+        actual = actual.collect()
+    assert actual.columns == [*inventory.columns, "activity"]
+    activity = actual["activity"]
+    assert activity[0] == 0.0
+    assert activity[1] == pytest.approx(2.0e20 * math.log(2.0) / TRITIUM_HALF_LIFE)
+    assert activity[2] > 0.0
+    assert activity[3] is None
+
+
+def test_compute_activity_reuses_decay_constant(inventory: pl.DataFrame) -> None:
+    with_constants = with_decay_constant(inventory).with_columns(decay_constant=pl.lit(1.0))
+    actual = compute_activity(with_constants)
+    assert_array_equal(actual["activity"], inventory["atoms"])
+
+
+def test_compute_activity_for_lowest_states(inventory: pl.DataFrame) -> None:
+    ground_states = compute_activity(inventory.drop("state"))
+    isomers = compute_activity(inventory)
+    assert ground_states["activity"][2] > isomers["activity"][2], "Am-242 decays faster"
+
+
+def test_decay(inventory: pl.DataFrame) -> None:
+    actual = decay(inventory, TRITIUM_HALF_LIFE)
+    assert actual.columns == inventory.columns
+    assert actual["atoms"].to_list()[:2] == pytest.approx([1.0e20, 1.0e20])
+    am242m1_half_life = get_property(95, 242, "half_life", state=1)
+    assert actual["atoms"][2] == pytest.approx(
+        3.0e20 * 0.5 ** (TRITIUM_HALF_LIFE / am242m1_half_life)
+    )
+    assert actual["atoms"][3] is None
+
+
+@pytest.mark.parametrize("time", [np.float64(TRITIUM_HALF_LIFE), np.int64(TRITIUM_HALF_LIFE)])
+def test_decay_for_numpy_time(inventory: pl.DataFrame, time: np.number) -> None:
+    assert_frame_equal(decay(inventory, time), decay(inventory, float(time)))
+
+
+def test_decay_with_time_column(inventory: pl.DataFrame) -> None:
+    with_times = inventory.with_columns(cooling=pl.lit(0.0))
+    assert_frame_equal(decay(with_times.head(3), "cooling"), with_times.head(3))
+
+
+def test_decay_for_time_steps(inventory: pl.DataFrame) -> None:
+    steps = [0.0, TRITIUM_HALF_LIFE, 2 * TRITIUM_HALF_LIFE]
+    actual = decay(inventory.lazy(), steps).collect()
+    assert actual.columns == [*inventory.columns, "time"]
+    tritium = actual.filter(atomic_number=1, mass_number=3).sort("time")
+    assert_array_almost_equal(tritium["atoms"] / 1e20, [2.0, 1.0, 0.5])
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import numpy as np
+import polars as pl
 import pytest
 
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from polars.testing import assert_frame_equal
+
 from mckit_nuclides.elements import (
+    ELEMENTS_TABLE_PL,
     atomic_mass,
     atomic_number,
     from_molecular_formula,
+    from_molecular_formulas,
     get_property,
+    get_property_many,
     name,
     symbol,
     z,
@@ -31,9 +39,15 @@ def test_z() -> None:
     assert z("H") == atomic_number("H")
 
 
-def test_element_with_invalid_key() -> None:
+@pytest.mark.parametrize("element", [26, 26.0, np.float32(26.0), np.int8(26), np.uint64(26)])
+def test_get_property_with_integral_key(element: float) -> None:
+    assert get_property(element, "symbol") == "Fe"
+
+
+@pytest.mark.parametrize("element", [1000000, 119, 0, -1, "Xx", 26.5, np.nan, True, None])
+def test_element_with_invalid_key(element: int | str) -> None:
     with pytest.raises(KeyError):
-        get_property(1000000, "name")
+        get_property(element, "name")
 
 
 def test_get_unknown_property() -> None:
@@ -41,6 +55,68 @@ def test_get_unknown_property() -> None:
         get_property("Ar", "unknown")
 
 
+def test_get_property_for_each_element() -> None:
+    for row in ELEMENTS_TABLE_PL.iter_rows(named=True):
+        for column, expected in row.items():
+            assert get_property(row["atomic_number"], column) == expected
+            assert get_property(row["symbol"], column) == expected
+
+
+@pytest.mark.parametrize(
+    "elements",
+    [
+        np.arange(1, 119),
+        pl.Series(np.arange(1, 119), dtype=pl.UInt8),
+        ELEMENTS_TABLE_PL["symbol"],
+        ELEMENTS_TABLE_PL["symbol"].to_numpy().astype(str),
+    ],
+)
+def test_get_property_many(elements) -> None:
+    for column in ("symbol", "molar_mass", "period"):
+        assert_array_equal(get_property_many(elements, column), ELEMENTS_TABLE_PL[column])
+
+
+@pytest.mark.parametrize(
+    "elements, first_missing", [([1, 0, 119, -1], "(0,)"), (["H", "Xx", "Yy", "Zz"], "('Xx',)")]
+)
+def test_get_property_many_with_missing_keys(elements, first_missing) -> None:
+    with pytest.raises(KeyError) as error:
+        get_property_many(elements, "molar_mass")
+    assert str(error.value) == first_missing
+    actual = get_property_many(elements, "molar_mass", missing="nan")
+    assert actual[0] == pytest.approx(1.008)
+    assert np.isnan(actual[1:]).all()
+    assert_array_equal(get_property_many(elements, "period", missing="nan")[1:], np.nan)
+    assert get_property_many(elements, "symbol", missing="nan").tolist() == ["H"] + [None] * 3
+    masked = get_property_many(elements, "symbol", missing="mask")
+    assert_array_equal(masked.mask, [False, True, True, True])
+
+
+def test_get_property_many_with_wrong_arguments() -> None:
+    with pytest.raises(KeyError):
+        get_property_many([1], "unknown")
+    with pytest.raises(TypeError):
+        get_property_many([1.0], "symbol")
+    with pytest.raises(TypeError):
+        get_property_many(pl.Series([1.0]), "symbol")
+    with pytest.raises(ValueError, match="policy"):
+        get_property_many([1], "symbol", missing="ignore")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "elements", [[], np.array([], dtype=np.float64), pl.Series([], dtype=pl.String), pl.Series([])]
+)
+def test_get_property_many_with_empty_keys(elements) -> None:
+    actual = get_property_many(elements, "molar_mass")
+    assert actual.shape == (0,)
+    assert actual.dtype == ELEMENTS_TABLE_PL["molar_mass"].to_numpy().dtype
+
+
+def test_get_property_many_keeps_shape() -> None:
+    actual = get_property_many(np.array([[1, 2], [3, 4]]), "atomic_number")
+    assert_array_equal(actual, [[1, 2], [3, 4]])
+
+
 def test_from_molecular_formula() -> None:
     actual = from_molecular_formula("H2O")  # fraction by atomic
     assert actual.height == 2
@@ -50,5 +126,99 @@ def test_from_molecular_formula() -> None:
     )
 
 
+def test_from_molecular_formula_with_unknown_symbol() -> None:
+    with pytest.raises(KeyError):
+        from_molecular_formula("Xx2O")
+
+
+@pytest.mark.parametrize(
+    "formula,expected",
+    [
+        ("Ca(OH)2", {(20, 0): 1, (8, 0): 2, (1, 0): 2}),
+        ("K4[Fe(CN)6]", {(19, 0): 4, (26, 0): 1, (6, 0): 6, (7, 0): 6}),
+        ("CuSO4·5H2O", {(29, 0): 1, (16, 0): 1, (8, 0): 9, (1, 0): 10}),
+        ("CuSO4*5H2O", {(29, 0): 1, (16, 0): 1, (8, 0): 9, (1, 0): 10}),
+        ("UO2.02", {(92, 0): 1, (8, 0): 2.02}),
+        ("D2O", {(1, 2): 2, (8, 0): 1}),
+        ("HTO", {(1, 0): 1, (1, 3): 1, (8, 0): 1}),
+        ("^6LiF", {(3, 6): 1, (9, 0): 1}),
+        ("Li6", {(3, 0): 6}),
+        ("^10B4 C", {(5, 10): 4, (6, 0): 1}),
+    ],
+)
+def test_from_molecular_formula_grammar(
+    formula: str, expected: dict[tuple[int, int], float]
+) -> None:
+    actual = from_molecular_formula(formula)
+    total = sum(expected.values())
+    expected_frame = pl.DataFrame(
+        [(_z, a, atoms / total) for (_z, a), atoms in sorted(expected.items())],
+        schema={"atomic_number": pl.UInt8, "mass_number": pl.UInt16, "fraction": pl.Float64},
+        orient="row",
+    )
+    assert_frame_equal(actual, expected_frame)
+
+
+def test_from_molecular_formula_with_isotopes_by_mass() -> None:
+    actual = from_molecular_formula("^235U^238UO4", mass_fraction=True)
+    masses = [atomic_mass("O") * 4, 235.0439, 238.0508]
+    expected = np.array(masses) / sum(masses)
+    assert_array_almost_equal(actual["fraction"].to_numpy(), expected, decimal=5)
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "H2O)",
+        "(H2O",
+        "Ca(OH]2",
+        "(2H)O",
+        "H2O!",
+        "H2(O·H2O)",
+        "^70000U",
+        "^0U",
+        "Ca(OH)0",
+        "H0O",
+        "CuSO4·0H2O",
+        "0H2O",
+    ],
+)
+def test_from_molecular_formula_malformed(formula: str) -> None:
+    with pytest.raises(ValueError, match="Cannot parse chemical formula"):
+        from_molecular_formula(formula)
+
+
+@pytest.mark.parametrize("mass_fraction", [False, True])
+def test_from_molecular_formula_with_unknown_isotope(*, mass_fraction: bool) -> None:
+    with pytest.raises(KeyError, match="300"):
+        from_molecular_formula("^300UO2", mass_fraction=mass_fraction)
+
+
+@pytest.mark.parametrize("mass_fraction", [False, True])
+def test_from_molecular_formulas(mass_fraction: bool) -> None:  # noqa: FBT001
+    formulas = ["H2O", "C2H5OH", "", "UO2", "H2O", "D2O·^6LiF"]
+    actual = from_molecular_formulas(formulas, mass_fraction=mass_fraction)
+    assert actual.columns == ["formula", "atomic_number", "mass_number", "fraction"]
+    expected = pl.concat(
+        from_molecular_formula(f, mass_fraction=mass_fraction).select(
+            pl.lit(f).alias("formula"), pl.all()
+        )
+        for f in formulas
+    )
+    assert_frame_equal(actual, expected)
+
+
+def test_from_molecular_formulas_with_ids() -> None:
+    actual = from_molecular_formulas(["H2O", "CO2"], ids=["water", "gas"], id_column="material")
+    assert actual["material"].to_list() == ["water", "water", "gas", "gas"]
+    assert from_molecular_formulas([]).height == 0
+
+
+@pytest.mark.parametrize("ids", [["water"], ["water", "gas", "extra"]])
+def test_from_molecular_formulas_with_wrong_number_of_ids(ids: list[str]) -> None:
+    with pytest.raises(ValueError, match="Expected 2 ids"):
+        from_molecular_formulas(["H2O", "CO2"], ids=ids)
+
+
 if __name__ == "__main__":
     pytest.main()
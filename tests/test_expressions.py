@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from polars.testing import assert_frame_equal
+
+from mckit_nuclides import nuclides
+from mckit_nuclides.elements import ELEMENTS_TABLE_PL, get_property
+from mckit_nuclides.nuclides import get_nuclide_mass
+
+
+@pytest.fixture
+def composition() -> pl.LazyFrame:
+    return pl.LazyFrame(
+        {
+            "z": pl.Series([1, 1, 8, 92, 200], dtype=pl.UInt8),
+            "a": pl.Series([1, 2, 16, 235, 1], dtype=pl.UInt16),
+        }
+    )
+
+
+def test_elements_namespace(composition: pl.LazyFrame) -> None:
+    actual = composition.select(
+        pl.col("z").elements.symbol(),
+        pl.col("z").elements.name(),
+        pl.col("z").elements.molar_mass(),
+        period=pl.col("z").elements.get_property("period"),
+    ).collect(engine="streaming")
+    expected = pl.DataFrame(
+        {
+            "symbol": ["H", "H", "O", "U", None],
+            "name": ["Hydrogen", "Hydrogen", "Oxygen", "Uranium", None],
+            "molar_mass": [get_property(z, "molar_mass") for z in (1, 1, 8, 92)] + [None],
+            "period": [1, 1, 2, 7, None],
+        },
+        schema_overrides={"molar_mass": pl.Float32, "period": pl.UInt8},
+    )
+    assert_frame_equal(actual, expected)
+
+
+def test_atomic_number_by_symbol() -> None:
+    actual = ELEMENTS_TABLE_PL.select(pl.col("symbol").elements.atomic_number())
+    assert_frame_equal(actual, ELEMENTS_TABLE_PL.select("atomic_number"))
+
+
+def test_nuclides_namespace(composition: pl.LazyFrame) -> None:
+    actual = composition.select(
+        pl.col("z").nuclides.molar_mass("a"),
+        pl.col("z").nuclides.isotopic_composition(pl.col("a")),
+        pl.col("z").nuclides.half_life("a"),
+    ).collect(engine="streaming")
+    assert actual["molar_mass"].to_list()[:4] == [
+        get_nuclide_mass(z, a) for z, a in ((1, 1), (1, 2), (8, 16), (92, 235))
+    ]
+    assert actual["isotopic_composition"][0] == pytest.approx(0.999885)
+    assert actual["half_life"][3] == pytest.approx(2.22102e16)
+    assert actual.row(4) == (None, None, None)
+
+
+def test_nuclides_namespace_with_literal_mass_number() -> None:
+    actual = pl.select(pl.lit(1).nuclides.molar_mass(3)).item()
+    assert actual == get_nuclide_mass(1, 3)
+
+
+def test_nuclides_namespace_with_mass_number_out_of_key_range() -> None:
+    frame = pl.DataFrame({"z": [1, 2, 1], "a": [1004, -996, 3]})
+    actual = frame.select(pl.col("z").nuclides.molar_mass("a"))["molar_mass"]
+    assert actual.to_list() == [None, None, pytest.approx(get_nuclide_mass(1, 3))]
+
+
+def test_nuclides_namespace_with_states() -> None:
+    am242 = pl.DataFrame({"z": [95, 95, 95], "a": [242, 242, 242], "state": [None, 1, 3]})
+    actual = am242.select(
+        lowest=pl.col("z").nuclides.half_life("a"),
+        specified=pl.col("z").nuclides.half_life("a", "state"),
+    )
+    ground, isomer = (nuclides.get_property(95, 242, "half_life", state=s) for s in (0, 1))
+    assert actual["lowest"].to_list() == [ground] * 3
+    assert actual["specified"].to_list() == [None, isomer, None]
+
+
+def test_nuclides_namespace_with_state_out_of_key_range() -> None:
+    frame = pl.DataFrame({"z": [26, 26, 26], "a": [46, 48, 47], "state": [10, -9, 0]})
+    actual = frame.select(pl.col("z").nuclides.half_life("a", "state"))["half_life"]
+    assert actual.to_list() == [None, None, nuclides.get_property(26, 47, "half_life")]
+
+
+def test_expression_with_unknown_column() -> None:
+    with pytest.raises(KeyError):
+        pl.col("z").elements.get_property("unknown")
+    with pytest.raises(KeyError):
+        pl.col("z").nuclides.get_property("a", "unknown")
+
+
+def test_lookup_does_not_join(composition: pl.LazyFrame) -> None:
+    plan = composition.select(pl.col("z").nuclides.molar_mass("a")).explain()
+    assert "JOIN" not in plan.upper()
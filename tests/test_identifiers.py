@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from polars.testing import assert_frame_equal, assert_series_equal
+
+from mckit_nuclides.identifiers import (
+    NuclideId,
+    format_name,
+    format_names,
+    format_zaid,
+    format_zaids,
+    parse_nuclide,
+    parse_nuclides,
+    to_za,
+)
+from mckit_nuclides.nuclides import NUCLIDES_TABLE_PL
+
+IDENTIFIERS = {
+    "92235.80c": (92, 235, 0),
+    "92235": (92, 235, 0),
+    "6000.50c": (6, 0, 0),
+    "1001.00c": (1, 1, 0),
+    "U-235": (92, 235, 0),
+    "U235": (92, 235, 0),
+    "u235M": (92, 235, 1),
+    "Am242m1": (95, 242, 1),
+    "Am-242m2": (95, 242, 2),
+    "95642.80c": (95, 242, 1),
+    "95742": (95, 242, 2),
+    "47510": (47, 110, 1),
+    "72678.00c": (72, 178, 2),
+    " Fe-56 ": (26, 56, 0),
+}
+
+
+@pytest.mark.parametrize("identifier, expected", IDENTIFIERS.items())
+def test_parse_nuclide(identifier: str, expected: tuple[int, int, int]) -> None:
+    assert parse_nuclide(identifier) == expected
+
+
+def test_parse_za_code() -> None:
+    assert parse_nuclide(95642) == NuclideId(95, 242, 1)
+
+
+@pytest.mark.parametrize(
+    "identifier", ["", "U", "Xx-1", "U-235x", "999001", "92235.", 0, 1301, 1400, "92335.80c"]
+)
+def test_parse_bad_nuclide(identifier: str | int) -> None:
+    with pytest.raises(ValueError, match="Cannot parse nuclide identifier"):
+        parse_nuclide(identifier)
+
+
+def test_parse_nuclides_matches_scalar_parsing() -> None:
+    identifiers = list(IDENTIFIERS) * 3
+    actual = parse_nuclides(pl.Series(identifiers))
+    assert actual.rows() == [parse_nuclide(i) for i in identifiers]
+    assert actual.schema == NUCLIDES_TABLE_PL.select("atomic_number", "mass_number", "state").schema
+
+
+def test_parse_nuclides_za_codes() -> None:
+    actual = parse_nuclides(np.array([92235, 95642, 1001]))
+    assert actual.rows() == [(92, 235, 0), (95, 242, 1), (1, 1, 0)]
+
+
+def test_parse_nuclides_not_strict() -> None:
+    actual = parse_nuclides(["bad", "Xx-1", "999001", None, "U235"], strict=False)
+    assert actual.rows() == [(None, None, None)] * 4 + [(92, 235, 0)]
+
+
+def test_parse_nuclides_invalid_isomer_codes() -> None:
+    actual = parse_nuclides([1301, 1400, 1999, 95642], strict=False)
+    assert actual.rows() == [(None, None, None)] * 3 + [(95, 242, 1)]
+    actual = parse_nuclides(["92335.80c", "92635.80c"], strict=False)
+    assert actual.rows() == [(None, None, None), (92, 235, 1)]
+    with pytest.raises(ValueError, match="1301"):
+        parse_nuclides([1001, 1301])
+
+
+def test_parse_nuclides_raises_on_bad_identifier() -> None:
+    with pytest.raises(ValueError, match="'Xx-1'"):
+        parse_nuclides(["U235", "Xx-1"])
+    with pytest.raises(TypeError, match="Strings or integer"):
+        parse_nuclides([1.5])
+
+
+def test_parse_nuclides_empty() -> None:
+    assert parse_nuclides([]).height == 0
+
+
+def test_format_nuclide() -> None:
+    assert to_za(92, 235) == 92235
+    assert format_zaid(95, 242, 1, library="80c") == "95642.80c"
+    assert format_name(95, 242, 1) == "Am-242m1"
+    assert format_name(92, 235, separator="") == "U235"
+
+
+def test_format_nuclides() -> None:
+    assert_series_equal(
+        format_zaids([1, 95], [2, 242], [0, 1], library="80c"),
+        pl.Series("zaid", ["1002.80c", "95642.80c"]),
+    )
+    assert format_names([1, 95, 200], [2, 242, 1], [0, 2, 0]).to_list() == [
+        "H-2",
+        "Am-242m2",
+        None,
+    ]
+
+
+@pytest.mark.parametrize("formatter", [format_zaids, format_names])
+def test_round_trip_all_nuclides(formatter) -> None:
+    expected = NUCLIDES_TABLE_PL.select("atomic_number", "mass_number", "state")
+    identifiers = formatter(*expected.get_columns())
+    assert_frame_equal(parse_nuclides(identifiers), expected)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from mckit_nuclides import instrumentation
+from mckit_nuclides.abundance import expand_df_natural_presence
+from mckit_nuclides.elements import atomic_mass, from_molecular_formula, get_property
+from mckit_nuclides.instrumentation import instrument, is_enabled, snapshot, to_frame
+from mckit_nuclides.nuclides import get_nuclide_mass
+
+
+@pytest.fixture(autouse=True)
+def _disabled() -> None:
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default() -> None:
+    atomic_mass(1)
+    assert not is_enabled()
+    assert "elements.atomic_mass" not in snapshot()
+
+
+def test_count_calls_and_time() -> None:
+    with instrument():
+        assert is_enabled()
+        for z in (1, 8, 26):
+            get_property(z, "name")
+        get_nuclide_mass(1, 2)
+        expand_df_natural_presence(from_molecular_formula("H2O"))
+    assert not is_enabled()
+    actual = snapshot()
+    assert actual["elements.get_property"].calls == 3
+    assert actual["nuclides.get_nuclide_mass"].calls == 1
+    assert actual["abundance.expand_df_natural_presence"].calls == 1
+    seconds = actual["elements.get_property"].seconds
+    assert seconds is not None
+    assert seconds > 0.0
+    assert actual["elements.get_property"].hit_rate is None
+
+
+def test_cache_hits_are_counted_only_when_enabled() -> None:
+    from_molecular_formula("CH4")
+    with instrument():
+        from_molecular_formula("CH4")
+        from_molecular_formula("C2H6O2Xe4")
+    from_molecular_formula("CH4")
+    actual = snapshot()["_formulas.parse_formula"]
+    assert (actual.hits, actual.misses, actual.calls) == (1, 1, 2)
+    assert actual.hit_rate == 0.5
+    assert actual.seconds is None
+
+
+def test_counters_accumulate_without_reset() -> None:
+    with instrument():
+        atomic_mass(1)
+    with instrument(reset_counters=False):
+        atomic_mass(1)
+    assert snapshot()["elements.atomic_mass"].calls == 2
+
+
+def test_nested_context_keeps_enabled() -> None:
+    with instrument():
+        with instrument(reset_counters=False):
+            pass
+        assert is_enabled()
+    assert not is_enabled()
+
+
+def test_exceptions_are_counted() -> None:
+    with instrument(), pytest.raises(KeyError):
+        atomic_mass("Xx")
+    assert snapshot()["elements.atomic_mass"].calls == 1
+
+
+def test_to_frame() -> None:
+    with instrument():
+        atomic_mass(1)
+    actual = to_frame()
+    assert actual.schema == pl.Schema(
+        {
+            "function": pl.String,
+            "calls": pl.Int64,
+            "seconds": pl.Float64,
+            "hits": pl.Int64,
+            "misses": pl.Int64,
+            "hit_rate": pl.Float64,
+        }
+    )
+    row = actual.filter(pl.col("function") == "elements.atomic_mass").row(0, named=True)
+    assert row["calls"] == 1
+    assert row["hits"] is None
+    assert actual["function"].is_sorted()
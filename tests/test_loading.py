@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+
+from numpy.testing import assert_array_equal
+from polars.testing import assert_frame_equal
+
+from mckit_nuclides import _loading, _natural, abundance, elements, nuclides
+from mckit_nuclides._loading import (
+    CACHE_DIR_VARIABLE,
+    DATA_FORMAT_VARIABLE,
+    cache_directory,
+    cached_arrays,
+    cached_frame,
+    cached_json,
+    data_format,
+    read_table,
+    scan_table,
+)
+from mckit_nuclides.elements import ELEMENTS_IPC, ELEMENTS_PARQUET, scan_elements
+from mckit_nuclides.nuclides import NUCLIDES_IPC, NUCLIDES_PARQUET, scan_nuclides
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+TABLES = [
+    ("elements", ELEMENTS_PARQUET, ELEMENTS_IPC),
+    ("nuclides", NUCLIDES_PARQUET, NUCLIDES_IPC),
+]
+
+
+@pytest.mark.parametrize("name,parquet_path,ipc_path", TABLES)
+def test_ipc_tables_are_the_same_as_parquet(name: str, parquet_path: Path, ipc_path: Path) -> None:
+    assert name in parquet_path.name
+    assert_frame_equal(pl.read_ipc(ipc_path), pl.read_parquet(parquet_path))
+
+
+def test_data_format_is_parquet_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(DATA_FORMAT_VARIABLE, raising=False)
+    assert data_format() == "parquet"
+
+
+@pytest.mark.parametrize("name,parquet_path,ipc_path", TABLES)
+def test_read_table_in_ipc_format(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, name: str, parquet_path: Path, ipc_path: Path
+) -> None:
+    monkeypatch.setenv(DATA_FORMAT_VARIABLE, " IPC ")
+    actual = read_table(name, tmp_path / "absent.parquet", ipc_path)
+    assert_frame_equal(actual, pl.read_parquet(parquet_path))
+
+
+def test_read_table_with_unknown_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(DATA_FORMAT_VARIABLE, "csv")
+    with pytest.raises(ValueError, match=DATA_FORMAT_VARIABLE):
+        read_table("elements", ELEMENTS_PARQUET, ELEMENTS_IPC)
+
+
+@pytest.mark.parametrize(
+    "parquet_path,sorted_by",
+    [
+        (ELEMENTS_PARQUET, ["atomic_number"]),
+        (NUCLIDES_PARQUET, ["atomic_number", "mass_number", "state"]),
+    ],
+)
+def test_data_files_are_sorted(parquet_path: Path, sorted_by: list[str]) -> None:
+    assert pl.read_parquet_metadata(parquet_path)["sorted_by"] == ",".join(sorted_by)
+    table = pl.read_parquet(parquet_path)
+    assert_frame_equal(table, table.sort(sorted_by))
+
+
+@pytest.mark.parametrize("name,parquet_path,ipc_path", TABLES)
+def test_read_table_marks_key_sorted(name: str, parquet_path: Path, ipc_path: Path) -> None:
+    actual = read_table(name, parquet_path, ipc_path, ["atomic_number"])
+    assert actual["atomic_number"].flags["SORTED_ASC"]
+
+
+@pytest.mark.parametrize("data_format", ["parquet", "ipc"])
+@pytest.mark.parametrize("name,parquet_path,ipc_path", TABLES)
+def test_scan_table(
+    monkeypatch: pytest.MonkeyPatch, data_format: str, name: str, parquet_path: Path, ipc_path: Path
+) -> None:
+    monkeypatch.setenv(DATA_FORMAT_VARIABLE, data_format)
+    actual = scan_table(name, parquet_path, ipc_path, ["atomic_number"])
+    assert isinstance(actual, pl.LazyFrame)
+    expected = pl.read_parquet(parquet_path)
+    assert_frame_equal(actual.collect(), expected)
+    assert_frame_equal(actual.filter(atomic_number=26).collect(), expected.filter(atomic_number=26))
+
+
+def test_scan_shared_table(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    shared = pl.DataFrame({"atomic_number": [1, 2, 3]})
+    monkeypatch.setitem(_loading._SHARED_TABLES, "shared", shared)  # noqa: SLF001
+    absent = tmp_path / "absent"
+    actual = scan_table("shared", absent, absent, ["atomic_number"])
+    assert_frame_equal(actual.collect(), shared)
+    assert_frame_equal(read_table("shared", absent, absent), shared)
+
+
+def test_scan_elements_and_nuclides() -> None:
+    elements = scan_elements()
+    nuclides = scan_nuclides()
+    assert_frame_equal(elements.collect(), pl.read_parquet(ELEMENTS_PARQUET))
+    assert_frame_equal(nuclides.collect(), pl.read_parquet(NUCLIDES_PARQUET))
+    joined = (
+        nuclides.filter(atomic_number=1)
+        .join(elements.select("atomic_number", "symbol"), on="atomic_number")
+        .collect()
+    )
+    assert joined["symbol"].unique().to_list() == ["H"]
+
+
+@pytest.fixture
+def cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[Path]:
+    monkeypatch.setenv(CACHE_DIR_VARIABLE, str(tmp_path))
+    cache_directory.cache_clear()
+    yield tmp_path
+    cache_directory.cache_clear()
+
+
+def _fail() -> object:
+    pytest.fail("The value should be loaded from the cache")
+
+
+def test_cache_is_disabled_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(CACHE_DIR_VARIABLE, raising=False)
+    cache_directory.cache_clear()
+    try:
+        assert cache_directory() is None
+        assert cached_json("value", lambda: 1) == 1
+        assert cached_json("value", lambda: 2) == 2
+    finally:
+        cache_directory.cache_clear()
+
+
+def test_cache_directory_is_versioned(cache_dir: Path) -> None:
+    directory = cache_directory()
+    assert directory is not None
+    assert directory.parent == cache_dir
+    version, digest = directory.name.rsplit("-", 1)
+    assert version
+    assert len(digest) == 16
+
+
+def test_cached_arrays(cache_dir: Path) -> None:
+    expected = (np.arange(3, dtype=np.int32), np.array([0.5, 1.5]))
+    assert cached_arrays("arrays", lambda: expected) is expected
+    actual = cached_arrays("arrays", _fail)  # type: ignore[arg-type]
+    assert len(actual) == 2
+    for a, e in zip(actual, expected, strict=True):
+        assert isinstance(a, np.memmap)
+        assert not a.flags.writeable
+        assert a.dtype == e.dtype
+        assert_array_equal(a, e)
+    assert not list(cache_dir.rglob(".*")), "temporary files should be removed"
+
+
+def test_cached_frame(cache_dir: Path) -> None:  # noqa: ARG001
+    expected = pl.DataFrame({"x": [1, 2], "y": ["a", "b"]})
+    assert cached_frame("frame", lambda: expected) is expected
+    assert_frame_equal(cached_frame("frame", _fail), expected)  # type: ignore[arg-type]
+
+
+def test_cached_json(cache_dir: Path) -> None:  # noqa: ARG001
+    assert cached_json("symbols", lambda: {"H": 1}) == {"H": 1}
+    assert cached_json("symbols", _fail) == {"H": 1}
+
+
+def test_unwritable_cache_is_ignored(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    monkeypatch.setenv(CACHE_DIR_VARIABLE, str(blocker))
+    cache_directory.cache_clear()
+    try:
+        assert cached_json("value", lambda: 1) == 1
+        assert cached_json("value", lambda: 2) == 2
+    finally:
+        cache_directory.cache_clear()
+
+
+@pytest.mark.usefixtures("cache_dir")
+def test_derived_structures_are_reused() -> None:
+    derived = [
+        abundance._molar_mass_table,  # noqa: SLF001
+        _natural.natural_isotopes_index,
+        elements._symbol_to_z,  # noqa: SLF001
+        elements._z_to_row,  # noqa: SLF001
+        nuclides._zas_to_row,  # noqa: SLF001
+    ]
+    computed = [f.__wrapped__() for f in derived]
+    loaded = [f.__wrapped__() for f in derived]
+    assert_frame_equal(loaded[0], computed[0])
+    for a, e in zip(loaded[1], computed[1], strict=True):
+        assert_array_equal(a, e)
+    assert loaded[2] == computed[2]
+    assert_array_equal(loaded[3], computed[3])
+    assert_array_equal(loaded[4], computed[4])
+    assert isinstance(loaded[4], np.memmap)
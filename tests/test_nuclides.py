@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import numpy as np
+import polars as pl
 import pytest
 
+from numpy.testing import assert_array_equal
+
+from mckit_nuclides._indexing import NO_ROW, lowest_last_key, make_dense_index
 from mckit_nuclides.elements import atomic_mass
-from mckit_nuclides.nuclides import NUCLIDES_TABLE_PL, get_nuclide_mass
+from mckit_nuclides.nuclides import (
+    NUCLIDES_TABLE_PL,
+    get_nuclide_mass,
+    get_property,
+    get_property_many,
+)
 
 
 @pytest.mark.parametrize(
@@ -44,3 +54,107 @@ def test_get_nuclide_by_z_and_isotope(inp: tuple[int, int], msg: str) -> None:
 def test_get_nuclide_mass(element: int, mass_number: int, expected: float, msg: str) -> None:
     actual = get_nuclide_mass(element, mass_number)
     assert actual == pytest.approx(expected, rel=1e-4), msg
+
+
+@pytest.mark.parametrize(
+    "element,mass_number,column",
+    [
+        (1, 300, "molar_mass"),
+        (0, 1, "molar_mass"),
+        (-1, 1, "molar_mass"),
+        (1000, 1, "molar_mass"),
+        ("H", 1, "unknown"),
+        (26, 56.5, "molar_mass"),
+        (26, True, "molar_mass"),
+        (26.5, 56, "molar_mass"),
+    ],
+)
+def test_get_property_with_invalid_key(element: int | str, mass_number: int, column: str) -> None:
+    with pytest.raises(KeyError):
+        get_property(element, mass_number, column)
+
+
+@pytest.mark.parametrize("element, mass_number", [(26, 56.0), (26.0, 56), (np.int16(26), 56.0)])
+def test_get_property_with_integral_key(element: float, mass_number: float) -> None:
+    assert get_property(element, mass_number, "molar_mass") == get_property(26, 56, "molar_mass")
+    expected = get_property(26, 56, "half_life", state=0)
+    assert get_property(element, mass_number, "half_life", state=0.0) == expected
+
+
+def test_get_property_for_each_nuclide() -> None:
+    for row in NUCLIDES_TABLE_PL.iter_rows(named=True):
+        for column in ("molar_mass", "isotopic_composition", "half_life"):
+            actual = get_property(
+                row["atomic_number"], row["mass_number"], column, state=row["state"]
+            )
+            assert actual == row[column] or actual is row[column] is None
+
+
+def test_get_property_many() -> None:
+    table = NUCLIDES_TABLE_PL
+    for column in ("molar_mass", "isotopic_composition", "half_life"):
+        actual = get_property_many(
+            table["atomic_number"], table["mass_number"], column, states=table["state"]
+        )
+        assert_array_equal(actual, table[column].to_numpy())
+
+
+def test_get_property_many_for_lowest_states() -> None:
+    ground = NUCLIDES_TABLE_PL.filter(state=0)
+    actual = get_property_many(ground["atomic_number"], ground["mass_number"], "half_life")
+    assert_array_equal(actual, ground["half_life"].to_numpy())
+
+
+def test_get_property_many_broadcasts_keys() -> None:
+    actual = get_property_many("H", pl.Series([1, 2, 3]), "molar_mass")
+    assert_array_equal(actual, [get_nuclide_mass(1, a) for a in (1, 2, 3)])
+
+
+def test_get_property_many_with_missing_keys() -> None:
+    z, a = np.array([1, 1, 92, 0]), np.array([1, 300, 250, 1])
+    with pytest.raises(KeyError, match="300"):
+        get_property_many(z, a, "molar_mass")
+    actual = get_property_many(z, a, "molar_mass", missing="nan")
+    assert actual[0] == pytest.approx(1.00782503223)
+    assert np.isnan(actual[1:]).all()
+    masked = get_property_many(z, a, "molar_mass", missing="mask")
+    assert_array_equal(masked.mask, [False, True, True, True])
+
+
+def test_get_property_many_with_unknown_symbol() -> None:
+    with pytest.raises(KeyError, match="Xx"):
+        get_property_many(pl.Series(["H", "Xx"]), 1, "molar_mass")
+
+
+def test_get_property_many_with_unknown_column() -> None:
+    with pytest.raises(KeyError, match="unknown"):
+        get_property_many([1], [1], "unknown")
+
+
+def test_nuclides_are_unique() -> None:
+    keys = NUCLIDES_TABLE_PL.select("atomic_number", "mass_number", "state")
+    assert not keys.is_duplicated().any()
+
+
+def test_get_property_with_state() -> None:
+    half_life = get_property("Ta", 180, "half_life", state=1)
+    assert half_life > 1e22, "Ta-180m is practically stable"
+    assert get_property("Ta", 180, "half_life") < 1e5, "The ground state decays in hours"
+    with pytest.raises(KeyError):
+        get_property("Ta", 180, "half_life", state=3)
+    assert get_nuclide_mass("Ta", 180, 1) == get_nuclide_mass("Ta", 180)
+
+
+def test_get_property_many_with_states() -> None:
+    z, a = np.array([73, 73, 1]), np.array([180, 180, 1])
+    actual = get_property_many(z, a, "half_life", states=[1, 3, 0], missing="nan")
+    assert actual[0] == get_property(73, 180, "half_life", state=1)
+    assert np.isnan(actual[1])
+    assert actual[2] == 0.0
+    with pytest.raises(KeyError, match=r"\(73, 180, 3\)"):
+        get_property_many(z, a, "half_life", states=pl.Series([1, 3, 0]))
+
+
+def test_lowest_state_index() -> None:
+    index = make_dense_index(pl.Series([1, 1, 2, 3]), pl.Series([2, 1, 3, 0]))
+    assert_array_equal(lowest_last_key(index), [NO_ROW, 1, 2, 3])
@@ -1,13 +1,32 @@
-"""Test if installed package is of the current version."""
+"""Test the package as a whole: version, lazy loading and import time."""
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import os
 import re
+import subprocess
+import sys
 
 from pathlib import Path
 from re import sub as substitute
 
-from mckit_nuclides import __version__
+import pytest
+
+import mckit_nuclides
+
+from mckit_nuclides import __version__, abundance, elements, nuclides
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+IMPORT_TIME_BUDGET = 0.1
+"""Time to import the package after polars, relative to the time to import polars itself.
+
+Both imports are measured with compiled bytecode cached, so that the time
+of compilation of the package sources is not counted.
+"""
 
 
 def _find_version_from_project_toml() -> str:
@@ -33,3 +52,51 @@ def test_package() -> None:
     """Check if only current version is installed in working environment."""
     version = _find_version_from_project_toml()
     assert __version__ == _normalize_version(version), "Run 'uv sync'"
+
+
+def _run_python(code: str, env: dict[str, str] | None = None) -> str:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True, env=env
+    ).stdout
+
+
+def test_import_is_lazy() -> None:
+    """Check that importing the package neither loads tables nor reads metadata."""
+    code = """
+import mckit_nuclides
+from mckit_nuclides import abundance, elements, nuclides
+loaders = (
+    mckit_nuclides._metadata,
+    elements._elements_table,
+    nuclides._nuclides_table,
+    abundance._molar_mass_table,
+)
+print(sum(f.cache_info().currsize for f in loaders))
+print(len(mckit_nuclides.Z_TO_SYMBOL), mckit_nuclides.MOLAR_MASS_TABLE.height > 0)
+"""
+    assert _run_python(code).split() == ["0", "118", "True"]
+
+
+@pytest.mark.slow
+def test_import_time_budget(tmp_path: Path) -> None:
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    env["PYTHONPYCACHEPREFIX"] = str(tmp_path)
+    code = """
+import time
+import numpy
+start = time.perf_counter()
+import polars
+middle = time.perf_counter()
+import mckit_nuclides
+print((time.perf_counter() - middle) / (middle - start))
+"""
+    _run_python(code, env)  # warm up the bytecode cache
+    best = min(float(_run_python(code, env)) for _ in range(3))
+    assert best < IMPORT_TIME_BUDGET, f"Import takes {best:.1%} of polars import time"
+
+
+@pytest.mark.parametrize("name", ["unknown", "__unknown__"])
+@pytest.mark.parametrize("module", [mckit_nuclides, abundance, elements, nuclides])
+def test_unknown_attribute(module: ModuleType, name: str) -> None:
+    with pytest.raises(AttributeError, match=name):
+        getattr(module, name)
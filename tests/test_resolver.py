@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import pickle
+
+import pytest
+
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from mckit_nuclides.composition import Composition
+from mckit_nuclides.resolver import resolve_material, resolve_materials
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "H2O",
+        Composition([1, 8], [0, 0], [2.0, 1.0]),
+        {"H": 2.0, "O": 1.0},
+        {1000: 2.0, 8000: 1.0},
+        [(1, 0, 2.0), (8, 0, 1.0)],
+        iter([(8, 0, 1.0), (1, 0, 2.0)]),
+    ],
+)
+def test_resolve_material(spec: object) -> None:
+    expected = Composition.from_formula("H2O").expand_natural()
+    actual = resolve_material(spec)  # type: ignore[arg-type]
+    assert not actual.mass_fraction
+    assert_array_equal(actual.za, expected.za)
+    assert_array_almost_equal(actual.fractions, expected.fractions)
+
+
+def test_resolve_nuclide_identifiers() -> None:
+    actual = resolve_material({"B-10": 1.0, "b11": 3.0, "6012.31c": 1.0}, mass_fraction=True)
+    assert actual.mass_fraction
+    assert_array_equal(actual.za, [5010, 5011, 6012])
+    assert_array_almost_equal(actual.fractions, [0.2, 0.6, 0.2])
+
+
+@pytest.mark.parametrize(
+    "spec, match",
+    [
+        ({"Xx": 1.0}, "Xx"),
+        ({"Am242m1": 1.0}, "Isomer"),
+        ({}, "empty mapping"),
+        ([], "empty sequence"),
+        (iter([]), "empty sequence"),
+        ([(1, 1004, 1.0)], "mass numbers in"),
+    ],
+)
+def test_resolve_bad_identifiers(spec: object, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        resolve_material(spec)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+@pytest.mark.parametrize("processes", [False, True])
+def test_resolve_materials_in_order(workers: int, *, processes: bool) -> None:
+    specs = [f"H{i}O" if i > 1 else "H2O2" for i in range(50)]
+    expected = [resolve_material(s) for s in specs]
+    actual = list(resolve_materials(specs, workers=workers, processes=processes, chunk_size=4))
+    assert actual == expected
+
+
+@pytest.mark.parametrize("cpu_count", [None, 2])
+def test_resolve_materials_with_default_workers(
+    monkeypatch: pytest.MonkeyPatch, cpu_count: int | None
+) -> None:
+    monkeypatch.setattr(os, "cpu_count", lambda: cpu_count)
+    specs = ["H2O", "CO2", "NaCl"]
+    assert list(resolve_materials(specs)) == [resolve_material(s) for s in specs]
+
+
+def test_resolve_materials_consumes_specs_lazily() -> None:
+    consumed = 0
+
+    def specs() -> object:
+        nonlocal consumed
+        while True:
+            consumed += 1
+            yield "H2O"
+
+    results = resolve_materials(specs(), workers=2, chunk_size=10)  # type: ignore[arg-type]
+    assert next(results).za[0] == 1001
+    results.close()  # type: ignore[attr-defined]
+    assert consumed <= 10 * (2 * 2 + 1)
+
+
+def test_resolve_materials_raises_in_turn() -> None:
+    results = resolve_materials(["H2O", "Xx2O", "H2O"], workers=2, chunk_size=1)
+    assert len(next(results)) == 5
+    with pytest.raises(KeyError, match="Xx"):
+        next(results)
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(0, 1), (1, 0)])
+def test_resolve_materials_bad_arguments(workers: int, chunk_size: int) -> None:
+    with pytest.raises(ValueError, match="positive"):
+        resolve_materials([], workers=workers, chunk_size=chunk_size)
+
+
+def test_composition_pickle() -> None:
+    water = Composition.from_formula("H2O").to_mass()
+    actual = pickle.loads(pickle.dumps(water))  # noqa: S301
+    assert actual == water
+    assert actual.mass_fraction
+    assert not actual.fractions.flags.writeable
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import gc
+import multiprocessing
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+
+import numpy as np
+import pytest
+
+from polars.testing import assert_frame_equal
+
+from mckit_nuclides import _loading, abundance, elements, nuclides, shared
+from mckit_nuclides.shared import _attach, _open_block, attach_tables, publish_tables
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+def _address(values: np.ndarray) -> int:
+    return int(values.__array_interface__["data"][0])
+
+
+def _in_shared_memory(column: pl.Series) -> bool:
+    """Check if the column values reside in one of the attached shared memory blocks."""
+    address = _address(column.to_numpy())
+    for block in shared._ATTACHED_BLOCKS:  # noqa: SLF001
+        start = _address(np.frombuffer(block.buf, np.uint8))
+        if start <= address < start + block.size:
+            return True
+    return False
+
+
+_LOADERS = (elements._elements_table, nuclides._nuclides_table, abundance._molar_mass_table)  # noqa: SLF001
+
+
+def _inspect_worker() -> bool:
+    """Access the tables in a worker and check that they are used zero-copy."""
+    return all(
+        _in_shared_memory(column)
+        for column in (
+            nuclides.NUCLIDES_TABLE_PL["molar_mass"],
+            elements.ELEMENTS_TABLE_PL["molar_mass"],
+            abundance.MOLAR_MASS_TABLE["molar_mass"],
+        )
+    )
+
+
+@pytest.fixture
+def attached_tables():
+    """Attach the tables in this process, restore the loaded ones on exit."""
+    with publish_tables() as published:
+        attach_tables(published.specs)
+        for loader in _LOADERS:
+            loader.cache_clear()
+        try:
+            yield
+        finally:
+            _loading._SHARED_TABLES.clear()  # noqa: SLF001
+            for loader in _LOADERS:
+                loader.cache_clear()
+            gc.collect()
+            while shared._ATTACHED_BLOCKS:  # noqa: SLF001
+                shared._ATTACHED_BLOCKS.pop().close()  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    "name, table",
+    [
+        ("elements", lambda: elements.ELEMENTS_TABLE_PL),
+        ("nuclides", lambda: nuclides.NUCLIDES_TABLE_PL),
+        ("molar_masses", lambda: abundance.MOLAR_MASS_TABLE),
+    ],
+)
+def test_publish_and_attach_round_trip(name, table) -> None:
+    expected = table()
+    with publish_tables([name]) as published:
+        spec = published.specs[name]
+        attached = _open_block(spec.block)
+        try:
+            actual = _attach(attached, spec)
+            assert_frame_equal(actual, expected)
+            assert spec.arrays, "Numeric columns are expected to be shared zero-copy"
+            start = _address(np.frombuffer(attached.buf, np.uint8))
+            for column in spec.arrays:
+                assert _address(actual[column.name].to_numpy()) == start + column.offset
+                assert column.offset % 64 == 0
+            del actual
+        finally:
+            attached.close()
+
+
+@pytest.mark.usefixtures("attached_tables")
+def test_attach_tables_in_process() -> None:
+    assert _inspect_worker(), "The attached tables are expected to be used from shared memory"
+
+
+def test_publish_unknown_table() -> None:
+    with pytest.raises(KeyError, match="dummy"):
+        publish_tables(["dummy"])
+
+
+def test_publish_releases_blocks_on_error(monkeypatch) -> None:
+    blocks = []
+    publish = shared._publish  # noqa: SLF001
+
+    def publish_once(table):
+        if blocks:
+            raise MemoryError
+        block, spec = publish(table)
+        blocks.append(spec.block)
+        return block, spec
+
+    monkeypatch.setattr(shared, "_publish", publish_once)
+    with pytest.raises(MemoryError):
+        publish_tables(["elements", "nuclides"])
+    with pytest.raises(FileNotFoundError):
+        _open_block(blocks[0])
+
+
+def test_close_releases_blocks() -> None:
+    published = publish_tables(["elements"])
+    name = published.specs["elements"].block
+    published.close()
+    published.close()
+    with pytest.raises(FileNotFoundError):
+        _open_block(name)
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 13), reason="the blocks are opened untracked")
+def test_open_block_published_by_other_process(monkeypatch) -> None:
+    unregistered = []
+    with publish_tables(["elements"]) as published:
+        name = published.specs["elements"].block
+        with monkeypatch.context() as patch:
+            patch.setattr(resource_tracker, "unregister", lambda n, _: unregistered.append(n))
+            patch.setattr(shared, "_PUBLISHED_BLOCKS", set())
+            _open_block(name).close()
+    assert len(unregistered) == 1
+    assert unregistered[0].endswith(name)
+
+
+@pytest.mark.slow
+def test_process_pool_attaches_tables() -> None:
+    context = multiprocessing.get_context("spawn")
+    with (
+        publish_tables() as published,
+        ProcessPoolExecutor(
+            2, mp_context=context, initializer=attach_tables, initargs=(published.specs,)
+        ) as pool,
+    ):
+        results = [pool.submit(_inspect_worker).result() for _ in range(2)]
+    assert all(results), "The tables are expected to be used from shared memory in workers"
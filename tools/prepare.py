@@ -1,16 +1,46 @@
-"""Transform raw input data to parquet files to be used as resources in mckit-nuclides."""
+"""Transform raw input data to parquet and IPC files to be used as resources in mckit-nuclides.
+
+The build is incremental: the hashes of the sources and outputs of each table are stored
+in the manifest file, a table is rebuilt only if its sources (or this script) are changed,
+or its outputs are missing or modified.
+The outputs are written deterministically: the same sources produce the same bytes.
+
+Usage::
+
+    python tools/prepare.py [--force] [--check]
+"""
 
 from __future__ import annotations
 
-from typing import Any, Final
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+import argparse
+import hashlib
+import json
+import sys
 
 from collections import OrderedDict
 from pathlib import Path
 
 import polars as pl
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
 HERE = Path(__file__).parent
 OUT = HERE.parent / "src/mckit_nuclides/data"
+MANIFEST: Final = HERE / "data/manifest.json"
+"""Hashes of sources and outputs of the last build."""
+
+_ROW_GROUP_SIZE: Final = 1024
+"""Rows per parquet row group.
+
+The tables are sorted by keys, so, row group statistics on atomic_number
+allow to skip most of row groups on lookups by Z with :func:`polars.scan_parquet`.
+"""
+
+_COMPRESSION_LEVEL: Final = 10
+"""Zstd level, fixed to keep outputs reproducible."""
 
 _ELEMENTS_SCHEMA: Final = OrderedDict(
     atomic_number=pl.UInt32,
@@ -35,16 +65,11 @@ _ELEMENTS_SCHEMA: Final = OrderedDict(
 )
 
 
-_TYPES: Final = {
-    "atomic_number": int,
-    "mass_number": int,
-    "relative_atomic_mass": float,
-    "isotopic_composition": float,
-}
-
-
-def _make_elements_table(elements_csv: Path) -> pl.DataFrame:
-    return pl.read_csv(elements_csv, schema=_ELEMENTS_SCHEMA).with_columns(
+def _make_elements_table(elements_csv: Path) -> pl.LazyFrame:
+    # The schema renames some columns, so, it's applied by position
+    return pl.scan_csv(
+        elements_csv, new_columns=list(_ELEMENTS_SCHEMA), schema_overrides=_ELEMENTS_SCHEMA
+    ).with_columns(
         pl.col("atomic_mass").alias("molar_mass"),
         pl.col("atomic_number").cast(pl.UInt8),  # read as UInt32 from the CSV - reduce memory size
         pl.col("period").cast(pl.UInt8),
@@ -52,80 +77,231 @@ def _make_elements_table(elements_csv: Path) -> pl.DataFrame:
     )
 
 
-def _split_line(_line: str) -> tuple[str, Any]:
-    _label, _value = map(str.strip, _line.split("="))  # type: str, str
-    _label = _label.lower().replace(" ", "_")
-    value_type = _TYPES.get(_label)
-    if value_type is not None:
-        if _value:
+_NIST_LABELS: Final = {
+    "Atomic Number": "atomic_number",
+    "Mass Number": "mass_number",
+    "Relative Atomic Mass": "relative_atomic_mass",
+    "Isotopic Composition": "isotopic_composition",
+}
+"""Labels of the used NIST file values to column names."""
+
+
+def _load_nist_file(path: Path) -> pl.DataFrame:
+    """Parse NIST file with records of "Label = value" lines, separated with empty lines.
+
+    Each record starts with "Atomic Number" line.
+    """
+    lines = pl.scan_csv(
+        path,
+        has_header=False,
+        separator="=",
+        comment_prefix="#",
+        quote_char=None,
+        new_columns=["label", "value"],
+        schema_overrides={"label": pl.String, "value": pl.String},
+    )
+    return (
+        lines.select(
+            pl.col("label").str.strip_chars().replace_strict(_NIST_LABELS, default=None),
             # drop uncertainties, so far, there's no use cases for them
-            _value = _value.split("(", 1)[0]
-            _value = value_type(_value)
-        else:
-            _value = value_type()
-    return _label, _value
-
-
-def _load_nist_file(path: Path) -> dict[str, list[Any]]:
-    collector: dict[str, list[Any]] = {
-        "atomic_number": [],
-        "atomic_symbol": [],
-        "mass_number": [],
-        "relative_atomic_mass": [],
-        "isotopic_composition": [],
-    }
-
-    with path.open(encoding="utf-8") as fid:
-        for line in fid.readlines():
-            _line = line.strip()
-            if _line and not _line.startswith("#"):
-                label, value = _split_line(_line)
-                dst = collector.get(label)
-                if dst is not None:
-                    dst.append(value)
-    return collector
-
-
-def _make_half_lives_table(half_lives_path: Path) -> pl.DataFrame:
-    return pl.read_csv(half_lives_path).with_columns(
-        pl.when(pl.col("m").eq("M")).then(1).otherwise(0).cast(pl.UInt8).alias("state")
+            pl.col("value").str.strip_chars().str.replace(r"\(.*$", ""),
+        )
+        .drop_nulls("label")
+        .with_columns((pl.col("label") == "atomic_number").cum_sum().alias("record"))
+        .collect()
+        .pivot("label", index="record", values="value")
+        .select(
+            pl.col("atomic_number").cast(pl.UInt8),
+            pl.col("mass_number").cast(pl.UInt16),
+            pl.col("relative_atomic_mass").cast(pl.Float64).cast(pl.Float32).alias("molar_mass"),
+            pl.col("isotopic_composition").cast(pl.Float64).fill_null(0.0).cast(pl.Float32),
+        )
+    )
+
+
+_ISOMER_STATES: Final = {"M": 1, "N": 2, "O": 3}
+"""Markers of isomer states in half-lives.csv, ground states are not marked."""
+
+
+def _make_half_lives_table(half_lives_path: Path) -> pl.LazyFrame:
+    return pl.scan_csv(half_lives_path).select(
+        pl.col("z").cast(pl.UInt8).alias("atomic_number"),
+        pl.col("a").cast(pl.UInt16).alias("mass_number"),
+        pl.col("m")
+        .str.strip_chars()
+        .replace_strict(_ISOMER_STATES, default=0, return_dtype=pl.UInt8)
+        .alias("state"),
+        "half_life",
     )
 
 
-def _make_nist_table(half_lives: pl.DataFrame, nist_file_path: Path) -> pl.DataFrame:
-    collector = _load_nist_file(nist_file_path)
-    symbols = ["H" if x in {"D", "T"} else x for x in collector["atomic_symbol"]]
-    collector["atomic_symbol"] = symbols
+_NATURAL_ISOMERS: Final = {(73, 180): 1}
+"""Nuclides present in nature in isomer state: Ta-180 is observable in the first isomer state."""
+
+
+def _make_nuclides_table(half_lives_path: Path, nist_file_path: Path) -> pl.LazyFrame:
+    """Collect the ground states from NIST file and all the states with known half-lives.
+
+    There's no excitation energies in the sources, the isomers get the ground state masses.
+    The states without ground state in NIST file (the neutron only) are dropped.
+    """
+    nist = _load_nist_file(nist_file_path).lazy()
+    states = _make_half_lives_table(half_lives_path).filter(pl.col("atomic_number") > 0)
+    natural_states = pl.LazyFrame(
+        [(z, a, state) for (z, a), state in _NATURAL_ISOMERS.items()],
+        schema={"atomic_number": pl.UInt8, "mass_number": pl.UInt16, "natural_state": pl.UInt8},
+        orient="row",
+    )
+    keys = pl.concat(
+        [
+            nist.select("atomic_number", "mass_number", state=pl.lit(0, dtype=pl.UInt8)),
+            states.select("atomic_number", "mass_number", "state"),
+        ]
+    ).unique()
     return (
-        pl.DataFrame(collector)
-        # Augment with information on state, correct for Ta180 - it's observable in modified state
+        keys.join(nist, on=["atomic_number", "mass_number"])
+        .join(states, on=["atomic_number", "mass_number", "state"], how="left")
+        .join(natural_states, on=["atomic_number", "mass_number"], how="left")
         .with_columns(
-            pl.when(pl.col("atomic_number").eq(73) & pl.col("mass_number").eq(180))
-            .then(1)
-            .otherwise(0)
-            .cast(pl.UInt8)
-            .alias("state")
-        )
-        .join(
-            half_lives,
-            left_on=("atomic_number", "mass_number", "state"),
-            right_on=["z", "a", "state"],
-            how="left",
+            pl.when(pl.col("state") == pl.col("natural_state").fill_null(0))
+            .then(pl.col("isotopic_composition"))
+            .otherwise(pl.lit(0.0, dtype=pl.Float32))
+            .alias("isotopic_composition")
         )
         .select(
-            pl.col("atomic_number").cast(pl.UInt8),
-            pl.col("mass_number").cast(pl.UInt16),
-            pl.col("state").cast(pl.UInt8),
-            pl.col("relative_atomic_mass").cast(pl.Float32).alias("molar_mass"),
-            pl.col("isotopic_composition").cast(pl.Float32),
-            pl.col("half_life"),
+            "atomic_number",
+            "mass_number",
+            "state",
+            "molar_mass",
+            "isotopic_composition",
+            "half_life",
         )
     )
 
 
+class _Table(NamedTuple):
+    """Build rule of a table."""
+
+    name: str
+    sources: tuple[Path, ...]
+    make: Callable[..., pl.LazyFrame]
+    """Creates the table from the sources."""
+    sort_by: tuple[str, ...]
+    """The table keys, the rows are sorted by them."""
+
+
+_DATA = HERE / "data"
+
+TABLES: Final = (
+    _Table("elements", (_DATA / "elements.csv",), _make_elements_table, ("atomic_number",)),
+    _Table(
+        "nuclides",
+        (_DATA / "half-lives.csv", _DATA / "nist_atomic_weights_and_element_compositions.txt"),
+        _make_nuclides_table,
+        ("atomic_number", "mass_number", "state"),
+    ),
+)
+
+
+def _outputs(name: str) -> tuple[Path, Path]:
+    return OUT / f"{name}.parquet", OUT / f"{name}.arrow"
+
+
+def _hash_file(path: Path) -> str:
+    with path.open("rb") as fid:
+        return hashlib.file_digest(fid, "sha256").hexdigest()
+
+
+def _hash_sources(sources: Sequence[Path]) -> str:
+    """Hash the sources together with this script, which defines the transformation."""
+    digest = hashlib.sha256()
+    for path in (Path(__file__), *sources):
+        digest.update(_hash_file(path).encode())
+    return digest.hexdigest()
+
+
+def _is_up_to_date(table: _Table, entry: dict[str, str] | None, sources_hash: str) -> bool:
+    if entry is None or entry.get("sources") != sources_hash:
+        return False
+    return all(
+        path.exists() and entry.get(path.name) == _hash_file(path) for path in _outputs(table.name)
+    )
+
+
+def _write_table(table: pl.DataFrame, name: str, sort_by: Sequence[str]) -> None:
+    """Write the table as Parquet and uncompressed Arrow IPC, which can be memory-mapped.
+
+    The rows are sorted by the keys, the parquet file is written in small row groups
+    with statistics and the keys in the metadata.
+    """
+    table = table.sort(sort_by).set_sorted(sort_by[0])
+    parquet, ipc = _outputs(name)
+    table.write_parquet(
+        parquet,
+        compression="zstd",
+        compression_level=_COMPRESSION_LEVEL,
+        statistics=True,
+        row_group_size=_ROW_GROUP_SIZE,
+        metadata={"sorted_by": ",".join(sort_by)},
+    )
+    table.write_ipc(ipc, compression="uncompressed")
+
+
+def _load_manifest() -> dict[str, dict[str, str]]:
+    if MANIFEST.exists():
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    return {}
+
+
+def _save_manifest(manifest: dict[str, dict[str, str]]) -> None:
+    MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def build(*, force: bool = False, check: bool = False) -> list[str]:
+    """Rebuild the tables with changed sources or outputs.
+
+    Args:
+        force: rebuild all the tables
+        check: don't write anything, only report the outdated tables
+
+    Returns
+    -------
+        Names of the rebuilt (or outdated, on check) tables.
+    """
+    manifest = _load_manifest()
+    changed = []
+    for table in TABLES:
+        sources_hash = _hash_sources(table.sources)
+        if not force and _is_up_to_date(table, manifest.get(table.name), sources_hash):
+            continue
+        changed.append(table.name)
+        if check:
+            continue
+        _write_table(table.make(*table.sources).collect(), table.name, table.sort_by)
+        manifest[table.name] = {
+            "sources": sources_hash,
+            **{path.name: _hash_file(path) for path in _outputs(table.name)},
+        }
+    if changed and not check:
+        _save_manifest(manifest)
+    return changed
+
+
+def _main(args: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="rebuild all the tables")
+    parser.add_argument(
+        "--check", action="store_true", help="exit with error, if there are outdated tables"
+    )
+    options = parser.parse_args(args)
+    changed = build(force=options.force, check=options.check)
+    if options.check:
+        if changed:
+            print("Outdated:", ", ".join(changed))
+        return int(bool(changed))
+    print("Rebuilt:", ", ".join(changed) or "nothing")
+    return 0
+
+
 if __name__ == "__main__":
-    _make_elements_table(HERE / "data/elements.csv").write_parquet(OUT / "elements.parquet")
-    _make_nist_table(
-        _make_half_lives_table(HERE / "data/half-lives.csv"),
-        HERE / "data/nist_atomic_weights_and_element_compositions.txt",
-    ).write_parquet(OUT / "nuclides.parquet")
+    sys.exit(_main())